@@ -0,0 +1,14 @@
+"""
+Real-time trade analytics for Axiom Trade API
+"""
+
+from .devs import DevIndex, DevReputation
+from .enrichment import EnrichedToken, SourceStats, TokenEnricher
+from .indicators import IndicatorEngine
+from .registry import TokenRecord, TokenRegistry
+from .trades import NUMPY_AVAILABLE, TradeBook, TradeRing, TradeTotals, WindowStats
+
+__all__ = ['TradeBook', 'TradeRing', 'TradeTotals', 'WindowStats', 'NUMPY_AVAILABLE',
+           'IndicatorEngine', 'TokenRegistry', 'TokenRecord',
+           'TokenEnricher', 'EnrichedToken', 'SourceStats',
+           'DevIndex', 'DevReputation']
@@ -0,0 +1,318 @@
+"""
+Persistent developer reputation index
+Caches each deployer's dev-tokens-v2 history in SQLite and keeps precomputed features in memory
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from axiomtradeapi import models
+from axiomtradeapi.analytics.registry import new_pair_content
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tokens (
+    dev TEXT NOT NULL, token TEXT NOT NULL, created_ms INTEGER,
+    market_cap REAL, lifetime REAL, rugged INTEGER, migrated INTEGER,
+    PRIMARY KEY (dev, token)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS devs (
+    dev TEXT PRIMARY KEY, reported_count INTEGER, fetched_at REAL
+) WITHOUT ROWID;
+"""
+
+# dev-tokens-v2 token entries are not formally documented; the first key present wins
+_TOKEN_KEYS = ("tokenAddress", "token_address", "pairAddress", "pair_address")
+_CREATED_KEYS = ("createdAt", "created_at", "pairCreatedAt")
+_LAST_ACTIVE_KEYS = ("lastTradeTime", "lastTransactionTime", "updatedAt", "updated_at")
+_MARKET_CAP_KEYS = ("athMarketCapSol", "marketCapSol", "marketCap", "market_cap_sol", "market_cap")
+_RUGGED_KEYS = ("rugged", "isRugged", "rug")
+_MIGRATED_KEYS = ("migrated", "isMigrated", "graduated")
+_LIQUIDITY_KEYS = ("liquiditySol", "liquidity_sol")
+_TOTAL_COUNT_KEYS = ("totalCount", "total", "tokenCount")
+
+
+def _first(data: Any, keys: Tuple[str, ...]) -> Any:
+    for key in keys:
+        value = data.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def _epoch_ms(value: Any) -> Optional[int]:
+    parsed = models.parse_timestamp(value)
+    return int(parsed.timestamp() * 1000) if parsed is not None else None
+
+
+class DevReputation:
+    """Precomputed reputation features of one deployer"""
+
+    __slots__ = (
+        "dev_address", "token_count", "known_tokens", "rated", "rugged", "migrated",
+        "avg_lifetime", "best_market_cap", "last_launch", "fetched_at",
+    )
+
+    def __init__(self, dev_address: str):
+        self.dev_address = dev_address
+        self.token_count = 0  # tokens launched (history plus launches seen since)
+        self.known_tokens = 0  # tokens stored in the history
+        self.rated = 0  # tokens whose rug status is known
+        self.rugged = 0
+        self.migrated = 0
+        self.avg_lifetime: Optional[float] = None  # seconds
+        self.best_market_cap: Optional[float] = None
+        self.last_launch: Optional[int] = None  # epoch ms
+        self.fetched_at: Optional[float] = None  # time.time() of the last dev-tokens-v2 fetch
+
+    @property
+    def rug_ratio(self) -> Optional[float]:
+        return self.rugged / self.rated if self.rated else None
+
+    @property
+    def migration_ratio(self) -> Optional[float]:
+        return self.migrated / self.known_tokens if self.known_tokens else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values["rug_ratio"] = self.rug_ratio
+        values["migration_ratio"] = self.migration_ratio
+        return values
+
+    def __repr__(self) -> str:
+        return (
+            f"DevReputation({self.dev_address!r}, tokens={self.token_count}, "
+            f"rug_ratio={self.rug_ratio}, best_market_cap={self.best_market_cap})"
+        )
+
+
+class DevIndex:
+    """
+    Deployer reputation index backed by SQLite
+
+    ``ingest`` stores a ``get_dev_tokens`` (dev-tokens-v2) response per
+    token and recomputes the deployer's features: token count, rug ratio,
+    migration ratio, average lifetime, best market cap and last launch.
+    Features of every known deployer are kept in memory, so ``lookup``
+    is a dict access; ``get`` only calls the API for unknown or stale
+    deployers. ``on_new_pair`` adds launches incrementally without a
+    refetch. A token is considered rugged when the response says so or,
+    failing that, when its SOL liquidity is below ``rug_liquidity_sol``
+    and it did not migrate.
+
+    Example:
+        >>> index = DevIndex("devs.sqlite", client=client)
+        >>> await ws.subscribe_new_tokens(index.on_new_pair)
+        >>> index.lookup(new_pair.deployer_address).rug_ratio
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        client=None,
+        max_age: Optional[float] = 24 * 3600,
+        rug_liquidity_sol: float = 1.0,
+    ):
+        """
+        Args:
+            path: SQLite file (created if missing; in-memory by default)
+            client: ``AxiomTradeClient`` used by ``get`` and ``refresh``
+            max_age: Seconds before a deployer's history is refetched by ``get`` (None never)
+            rug_liquidity_sol: Liquidity below which a non-migrated token counts as rugged
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.client = client
+        self.max_age = max_age
+        self.rug_liquidity_sol = rug_liquidity_sol
+
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._devs: Dict[str, DevReputation] = {}
+        self._load()
+
+    # Features
+
+    def _load(self) -> None:
+        devs = [row[0] for row in self._db.execute("SELECT dev FROM devs UNION SELECT DISTINCT dev FROM tokens")]
+        for dev in devs:
+            self._recompute(dev)
+
+    def _recompute(self, dev: str) -> DevReputation:
+        known, rated, rugged, migrated, avg_lifetime, best, last = self._db.execute(
+            "SELECT COUNT(*), COUNT(rugged), COALESCE(SUM(rugged), 0), COALESCE(SUM(migrated), 0), "
+            "AVG(lifetime), MAX(market_cap), MAX(created_ms) FROM tokens WHERE dev=?",
+            (dev,),
+        ).fetchone()
+        row = self._db.execute("SELECT reported_count, fetched_at FROM devs WHERE dev=?", (dev,)).fetchone()
+        reported, fetched_at = row if row is not None else (None, None)
+
+        reputation = DevReputation(dev)
+        reputation.known_tokens = known
+        reputation.token_count = max(known, reported or 0)
+        reputation.rated = rated
+        reputation.rugged = rugged
+        reputation.migrated = migrated
+        reputation.avg_lifetime = avg_lifetime
+        reputation.best_market_cap = best
+        reputation.last_launch = last
+        reputation.fetched_at = fetched_at
+        self._devs[dev] = reputation
+        return reputation
+
+    def _token_row(self, dev: str, token: Any) -> Optional[tuple]:
+        address = _first(token, _TOKEN_KEYS)
+        if not address:
+            return None
+        created = _epoch_ms(_first(token, _CREATED_KEYS))
+        last_active = _epoch_ms(_first(token, _LAST_ACTIVE_KEYS))
+        lifetime = (last_active - created) / 1000 if created is not None and last_active is not None else None
+        migrated = _first(token, _MIGRATED_KEYS)
+        rugged = _first(token, _RUGGED_KEYS)
+        if rugged is None:
+            liquidity = _first(token, _LIQUIDITY_KEYS)
+            if liquidity is not None:
+                rugged = not migrated and float(liquidity) < self.rug_liquidity_sol
+        market_cap = _first(token, _MARKET_CAP_KEYS)
+        return (
+            dev,
+            address,
+            created,
+            float(market_cap) if market_cap is not None else None,
+            lifetime if lifetime is None or lifetime >= 0 else None,
+            None if rugged is None else int(bool(rugged)),
+            int(bool(migrated)),
+        )
+
+    # Updates
+
+    def ingest(self, dev_address: str, response: Any) -> DevReputation:
+        """
+        Store a ``get_dev_tokens`` response and recompute the deployer's features
+
+        Args:
+            dev_address: Deployer the response belongs to
+            response: ``{"tokens": [...], "counts": {...}}`` (or a bare token list)
+        """
+        tokens = response if isinstance(response, list) else (response.get("tokens") or [])
+        counts = response.get("counts") if hasattr(response, "get") else None
+        reported = _first(counts, _TOTAL_COUNT_KEYS) if hasattr(counts, "get") else None
+        rows = [row for row in (self._token_row(dev_address, token) for token in tokens) if row is not None]
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany("INSERT OR REPLACE INTO tokens VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO devs VALUES (?, ?, ?)",
+                    (dev_address, int(reported) if reported is not None else None, time.time()),
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+            return self._recompute(dev_address)
+
+    def record_launch(self, dev_address: str, token_address: str, created_at: Any = None) -> DevReputation:
+        """Add a newly launched token to a deployer's history (no API call)"""
+        created = _epoch_ms(created_at) if created_at is not None else int(time.time() * 1000)
+        with self._lock:
+            inserted = self._db.execute(
+                "INSERT OR IGNORE INTO tokens (dev, token, created_ms, migrated) VALUES (?, ?, ?, 0)",
+                (dev_address, token_address, created),
+            ).rowcount
+            if inserted:
+                # Keep the API's total (which may include tokens not listed) in step
+                self._db.execute(
+                    "UPDATE devs SET reported_count = reported_count + 1 WHERE dev=? AND reported_count IS NOT NULL",
+                    (dev_address,),
+                )
+            return self._recompute(dev_address)
+
+    def on_new_pair(self, data: Any) -> Optional[DevReputation]:
+        """
+        ``subscribe_new_tokens`` callback: records the launch
+
+        Returns:
+            The deployer's features as they were before this launch (None if unknown)
+        """
+        content = new_pair_content(data)
+        if not content or not hasattr(content, "items"):
+            return None
+        dev_address = content.get("deployer_address")
+        token_address = content.get("token_address") or content.get("pair_address")
+        if not dev_address or not token_address:
+            return None
+        before = self._devs.get(dev_address)
+        self.record_launch(dev_address, token_address, content.get("created_at"))
+        return before
+
+    # Lookups
+
+    def lookup(self, dev_address: str) -> Optional[DevReputation]:
+        """Features of a deployer from memory (None if never seen)"""
+        return self._devs.get(dev_address)
+
+    def stale(self, dev_address: str, now: Optional[float] = None) -> bool:
+        """True if the deployer's history was never fetched or is older than ``max_age``"""
+        reputation = self._devs.get(dev_address)
+        if reputation is None or reputation.fetched_at is None:
+            return True
+        if self.max_age is None:
+            return False
+        return (time.time() if now is None else now) - reputation.fetched_at > self.max_age
+
+    def refresh(self, dev_address: str) -> DevReputation:
+        """Fetch a deployer's dev-tokens-v2 history and ingest it"""
+        if self.client is None:
+            raise ValueError("DevIndex has no client to fetch dev tokens with")
+        limiter = getattr(self.client, "rate_limiter", None)
+        if limiter is not None:
+            limiter.acquire()
+        return self.ingest(dev_address, self.client.get_dev_tokens(dev_address))
+
+    def get(self, dev_address: str, refresh: bool = False) -> DevReputation:
+        """Features of a deployer, fetching its history when unknown or stale"""
+        if refresh or self.stale(dev_address):
+            return self.refresh(dev_address)
+        return self._devs[dev_address]
+
+    def enrichment_source(self) -> Tuple[Tuple[str, ...], Any]:
+        """``TokenEnricher`` source that answers ``dev_tokens`` from this index"""
+        return ("deployer_address",), lambda client, token: self.get(token.deployer_address)
+
+    def tokens(self, dev_address: str) -> List[Dict[str, Any]]:
+        """Stored history of a deployer, oldest first"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT token, created_ms, market_cap, lifetime, rugged, migrated FROM tokens "
+                "WHERE dev=? ORDER BY created_ms",
+                (dev_address,),
+            ).fetchall()
+        names = ("token_address", "created_ms", "market_cap", "lifetime", "rugged", "migrated")
+        return [dict(zip(names, row)) for row in rows]
+
+    def devs(self) -> List[str]:
+        return list(self._devs)
+
+    def __contains__(self, dev_address: str) -> bool:
+        return dev_address in self._devs
+
+    def __len__(self) -> int:
+        return len(self._devs)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "DevIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,414 @@
+"""
+Concurrent enrichment of new tokens
+Fires the per-token REST lookups in parallel under one deadline and returns whatever finished in time
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from axiomtradeapi.analytics.registry import new_pair_content
+
+SourceCall = Callable[[Any, "EnrichedToken"], Any]
+
+
+def twitter_handle(value: Optional[str]) -> Optional[str]:
+    """Handle from a twitter/x.com profile URL or ``@handle`` (None for tweets and communities)"""
+    if not value:
+        return None
+    if "/" not in value:
+        return value.lstrip("@") or None
+    parsed = urlparse(value if "//" in value else "https://" + value)
+    parts = [part for part in parsed.path.split("/") if part]
+    if len(parts) != 1 or parts[0] in ("i", "home", "search", "intent"):
+        return None
+    return parts[0].lstrip("@")
+
+
+# Source name -> (token fields it needs, call); in priority order
+DEFAULT_SOURCES: "OrderedDict[str, Tuple[Tuple[str, ...], SourceCall]]" = OrderedDict(
+    [
+        ("pair_info", (("pair_address",), lambda client, token: client.get_pair_info(token.pair_address))),
+        ("pair_stats", (("pair_address",), lambda client, token: client.get_pair_stats(token.pair_address))),
+        ("holders", (("pair_address",), lambda client, token: client.get_holder_data(token.pair_address))),
+        ("dev_tokens", (("deployer_address",), lambda client, token: client.get_dev_tokens(token.deployer_address))),
+        (
+            "token_analysis",
+            (
+                ("deployer_address", "token_ticker"),
+                lambda client, token: client.get_token_analysis(token.deployer_address, token.token_ticker),
+            ),
+        ),
+        ("twitter_user", (("twitter_handle",), lambda client, token: client.get_twitter_user_info(token.twitter_handle))),
+    ]
+)
+
+
+@dataclass
+class EnrichedToken:
+    """A new token with whatever enrichment finished before the deadline"""
+
+    pair_address: Optional[str]
+    token_address: Optional[str] = None
+    deployer_address: Optional[str] = None
+    token_ticker: Optional[str] = None
+    twitter_handle: Optional[str] = None
+    new_pair: Any = None  # the new_pairs event content
+
+    pair_info: Any = None
+    pair_stats: Any = None
+    holders: Any = None
+    dev_tokens: Any = None
+    token_analysis: Any = None
+    twitter_user: Any = None
+    extra: Dict[str, Any] = field(default_factory=dict)  # results of custom sources
+
+    latency: Dict[str, float] = field(default_factory=dict)  # seconds per finished source
+    errors: Dict[str, str] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)  # sources that did not finish in time
+    skipped: List[str] = field(default_factory=list)  # sources without the inputs they need
+    elapsed: float = 0.0
+
+    @classmethod
+    def from_new_pair(cls, content: Any) -> "EnrichedToken":
+        get = content.get
+        return cls(
+            pair_address=get("pair_address"),
+            token_address=get("token_address"),
+            deployer_address=get("deployer_address"),
+            token_ticker=get("token_ticker"),
+            twitter_handle=twitter_handle(get("twitter")),
+            new_pair=content,
+        )
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing and not self.errors
+
+    def result(self, source: str) -> Any:
+        return getattr(self, source) if source in _RESULT_FIELDS else self.extra.get(source)
+
+    def _set(self, source: str, value: Any) -> None:
+        if source in _RESULT_FIELDS:
+            setattr(self, source, value)
+        else:
+            self.extra[source] = value
+
+
+_RESULT_FIELDS = frozenset(DEFAULT_SOURCES)
+
+
+@dataclass
+class SourceStats:
+    """Latency and outcome counters of one source"""
+
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0  # finished after the deadline or never started
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> Optional[float]:
+        return self.total_seconds / self.calls if self.calls else None
+
+
+class _Request:
+    __slots__ = ("token", "future", "deadline", "started", "pending", "done", "lock")
+
+    def __init__(self, token: EnrichedToken, deadline: float):
+        self.token = token
+        self.future: Future = Future()
+        self.deadline = deadline
+        self.started = time.monotonic()
+        self.pending: Dict[str, bool] = {}
+        self.done = False
+        self.lock = threading.Lock()
+
+
+class _FairQueue:
+    """Per-request job queues served round-robin, so one burst cannot starve later tokens"""
+
+    def __init__(self):
+        self._queues: "OrderedDict[int, Deque[tuple]]" = OrderedDict()
+        self._cond = threading.Condition()
+        self.closed = False
+
+    def put(self, key: int, jobs: List[tuple]) -> None:
+        with self._cond:
+            if self.closed:
+                return
+            self._queues[key] = deque(jobs)
+            self._cond.notify(len(jobs))
+
+    def get(self) -> Optional[tuple]:
+        with self._cond:
+            while not self._queues and not self.closed:
+                self._cond.wait()
+            if not self._queues:
+                return None
+            key, jobs = self._queues.popitem(last=False)
+            job = jobs.popleft()
+            if jobs:
+                self._queues[key] = jobs  # back of the line
+            return job
+
+    def __len__(self) -> int:
+        return sum(len(jobs) for jobs in self._queues.values())
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._queues.clear()
+            self._cond.notify_all()
+
+
+class TokenEnricher:
+    """
+    Enrichment stage for ``new_pairs`` events
+
+    Every source of a token is queued at once and served by a fixed pool
+    of worker threads (bounded global concurrency, under the client's
+    rate limiter). Queues are served round-robin per token, so during a
+    burst of launches each token gets its high-priority sources first
+    instead of the first token hogging the pool. When the deadline hits,
+    the ``EnrichedToken`` is returned with whatever finished; unfinished
+    sources are listed in ``missing``. Per-source latency is recorded on
+    each token and aggregated in ``stats``.
+
+    Example:
+        >>> enricher = TokenEnricher(client, deadline=1.5, on_result=handle)
+        >>> await ws.subscribe_new_tokens(enricher.on_new_pair)
+    """
+
+    def __init__(
+        self,
+        client,
+        deadline: float = 2.0,
+        max_workers: int = 16,
+        sources: Optional[Dict[str, Tuple[Tuple[str, ...], SourceCall]]] = None,
+        registry=None,
+        on_result: Optional[Callable[[EnrichedToken], None]] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Args:
+            client: ``AxiomTradeClient`` used for the lookups
+            deadline: Seconds from submission until a token is returned
+            max_workers: Concurrent source calls across all tokens
+            sources: Source name -> ``(required token fields, call(client, token))``
+                     (``DEFAULT_SOURCES`` if None)
+            registry: ``TokenRegistry`` to merge new pairs, pair info and stats into
+            on_result: Called with every finished ``EnrichedToken``
+            logger: Logger for listener errors
+        """
+        self.client = client
+        self.deadline = deadline
+        self.max_workers = max_workers
+        self.sources = OrderedDict(DEFAULT_SOURCES if sources is None else sources)
+        self.registry = registry
+        self.on_result = on_result
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.stats: Dict[str, SourceStats] = {name: SourceStats() for name in self.sources}
+        self._stats_lock = threading.Lock()
+        self._queue = _FairQueue()
+        self._ids = itertools.count()
+        self._deadlines: List[Tuple[float, int, _Request]] = []
+        self._deadline_cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._start_lock = threading.Lock()
+
+    # Submission
+
+    def submit(self, content: Any, deadline: Optional[float] = None) -> "Future[EnrichedToken]":
+        """
+        Start enriching a new pair
+
+        Args:
+            content: ``new_pairs`` event content (dict or ``NewPair``)
+            deadline: Seconds to wait for sources (the enricher's default if None)
+
+        Returns:
+            Future resolved with the ``EnrichedToken`` when every source
+            finished or the deadline passed, whichever comes first
+
+        Raises:
+            RuntimeError: If the enricher is closed
+        """
+        if self._queue.closed:
+            raise RuntimeError("TokenEnricher is closed")
+        self._start()
+        token = EnrichedToken.from_new_pair(content)
+        if self.registry is not None:
+            self.registry.update(content)
+        request = _Request(token, time.monotonic() + (self.deadline if deadline is None else deadline))
+        key = next(self._ids)
+
+        jobs = []
+        for name, (requires, call) in self.sources.items():
+            if all(getattr(token, attr, None) for attr in requires):
+                request.pending[name] = True
+                jobs.append((request, name, call))
+            else:
+                token.skipped.append(name)
+        if not jobs:
+            self._finish(request)
+            return request.future
+
+        with self._deadline_cond:
+            closed = self._queue.closed
+            if not closed:
+                heapq.heappush(self._deadlines, (request.deadline, key, request))
+                self._deadline_cond.notify()
+        if closed:
+            # Closed while this token was being set up: return it without results
+            self._finish(request)
+            return request.future
+        self._queue.put(key, jobs)
+        return request.future
+
+    def enrich(self, content: Any, deadline: Optional[float] = None) -> EnrichedToken:
+        """Enrich a new pair and wait for the result"""
+        return self.submit(content, deadline).result()
+
+    async def enrich_async(self, content: Any, deadline: Optional[float] = None) -> EnrichedToken:
+        """Awaitable ``enrich`` for async callbacks"""
+        return await asyncio.wrap_future(self.submit(content, deadline))
+
+    def on_new_pair(self, data: Any) -> None:
+        """``subscribe_new_tokens`` callback: enrich in the background and pass the result to ``on_result``"""
+        content = new_pair_content(data)
+        if content and hasattr(content, "items") and not self._queue.closed:
+            self.submit(content)
+
+    # Workers
+
+    def _start(self) -> None:
+        if self._threads:
+            return
+        with self._start_lock:
+            if self._threads:
+                return
+            threads = [
+                threading.Thread(target=self._work, name=f"axiom-enrich-{i}", daemon=True)
+                for i in range(self.max_workers)
+            ]
+            threads.append(threading.Thread(target=self._watch_deadlines, name="axiom-enrich-deadline", daemon=True))
+            for thread in threads:
+                thread.start()
+            self._threads = threads
+
+    def _work(self) -> None:
+        limiter = getattr(self.client, "rate_limiter", None)
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            request, name, call = job
+            if request.done or time.monotonic() >= request.deadline:
+                continue  # already returned; counted as a timeout when it was finalized
+            if limiter is not None:
+                limiter.acquire()
+            started = time.monotonic()
+            error = None
+            try:
+                value = call(self.client, request.token)
+            except Exception as e:
+                value, error = None, str(e)
+            self._complete(request, name, value, error, time.monotonic() - started)
+
+    def _complete(self, request: _Request, name: str, value: Any, error: Optional[str], seconds: float) -> None:
+        with self._stats_lock:
+            stats = self.stats.setdefault(name, SourceStats())
+            stats.calls += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            if error is not None:
+                stats.errors += 1
+        with request.lock:
+            if request.done:
+                return  # returned without it; counted as a timeout then
+            token = request.token
+            request.pending.pop(name, None)
+            token.latency[name] = seconds
+            if error is not None:
+                token.errors[name] = error
+            else:
+                token._set(name, value)
+            finished = not request.pending
+        if finished:
+            self._finish(request)
+
+    def _watch_deadlines(self) -> None:
+        while not self._queue.closed:
+            with self._deadline_cond:
+                while not self._deadlines and not self._queue.closed:
+                    self._deadline_cond.wait()
+                if not self._deadlines:
+                    return
+                deadline, _, request = self._deadlines[0]
+                wait = deadline - time.monotonic()
+                if wait > 0:
+                    self._deadline_cond.wait(wait)
+                    continue
+                heapq.heappop(self._deadlines)
+            self._finish(request)
+
+    def _finish(self, request: _Request) -> None:
+        with request.lock:
+            if request.done:
+                return
+            request.done = True
+            token = request.token
+            token.missing = list(request.pending)
+            token.elapsed = time.monotonic() - request.started
+        if token.missing:
+            with self._stats_lock:
+                for name in token.missing:
+                    self.stats[name].timeouts += 1
+
+        if self.registry is not None:
+            for source in ("pair_info", "pair_stats"):
+                value = token.result(source)
+                if value is not None and hasattr(value, "items"):
+                    self.registry.update(value, pair_address=token.pair_address)
+        if self.on_result is not None:
+            try:
+                self.on_result(token)
+            except Exception as e:
+                self.logger.error(f"Enrichment listener failed: {e}")
+        request.future.set_result(token)
+
+    @property
+    def queued(self) -> int:
+        """Source calls waiting for a worker"""
+        return len(self._queue)
+
+    def close(self) -> None:
+        """
+        Stop the workers
+
+        Queued calls are dropped and every pending token is returned at
+        once with its unfinished sources in ``missing``.
+        """
+        with self._deadline_cond:
+            self._queue.close()
+            pending, self._deadlines = self._deadlines, []
+            self._deadline_cond.notify_all()
+        for _, _, request in sorted(pending, key=lambda item: item[:2]):
+            self._finish(request)
+
+    def __enter__(self) -> "TokenEnricher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,359 @@
+"""
+Vectorized rolling indicators for many pairs
+EMA, VWAP, volatility and momentum kept in aligned NumPy arrays and updated for every pair in one step
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from axiomtradeapi.analytics.trades import NUMPY_AVAILABLE, _require_numpy
+from axiomtradeapi.charts.fetcher import chart_bars
+from axiomtradeapi.charts.store import BarSeries, bars_to_columns
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+
+def _bar_columns(chart: Any) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """``(time, close, volume)`` of a chart result, bar list or ``BarSeries``"""
+    if isinstance(chart, BarSeries):
+        return chart.time, chart.close, chart.volume
+    time, _, _, _, close, volume = bars_to_columns(chart_bars(chart))
+    return time, close, volume
+
+
+class IndicatorEngine:
+    """
+    Rolling indicators for N pairs in aligned NumPy arrays
+
+    Every tracked pair owns one row of each state array. ``step`` advances
+    all pairs by one tick in a single vectorized pass; pairs without a new
+    price this tick carry their last price forward (with zero volume), so
+    every row stays on the same clock. Indicators per row:
+
+    - ``price``: last price
+    - ``ema_<span>``: exponential moving average for each span
+    - ``vwap``: exponentially weighted VWAP over ``vwap_span`` ticks
+    - ``volatility``: EW standard deviation of log returns per tick
+    - ``momentum``: log return over the last ``momentum_lookback`` ticks
+
+    Values are NaN until a row has enough ticks. Ticks come from chart
+    bars (``step_bars``/``replay``) or from trades accumulated with
+    ``record_trade``/``on_transaction`` and flushed by ``step()``.
+
+    Example:
+        >>> engine.replay({pair: client.get_pair_chart(pair) for pair in pairs})
+        >>> engine.top("momentum", k=10)
+    """
+
+    def __init__(
+        self,
+        ema_spans: Iterable[int] = (12, 26),
+        vwap_span: int = 20,
+        volatility_span: int = 20,
+        momentum_lookback: int = 10,
+        capacity: int = 1024,
+        currency: str = "USD",
+    ):
+        """
+        Args:
+            ema_spans: EMA lengths in ticks
+            vwap_span: Decay length of the VWAP in ticks
+            volatility_span: Decay length of the return variance in ticks
+            momentum_lookback: Ticks the momentum return spans
+            capacity: Pairs allocated up front (grows as needed)
+            currency: "USD" (price_usd/total_usd) or "SOL" (price_sol/total_sol) for trades
+        """
+        _require_numpy()
+        self.ema_spans = tuple(int(span) for span in ema_spans)
+        self.momentum_lookback = max(1, int(momentum_lookback))
+        self._ema_alpha = np.array([2.0 / (span + 1) for span in self.ema_spans])
+        self._vwap_decay = 1.0 - 2.0 / (vwap_span + 1)
+        self._var_decay = 1.0 - 2.0 / (volatility_span + 1)
+        self.currency = currency.upper()
+        self._price_key, self._volume_key = (
+            ("price_sol", "total_sol") if self.currency == "SOL" else ("price_usd", "total_usd")
+        )
+
+        self._pairs: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._arrays: Dict[str, "np.ndarray"] = {}
+        self._allocate(max(1, capacity))
+        self._pos = 0  # column of the momentum ring written next
+        self.ticks = 0
+        self._lock = threading.RLock()
+
+    # Rows
+
+    def _allocate(self, capacity: int) -> None:
+        shapes = {
+            "price": ((), np.float64),
+            "ema": ((len(self.ema_spans),), np.float64),
+            "pv": ((), np.float64),
+            "vv": ((), np.float64),
+            "var": ((), np.float64),
+            "momentum": ((), np.float64),
+            "history": ((self.momentum_lookback,), np.float64),  # log prices, one column per tick
+            "count": ((), np.int64),  # ticks since the row got its first price
+            # Trades recorded since the last step
+            "pending_price": ((), np.float64),
+            "pending_volume": ((), np.float64),
+            "pending": ((), np.bool_),
+        }
+        n = len(self._pairs)
+        for name, (shape, dtype) in shapes.items():
+            grown = np.zeros((capacity,) + shape, dtype)
+            if name in self._arrays:
+                grown[:n] = self._arrays[name][:n]
+            self._arrays[name] = grown
+
+    def track(self, pair_address: str) -> int:
+        """Give a pair a row (idempotent); returns the row index"""
+        with self._lock:
+            row = self._rows.get(pair_address)
+            if row is not None:
+                return row
+            row = len(self._pairs)
+            if row == len(self._arrays["price"]):
+                self._allocate(row * 2)
+            for array in self._arrays.values():
+                array[row] = 0
+            self._pairs.append(pair_address)
+            self._rows[pair_address] = row
+            return row
+
+    def untrack(self, pair_address: str) -> bool:
+        """Remove a pair; the last row moves into its place"""
+        with self._lock:
+            row = self._rows.pop(pair_address, None)
+            if row is None:
+                return False
+            last = len(self._pairs) - 1
+            if row != last:
+                for array in self._arrays.values():
+                    array[row] = array[last]
+                moved = self._pairs[last]
+                self._pairs[row] = moved
+                self._rows[moved] = row
+            self._pairs.pop()
+            return True
+
+    def pairs(self) -> List[str]:
+        """Tracked pairs in row order (aligned with ``column``)"""
+        return list(self._pairs)
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def __contains__(self, pair_address: str) -> bool:
+        return pair_address in self._rows
+
+    # Updates
+
+    def record_trade(self, pair_address: str, price: float, volume: float = 0.0) -> None:
+        """Accumulate a trade into the pair's next tick"""
+        with self._lock:
+            row = self.track(pair_address)
+            arrays = self._arrays
+            arrays["pending_price"][row] = price
+            arrays["pending_volume"][row] += volume
+            arrays["pending"][row] = True
+
+    def on_transaction(self, content: Any) -> None:
+        """Wallet-transaction callback (dict or ``WalletTransaction``) feeding ``record_trade``"""
+        pair_address = content.get("pair_address")
+        price = content.get(self._price_key)
+        if pair_address and price is not None:
+            self.record_trade(pair_address, float(price), float(content.get(self._volume_key) or 0.0))
+
+    def step(
+        self,
+        prices: Optional[Mapping[str, float]] = None,
+        volumes: Optional[Mapping[str, float]] = None,
+    ) -> int:
+        """
+        Advance every pair by one tick
+
+        Args:
+            prices: New price per pair (pairs are tracked on first sight);
+                    if None, trades recorded since the last step are used
+            volumes: Volume per pair for this tick
+
+        Returns:
+            int: Pairs that received a new price
+        """
+        with self._lock:
+            if prices is None:
+                arrays = self._arrays
+                n = len(self._pairs)
+                rows = np.flatnonzero(arrays["pending"][:n])
+                tick_prices = arrays["pending_price"][rows]
+                tick_volumes = arrays["pending_volume"][rows]
+                arrays["pending"][rows] = False
+                arrays["pending_volume"][rows] = 0.0
+            else:
+                rows = np.fromiter((self.track(pair) for pair in prices), np.int64, len(prices))
+                tick_prices = np.fromiter(prices.values(), np.float64, len(prices))
+                tick_volumes = (
+                    np.fromiter((volumes.get(pair, 0.0) for pair in prices), np.float64, len(prices))
+                    if volumes
+                    else None
+                )
+            self.step_rows(rows, tick_prices, tick_volumes)
+            return len(rows)
+
+    def step_rows(self, rows: "np.ndarray", prices: "np.ndarray", volumes: Optional["np.ndarray"] = None) -> None:
+        """Advance every pair by one tick, with new prices (and volumes) for ``rows``"""
+        with self._lock:
+            n = len(self._pairs)
+            a = {name: array[:n] for name, array in self._arrays.items()}
+            rows = np.asarray(rows, dtype=np.int64)
+            prices = np.asarray(prices, dtype=np.float64)
+            valid = prices > 0
+            rows, prices = rows[valid], prices[valid]
+            volume = np.zeros(n)
+            if volumes is not None:
+                volume[rows] = np.asarray(volumes, dtype=np.float64)[valid]
+
+            price = a["price"]
+            count = a["count"]
+            new = rows[count[rows] == 0]
+            last = price.copy()
+            price[rows] = prices
+            last[new] = price[new]
+            a["ema"][new] = price[new, None]
+            live = count > 0
+            live[new] = True
+            count[live] += 1
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                log_price = np.where(live, np.log(price), np.nan)
+                returns = np.where(live, log_price - np.log(last), 0.0)
+
+            ema = a["ema"]
+            ema[live] += self._ema_alpha * (price[live, None] - ema[live])
+
+            decay = self._vwap_decay
+            a["pv"][live] = decay * a["pv"][live] + price[live] * volume[live]
+            a["vv"][live] = decay * a["vv"][live] + volume[live]
+
+            decay = self._var_decay
+            a["var"][live] = decay * a["var"][live] + (1.0 - decay) * returns[live] ** 2
+
+            history = a["history"]
+            pos = self._pos
+            a["momentum"][:] = np.where(count > self.momentum_lookback, log_price - history[:, pos], np.nan)
+            history[:, pos] = log_price
+            self._pos = (pos + 1) % self.momentum_lookback
+            self.ticks += 1
+
+    def step_bars(self, charts: Mapping[str, Any]) -> int:
+        """
+        One tick from the newest bar of each pair's chart
+
+        Args:
+            charts: Pair address to a ``get_pair_chart`` result, bar list or ``BarSeries``
+        """
+        prices, volumes = {}, {}
+        for pair_address, chart in charts.items():
+            _, close, volume = _bar_columns(chart)
+            if len(close):
+                prices[pair_address] = float(close[-1])
+                volumes[pair_address] = float(volume[-1])
+        return self.step(prices, volumes)
+
+    def replay(self, charts: Mapping[str, Any]) -> int:
+        """
+        Feed bar history for many pairs, one tick per distinct bar time
+
+        Bars of every pair are merged by time so that all pairs stay on the
+        same clock; each bar time is one vectorized ``step_rows``.
+
+        Returns:
+            int: Ticks applied
+        """
+        times, rows, closes, volumes = [], [], [], []
+        for pair_address, chart in charts.items():
+            time, close, volume = _bar_columns(chart)
+            if not len(time):
+                continue
+            times.append(np.asarray(time, np.int64))
+            rows.append(np.full(len(time), self.track(pair_address), np.int64))
+            closes.append(close)
+            volumes.append(volume)
+        if not times:
+            return 0
+        time = np.concatenate(times)
+        order = np.argsort(time, kind="stable")
+        time, row = time[order], np.concatenate(rows)[order]
+        close, volume = np.concatenate(closes)[order], np.concatenate(volumes)[order]
+        starts = np.flatnonzero(np.append(True, time[1:] != time[:-1]))
+        ends = np.append(starts[1:], len(time))
+        with self._lock:
+            for start, end in zip(starts, ends):
+                self.step_rows(row[start:end], close[start:end], volume[start:end])
+        return len(starts)
+
+    # Queries
+
+    @property
+    def indicators(self) -> Tuple[str, ...]:
+        return ("price",) + tuple(f"ema_{span}" for span in self.ema_spans) + ("vwap", "volatility", "momentum")
+
+    def column(self, name: str) -> "np.ndarray":
+        """Indicator values for every pair, aligned with ``pairs()``"""
+        n = len(self._pairs)
+        a = self._arrays
+        if name == "price":
+            values = np.where(a["count"][:n] > 0, a["price"][:n], np.nan)
+        elif name.startswith("ema_") and name[4:].isdigit() and int(name[4:]) in self.ema_spans:
+            values = np.where(a["count"][:n] > 0, a["ema"][:n, self.ema_spans.index(int(name[4:]))], np.nan)
+        elif name == "vwap":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = np.where(a["vv"][:n] > 0, a["pv"][:n] / a["vv"][:n], np.nan)
+        elif name == "volatility":
+            values = np.where(a["count"][:n] > 1, np.sqrt(a["var"][:n]), np.nan)
+        elif name == "momentum":
+            values = a["momentum"][:n].copy()
+        else:
+            raise ValueError(f"Unknown indicator '{name}'. Choose from: {', '.join(self.indicators)}")
+        return values
+
+    def columns(self) -> Dict[str, "np.ndarray"]:
+        return {name: self.column(name) for name in self.indicators}
+
+    def snapshot(self, pair_address: str) -> Dict[str, Optional[float]]:
+        """Every indicator of one pair (None where not available yet)"""
+        row = self._rows.get(pair_address)
+        if row is None:
+            return {}
+        values = {}
+        for name in self.indicators:
+            value = float(self.column(name)[row])
+            values[name] = None if np.isnan(value) else value
+        return values
+
+    def top(self, name: str, k: int = 10, ascending: bool = False) -> List[Tuple[str, float]]:
+        """
+        Pairs ranked by an indicator (NaN values are skipped)
+
+        Args:
+            name: Indicator (see ``indicators``)
+            k: Pairs returned
+            ascending: Smallest values first instead of largest
+
+        Returns:
+            List of ``(pair_address, value)`` tuples
+        """
+        with self._lock:
+            values = self.column(name)
+            rows = np.flatnonzero(~np.isnan(values))
+            if not len(rows) or k <= 0:
+                return []
+            keys = values[rows] if ascending else -values[rows]
+            if k < len(rows):
+                best = np.argpartition(keys, k - 1)[:k]
+                rows = rows[best[np.argsort(keys[best], kind="stable")]]
+            else:
+                rows = rows[np.argsort(keys, kind="stable")]
+            return [(self._pairs[row], float(values[row])) for row in rows]
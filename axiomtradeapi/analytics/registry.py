@@ -0,0 +1,363 @@
+"""
+Shared token/pair registry
+Compact records merged from pair events, REST responses and trades, indexed for O(1) lookups
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set
+
+from axiomtradeapi import models
+
+_RECORD_FIELDS = (
+    # Identity
+    "token_address", "pair_address", "deployer_address", "token_name", "token_ticker",
+    "token_image", "token_decimals", "protocol", "supply", "created_at",
+    # Launch
+    "initial_liquidity_sol", "initial_liquidity_token", "lp_burned", "dex_paid",
+    # Socials
+    "twitter", "telegram", "website", "discord",
+    # Holders (get_token_info_by_pair)
+    "holders", "bot_users", "top10_holders", "dev_holds_percent", "insiders_hold_percent",
+    "bundlers_hold_percent", "snipers_hold_percent", "total_pair_fees_paid",
+    # Stats (get_pair_stats)
+    "buy_count", "sell_count", "buy_volume", "sell_volume", "price_change",
+    # Trades (wallet events)
+    "price_usd", "price_sol", "liquidity_sol", "last_trade_at", "trades",
+)
+
+
+def _aliases() -> Dict[str, str]:
+    """Wire keys of every source (snake_case and camelCase) mapped to record fields"""
+    fields = set(_RECORD_FIELDS)
+    aliases = {name: name for name in _RECORD_FIELDS}
+    for model in (models.NewPair, models.PairInfo, models.PairStats, models.TransactionPair):
+        for field in model._fields:
+            if field.attr in fields:
+                aliases[field.key] = field.attr
+    aliases.update(
+        {
+            "top_10_holders": "top10_holders",
+            "top10HoldersPercent": "top10_holders",
+            "numHolders": "holders",
+            "numBotUsers": "bot_users",
+            "devHoldsPercent": "dev_holds_percent",
+            "insidersHoldPercent": "insiders_hold_percent",
+            "bundlersHoldPercent": "bundlers_hold_percent",
+            "snipersHoldPercent": "snipers_hold_percent",
+            "totalPairFeesPaid": "total_pair_fees_paid",
+            "pairCreatedAt": "created_at",
+            "priceUsd": "price_usd",
+            "priceSol": "price_sol",
+            "liquiditySol": "liquidity_sol",
+        }
+    )
+    return aliases
+
+
+_ALIASES = _aliases()
+
+
+def new_pair_content(data: Any) -> Any:
+    """
+    Token data of a ``subscribe_new_tokens`` callback argument
+
+    The callback receives whole frames (``{"room": ..., "content": ...}``)
+    from both ``new_pairs`` and ``update_pulse_v2``; only ``new_pairs``
+    content is returned (None otherwise). Bare content passes through.
+    """
+    if "room" not in data:
+        return data
+    return data.get("content") if data.get("room") == "new_pairs" else None
+
+
+_INDEXED = ("token_address", "pair_address", "deployer_address", "token_ticker")
+
+
+class TokenRecord:
+    """
+    Everything known about one token and its pair
+
+    Fields are None until some source reports them. Timestamps keep their
+    wire value (see ``models.parse_timestamp``).
+    """
+
+    __slots__ = _RECORD_FIELDS + ("updated_at", "touched_at")
+
+    def __init__(self):
+        for name in _RECORD_FIELDS:
+            setattr(self, name, None)
+        self.trades = 0
+        self.updated_at = 0.0
+        self.touched_at = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Known fields (None values omitted)"""
+        return {
+            name: getattr(self, name)
+            for name in _RECORD_FIELDS
+            if getattr(self, name) is not None
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"TokenRecord(token_ticker={self.token_ticker!r}, token_address={self.token_address!r}, "
+            f"pair_address={self.pair_address!r})"
+        )
+
+
+class TokenRegistry:
+    """
+    In-memory registry of tokens shared by every consumer
+
+    Partial updates from ``new_pairs`` events, ``get_pair_info``,
+    ``get_pair_stats``, ``get_token_info_by_pair`` and wallet transaction
+    events are merged into one ``TokenRecord`` per token (values that are
+    None never overwrite known ones). Records are indexed by token
+    address, pair address, deployer address and ticker (case-insensitive).
+
+    Memory is bounded by ``max_tokens``: the least recently touched record
+    is evicted first. With ``ttl`` set, ``expire`` (also run on every
+    insert) drops records not touched for that many seconds.
+
+    Example:
+        >>> ws.subscribe_new_tokens(registry.on_new_pair)
+        >>> registry.update(client.get_pair_stats(pair), pair_address=pair)
+        >>> registry.by_deployer(dev)
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 50000,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_tokens: Records kept at once
+            ttl: Seconds a record may go untouched before it expires (None keeps records until evicted)
+            clock: Time source for ``ttl``
+        """
+        self.max_tokens = max_tokens
+        self.ttl = ttl
+        self.clock = clock
+
+        self._records: "OrderedDict[TokenRecord, None]" = OrderedDict()  # least recently touched first
+        self._by_token: Dict[str, TokenRecord] = {}
+        self._by_pair: Dict[str, TokenRecord] = {}
+        self._by_deployer: Dict[str, Set[TokenRecord]] = {}
+        self._by_ticker: Dict[str, Set[TokenRecord]] = {}
+        self._lock = threading.RLock()
+        self.stats = {"updates": 0, "merged": 0, "evicted": 0, "expired": 0}
+
+    # Updates
+
+    def update(
+        self,
+        data: Mapping[str, Any],
+        token_address: Optional[str] = None,
+        pair_address: Optional[str] = None,
+    ) -> Optional[TokenRecord]:
+        """
+        Merge a partial update (dict or response model) into a record
+
+        Args:
+            data: Fields under any known wire or attribute name; unknown keys are ignored
+            token_address: Token the data belongs to, if ``data`` does not say
+            pair_address: Pair the data belongs to, if ``data`` does not say
+                          (e.g. ``get_token_info_by_pair`` responses)
+
+        Returns:
+            The updated record, or None if neither address is known
+        """
+        values = {}
+        for key, value in data.items():
+            name = _ALIASES.get(key)
+            if name is not None and value is not None and not isinstance(value, (dict, models.Model)):
+                values[name] = value
+        if token_address:
+            values["token_address"] = token_address
+        if pair_address:
+            values["pair_address"] = pair_address
+        with self._lock:
+            return self._merge(values)
+
+    def _merge(self, values: Dict[str, Any]) -> Optional[TokenRecord]:
+        token_address = values.get("token_address")
+        pair_address = values.get("pair_address")
+        by_pair = self._by_pair.get(pair_address) if pair_address else None
+        by_token = self._by_token.get(token_address) if token_address else None
+        record = by_pair or by_token
+        if record is None:
+            if not token_address and not pair_address:
+                return None
+            record = TokenRecord()
+            self._records[record] = None
+        elif by_pair is not None and by_token is not None and by_pair is not by_token:
+            # Known separately by pair and by token until now: fold one into the other
+            self._absorb(by_pair, by_token)
+            self.stats["merged"] += 1
+        self._apply(record, values)
+        self.stats["updates"] += 1
+
+        record.updated_at = record.touched_at = self.clock()
+        self._records.move_to_end(record)
+        self._trim()
+        return record
+
+    def _apply(self, record: TokenRecord, values: Dict[str, Any]) -> None:
+        for name in _INDEXED:
+            value = values.get(name)
+            old = getattr(record, name)
+            if value is not None and value != old:
+                if old is not None:
+                    self._unindex(record, name, old)
+                setattr(record, name, value)
+                self._index(record, name, value)
+        for name, value in values.items():
+            if name not in _INDEXED:
+                setattr(record, name, value)
+
+    def _absorb(self, record: TokenRecord, other: TokenRecord) -> None:
+        values = {name: getattr(other, name) for name in _RECORD_FIELDS if getattr(other, name) is not None}
+        values["trades"] = (record.trades or 0) + (other.trades or 0)
+        self._remove(other)
+        for name, value in list(values.items()):
+            if name != "trades" and getattr(record, name) is not None:
+                del values[name]
+        self._apply(record, values)
+
+    def _index(self, record: TokenRecord, name: str, value: str) -> None:
+        if name == "token_address":
+            self._by_token[value] = record
+        elif name == "pair_address":
+            self._by_pair[value] = record
+        elif name == "deployer_address":
+            self._by_deployer.setdefault(value, set()).add(record)
+        else:
+            self._by_ticker.setdefault(str(value).lower(), set()).add(record)
+
+    def _unindex(self, record: TokenRecord, name: str, value: str) -> None:
+        if name == "token_address":
+            if self._by_token.get(value) is record:
+                del self._by_token[value]
+        elif name == "pair_address":
+            if self._by_pair.get(value) is record:
+                del self._by_pair[value]
+        else:
+            index = self._by_deployer if name == "deployer_address" else self._by_ticker
+            key = value if name == "deployer_address" else str(value).lower()
+            records = index.get(key)
+            if records is not None:
+                records.discard(record)
+                if not records:
+                    del index[key]
+
+    def _remove(self, record: TokenRecord) -> None:
+        for name in _INDEXED:
+            value = getattr(record, name)
+            if value is not None:
+                self._unindex(record, name, value)
+        self._records.pop(record, None)
+
+    def _trim(self) -> None:
+        if self.ttl is not None:
+            self.expire()
+        while len(self._records) > self.max_tokens:
+            self._remove(next(iter(self._records)))
+            self.stats["evicted"] += 1
+
+    def on_new_pair(self, data: Any) -> Optional[TokenRecord]:
+        """``subscribe_new_tokens`` callback (frames or bare ``new_pairs`` content)"""
+        content = new_pair_content(data)
+        if not content or not hasattr(content, "items"):
+            return None
+        return self.update(content)
+
+    def on_transaction(self, content: Any) -> Optional[TokenRecord]:
+        """Wallet-transaction callback: last price, liquidity and the embedded pair summary"""
+        pair_address = content.get("pair_address")
+        if not pair_address:
+            return None
+        values = {
+            "price_usd": content.get("price_usd"),
+            "price_sol": content.get("price_sol"),
+            "liquidity_sol": content.get("liquidity_sol"),
+            "last_trade_at": content.get("created_at"),
+        }
+        pair = content.get("pair")
+        if pair:
+            values.update((key, value) for key, value in pair.items() if key not in values)
+        with self._lock:
+            record = self.update(values, pair_address=pair_address)
+            record.trades += 1
+        return record
+
+    # Lookups
+
+    def _touch(self, record: Optional[TokenRecord]) -> Optional[TokenRecord]:
+        if record is not None:
+            record.touched_at = self.clock()
+            with self._lock:
+                if record in self._records:
+                    self._records.move_to_end(record)
+        return record
+
+    def get(self, token_address: str) -> Optional[TokenRecord]:
+        return self._touch(self._by_token.get(token_address))
+
+    def by_pair(self, pair_address: str) -> Optional[TokenRecord]:
+        return self._touch(self._by_pair.get(pair_address))
+
+    def by_deployer(self, deployer_address: str) -> List[TokenRecord]:
+        return list(self._by_deployer.get(deployer_address, ()))
+
+    def by_ticker(self, ticker: str) -> List[TokenRecord]:
+        return list(self._by_ticker.get(ticker.lower(), ()))
+
+    def __contains__(self, address: str) -> bool:
+        return address in self._by_token or address in self._by_pair
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def records(self) -> List[TokenRecord]:
+        """Records, least recently touched first"""
+        return list(self._records)
+
+    # Eviction
+
+    def remove(self, address: str) -> bool:
+        """Drop a record by token or pair address"""
+        with self._lock:
+            record = self._by_token.get(address) or self._by_pair.get(address)
+            if record is None:
+                return False
+            self._remove(record)
+            return True
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """
+        Drop records not touched within ``ttl`` seconds
+
+        Returns:
+            int: Records dropped
+        """
+        if self.ttl is None:
+            return 0
+        cutoff = (self.clock() if now is None else now) - self.ttl
+        expired = 0
+        with self._lock:
+            while self._records:
+                record = next(iter(self._records))
+                if record.touched_at >= cutoff:
+                    break
+                self._remove(record)
+                expired += 1
+        self.stats["expired"] += expired
+        return expired
+
+    def update_many(self, items: Iterable[Mapping[str, Any]]) -> int:
+        """Merge a batch of updates (e.g. a page of new pairs)"""
+        return sum(1 for data in items if self.update(data) is not None)
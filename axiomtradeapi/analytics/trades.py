@@ -0,0 +1,317 @@
+"""
+Recent-trade ring buffers per pair
+Fixed-size NumPy structured arrays with vectorized windowed aggregates
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from axiomtradeapi import models
+from axiomtradeapi.websocket.dedup import DedupWindow
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _require_numpy():
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy library not installed. Run: pip install numpy")
+
+
+# time: epoch ms; volume: trade size in the book's currency; amount: token amount;
+# side: 1 buy / -1 sell; maker: 64-bit hash of maker_address (0 if unknown)
+TRADE_FIELDS = [
+    ("time", "i8"),
+    ("price", "f8"),
+    ("volume", "f8"),
+    ("amount", "f8"),
+    ("side", "i1"),
+    ("maker", "i8"),
+]
+
+
+@dataclass
+class WindowStats:
+    """Aggregates over the trades of one pair in a time window"""
+
+    count: int = 0
+    volume: float = 0.0
+    buy_volume: float = 0.0
+    sell_volume: float = 0.0
+    buys: int = 0
+    sells: int = 0
+    vwap: Optional[float] = None
+    unique_makers: int = 0
+    first_price: Optional[float] = None
+    last_price: Optional[float] = None
+
+    @property
+    def buy_sell_ratio(self) -> Optional[float]:
+        """Buy volume over sell volume (None without sells)"""
+        return self.buy_volume / self.sell_volume if self.sell_volume else None
+
+
+@dataclass
+class TradeTotals:
+    """Running totals since a pair was first seen (not limited by the ring)"""
+
+    first_time: Optional[int] = None
+    count: int = 0
+    volume: float = 0.0
+    buy_volume: float = 0.0
+    sell_volume: float = 0.0
+
+
+class TradeRing:
+    """
+    Last ``capacity`` trades of one pair
+
+    Appends overwrite the oldest slot in O(1). The array is two
+    time-ordered segments around the write position, so window queries
+    binary-search each segment and aggregate the matching views without
+    copying. Timestamps never go backwards: a late trade is stored at the
+    newest time seen.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        _require_numpy()
+        self.capacity = capacity
+        self.data = np.zeros(capacity, dtype=TRADE_FIELDS)
+        self.head = 0  # next slot to write
+        self.size = 0
+        self.totals = TradeTotals()
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def last_time(self) -> Optional[int]:
+        return int(self.data["time"][self.head - 1]) if self.size else None
+
+    def append(
+        self, timestamp: int, price: float, volume: float, is_buy: bool, maker: int = 0, amount: float = 0.0
+    ) -> None:
+        last = self.last_time
+        if last is not None and timestamp < last:
+            timestamp = last
+        self.data[self.head] = (timestamp, price, volume, amount, 1 if is_buy else -1, maker)
+        self.head = (self.head + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+
+        totals = self.totals
+        if totals.first_time is None:
+            totals.first_time = timestamp
+        totals.count += 1
+        totals.volume += volume
+        if is_buy:
+            totals.buy_volume += volume
+        else:
+            totals.sell_volume += volume
+
+    def segments(self, since: Optional[int] = None) -> List["np.ndarray"]:
+        """Views of the trades with ``time >= since``, oldest first"""
+        if self.size < self.capacity:
+            parts = [self.data[: self.size]]
+        else:
+            parts = [self.data[self.head :], self.data[: self.head]]
+        if since is None:
+            return [part for part in parts if len(part)]
+        views = []
+        for part in parts:
+            start = int(np.searchsorted(part["time"], since, side="left"))
+            if start < len(part):
+                views.append(part[start:])
+        return views
+
+    def trades(self, since: Optional[int] = None) -> "np.ndarray":
+        """Trades with ``time >= since`` as one (copied) structured array"""
+        views = self.segments(since)
+        if not views:
+            return np.zeros(0, dtype=TRADE_FIELDS)
+        return views[0].copy() if len(views) == 1 else np.concatenate(views)
+
+    def window(self, since: Optional[int] = None) -> WindowStats:
+        """Aggregates over trades with ``time >= since`` (epoch ms)"""
+        views = self.segments(since)
+        stats = WindowStats()
+        if not views:
+            return stats
+        notional = 0.0
+        makers = []
+        for view in views:
+            volume = view["volume"]
+            buys = view["side"] > 0
+            stats.count += len(view)
+            stats.volume += float(volume.sum())
+            stats.buy_volume += float(volume[buys].sum())
+            stats.buys += int(np.count_nonzero(buys))
+            notional += float(np.dot(view["price"], volume))
+            makers.append(view["maker"])
+        stats.sell_volume = stats.volume - stats.buy_volume
+        stats.sells = stats.count - stats.buys
+        stats.vwap = notional / stats.volume if stats.volume else None
+        maker_ids = makers[0] if len(makers) == 1 else np.concatenate(makers)
+        unique = np.unique(maker_ids)
+        stats.unique_makers = int(np.count_nonzero(unique))
+        stats.first_price = float(views[0]["price"][0])
+        stats.last_price = float(views[-1]["price"][-1])
+        return stats
+
+
+class TradeBook:
+    """
+    Ring buffers of recent trades for many pairs
+
+    Feed it wallet transactions (``on_transaction`` works as a
+    ``subscribe_wallet_transactions`` callback) or trades from token rooms
+    through ``add``. The same trade seen in several rooms is stored once
+    (by ``signature``). Memory is bounded by ``capacity * max_pairs``
+    trades; the least recently traded pair is dropped beyond that.
+
+    Example:
+        >>> book.window("pair", seconds=30).buy_sell_ratio
+        >>> book.window("pair", seconds=300).unique_makers
+        >>> book.totals("pair").volume  # since first seen
+    """
+
+    def __init__(
+        self,
+        capacity: int = 4096,
+        max_pairs: int = 1000,
+        currency: str = "USD",
+        dedup_window: int = 65536,
+    ):
+        """
+        Args:
+            capacity: Trades kept per pair
+            max_pairs: Pairs kept at once
+            currency: "USD" (price_usd/total_usd) or "SOL" (price_sol/total_sol)
+            dedup_window: Recent signatures remembered for de-duplication
+        """
+        _require_numpy()
+        self.capacity = capacity
+        self.max_pairs = max_pairs
+        self.currency = currency.upper()
+        self._price_key, self._volume_key = (
+            ("price_sol", "total_sol") if self.currency == "SOL" else ("price_usd", "total_usd")
+        )
+        self.dedup = DedupWindow(dedup_window)
+        self._rings: "OrderedDict[str, TradeRing]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"trades": 0, "duplicates": 0, "skipped": 0, "evicted": 0}
+
+    @staticmethod
+    def maker_id(maker_address: Optional[str]) -> int:
+        """64-bit id for unique-maker counts (0 for unknown makers)"""
+        if not maker_address:
+            return 0
+        return hash(maker_address) or 1
+
+    def add(
+        self,
+        pair_address: str,
+        price: float,
+        volume: float,
+        is_buy: bool,
+        timestamp: Optional[int] = None,
+        maker_address: Optional[str] = None,
+        amount: float = 0.0,
+        signature: Optional[str] = None,
+    ) -> bool:
+        """
+        Record a trade
+
+        Returns:
+            bool: False if the signature was already recorded
+        """
+        timestamp = int(time.time() * 1000) if timestamp is None else timestamp
+        with self._lock:
+            if signature is not None and not self.dedup.first(signature):
+                self.stats["duplicates"] += 1
+                return False
+            ring = self._rings.get(pair_address)
+            if ring is None:
+                ring = self._rings[pair_address] = TradeRing(self.capacity)
+                if len(self._rings) > self.max_pairs:
+                    self._rings.popitem(last=False)
+                    self.stats["evicted"] += 1
+            else:
+                self._rings.move_to_end(pair_address)
+            ring.append(timestamp, price, volume, is_buy, self.maker_id(maker_address), amount)
+            self.stats["trades"] += 1
+        return True
+
+    def on_transaction(self, content: Any, pair_address: Optional[str] = None) -> bool:
+        """Record a wallet/token room transaction (dict or ``WalletTransaction``)"""
+        get = content.get
+        pair_address = pair_address or get("pair_address")
+        price = get(self._price_key)
+        if not pair_address or price is None:
+            self.stats["skipped"] += 1
+            return False
+        created_at = (
+            content.created_at
+            if isinstance(content, models.WalletTransaction)
+            else models.parse_timestamp(get("created_at"))
+        )
+        return self.add(
+            pair_address,
+            float(price),
+            float(get(self._volume_key) or 0.0),
+            get("type") == "buy",
+            int(created_at.timestamp() * 1000) if created_at is not None else None,
+            get("maker_address"),
+            float(get("token_amount") or 0.0),
+            get("signature"),
+        )
+
+    def ring(self, pair_address: str) -> Optional[TradeRing]:
+        return self._rings.get(pair_address)
+
+    def window(self, pair_address: str, seconds: Optional[float] = None, now: Optional[int] = None) -> WindowStats:
+        """
+        Aggregates over a pair's trades in the last ``seconds``
+
+        Args:
+            seconds: Window length (None for every buffered trade)
+            now: Window end, epoch ms (wall clock if None)
+        """
+        ring = self._rings.get(pair_address)
+        if ring is None:
+            return WindowStats()
+        since = None
+        if seconds is not None:
+            now = int(time.time() * 1000) if now is None else now
+            since = now - int(seconds * 1000)
+        with self._lock:
+            return ring.window(since)
+
+    def totals(self, pair_address: str) -> TradeTotals:
+        ring = self._rings.get(pair_address)
+        return ring.totals if ring is not None else TradeTotals()
+
+    def pairs(self) -> List[str]:
+        return list(self._rings)
+
+    def drop(self, pair_address: str) -> bool:
+        with self._lock:
+            return self._rings.pop(pair_address, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._rings)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(ring.data.nbytes for ring in list(self._rings.values()))
+
+    def windows(self, seconds: float, now: Optional[int] = None) -> Dict[str, WindowStats]:
+        """Window aggregates for every pair"""
+        return {pair_address: self.window(pair_address, seconds, now) for pair_address in self.pairs()}
@@ -4,7 +4,6 @@ Handles automatic login, token refresh, and cookie management
 """
 
 import requests
-import json
 import time
 import logging
 import os
@@ -16,6 +15,8 @@ from typing import Dict, Optional, Union
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+from .. import codec
+
 
 @dataclass
 class AuthTokens:
@@ -102,7 +103,7 @@ class SecureTokenStorage:
         """
         try:
             # Convert tokens to JSON
-            token_data = json.dumps(tokens.to_dict()).encode('utf-8')
+            token_data = codec.dumps(tokens.to_dict()).encode('utf-8')
             
             # Encrypt the data
             encrypted_data = self.cipher_suite.encrypt(token_data)
@@ -141,7 +142,7 @@ class SecureTokenStorage:
             decrypted_data = self.cipher_suite.decrypt(encrypted_data)
             
             # Parse JSON
-            token_data = json.loads(decrypted_data.decode('utf-8'))
+            token_data = codec.loads(decrypted_data)
             
             # Create AuthTokens object
             tokens = AuthTokens.from_dict(token_data)
@@ -421,7 +422,7 @@ class AuthManager:
                 else:
                     # Sometimes tokens are in response body
                     try:
-                        response_data = response.json()
+                        response_data = codec.response_json(response)
                         auth_token = response_data.get('accessToken') or response_data.get('auth-access-token')
                         refresh_token = response_data.get('refreshToken') or response_data.get('auth-refresh-token')
                         
@@ -502,7 +503,7 @@ class AuthManager:
                 else:
                     # Sometimes the response might be in JSON format
                     try:
-                        response_data = response.json()
+                        response_data = codec.response_json(response)
                         new_auth_token = (response_data.get('accessToken') or 
                                         response_data.get('auth-access-token') or
                                         response_data.get('access_token'))
@@ -515,7 +516,7 @@ class AuthManager:
                             self._set_tokens(new_auth_token, refresh_token_to_use)
                             self.logger.info("✅ Tokens refreshed successfully from JSON response!")
                             return True
-                    except (json.JSONDecodeError, AttributeError):
+                    except codec.DecodeError + (AttributeError,):
                         pass
                     
                     self.logger.error("❌ No new access token in refresh response")
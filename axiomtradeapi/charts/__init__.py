@@ -0,0 +1,14 @@
+"""
+Chart data helpers for Axiom Trade API
+"""
+
+from .cache import BarCache
+from .candles import Candle, CandleBuilder
+from .fetcher import INTERVALS, fetch_chart_range, interval_ms
+from .store import NUMPY_AVAILABLE, BarSeries, BarStore
+from .sync import ChartSynchronizer, SyncState
+
+__all__ = ['fetch_chart_range', 'INTERVALS', 'interval_ms',
+           'BarStore', 'BarSeries', 'NUMPY_AVAILABLE',
+           'ChartSynchronizer', 'SyncState', 'BarCache',
+           'CandleBuilder', 'Candle']
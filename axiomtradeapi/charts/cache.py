@@ -0,0 +1,334 @@
+"""
+Persistent chart bar cache
+SQLite file keyed by pair, interval and currency that records which time ranges are already stored
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Iterable, List, Optional, Tuple
+
+from axiomtradeapi import models
+from axiomtradeapi.charts.fetcher import INTERVALS, bar_time
+from axiomtradeapi.charts.store import NUMPY_AVAILABLE, BarSeries, _require_numpy
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    pair TEXT NOT NULL, interval TEXT NOT NULL, currency TEXT NOT NULL, time INTEGER NOT NULL,
+    open REAL, high REAL, low REAL, close REAL, volume REAL,
+    PRIMARY KEY (pair, interval, currency, time)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    pair TEXT NOT NULL, interval TEXT NOT NULL, currency TEXT NOT NULL,
+    start_ms INTEGER NOT NULL, end_ms INTEGER NOT NULL,
+    PRIMARY KEY (pair, interval, currency, start_ms)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS series (
+    pair TEXT NOT NULL, interval TEXT NOT NULL, currency TEXT NOT NULL, accessed REAL NOT NULL,
+    PRIMARY KEY (pair, interval, currency)
+) WITHOUT ROWID;
+"""
+
+Key = Tuple[str, str, str]
+
+
+def _contiguous(end: int, start: int, step: int) -> bool:
+    """True if no bar opens strictly between a range ending at ``end`` and one starting at ``start``"""
+    return start <= end or (step > 0 and (end // step + 1) * step >= start)
+
+
+class BarCache:
+    """
+    On-disk cache of chart bars
+
+    Bars live in one SQLite table clustered by ``(pair, interval, currency,
+    time)``, so a range read is a single index scan, and the file is read
+    through SQLite's memory map. A ``coverage`` table records the time
+    ranges that were fetched completely; ``missing`` returns what still
+    has to come from the network (ranges without trades have no bars but
+    are still covered); ranges with no bar open time between them are
+    merged. Writes are buffered and committed in batches.
+    ``evict`` drops least recently used series once the file grows past
+    ``max_bytes``; ``compact`` merges coverage and rewrites the file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: Optional[int] = None,
+        batch_size: int = 5000,
+        mmap_bytes: int = 256 * 2 ** 20,
+    ):
+        """
+        Args:
+            path: SQLite file (created if missing)
+            max_bytes: Size above which least recently used series are evicted
+            batch_size: Buffered bars that trigger a commit
+            mmap_bytes: Bytes of the file SQLite maps into memory for reads
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(f"PRAGMA mmap_size={int(mmap_bytes)}")
+        self._db.executescript(_SCHEMA)
+        self._pending: List[tuple] = []
+        self._pending_coverage: List[Tuple[Key, int, int]] = []
+
+    # Writing
+
+    def put(
+        self,
+        pair_address: str,
+        interval: str,
+        currency: str,
+        bars: Iterable[Any],
+        covered: Optional[Tuple[int, int]] = None,
+    ) -> int:
+        """
+        Buffer bars for a series
+
+        Args:
+            covered: ``(start, end)`` ms range these bars completely describe;
+                     recorded once the bars are committed
+
+        Returns:
+            int: Bars buffered
+        """
+        rows = []
+        for bar in bars:
+            bar = bar if isinstance(bar, models.ChartBar) else models.ChartBar.from_wire(bar)
+            timestamp = bar_time(bar)
+            if timestamp is None:
+                continue
+            rows.append(
+                (pair_address, interval, currency, int(timestamp),
+                 bar.open, bar.high, bar.low, bar.close, bar.volume or 0.0)
+            )
+        with self._lock:
+            self._pending.extend(rows)
+            if covered is not None and covered[1] >= covered[0]:
+                self._pending_coverage.append(((pair_address, interval, currency), covered[0], covered[1]))
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+        return len(rows)
+
+    def flush(self) -> None:
+        """Commit buffered bars and coverage in one transaction"""
+        with self._lock:
+            if not self._pending and not self._pending_coverage:
+                return
+            rows, self._pending = self._pending, []
+            coverage, self._pending_coverage = self._pending_coverage, []
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany("INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                now = time.time()
+                touched = {row[:3] for row in rows} | {key for key, _, _ in coverage}
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO series VALUES (?, ?, ?, ?)",
+                    [key + (now,) for key in touched],
+                )
+                for key, start, end in coverage:
+                    self._add_coverage(key, start, end)
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+            # Nothing is pending any more, so evict -> drop -> flush returns at once
+            if self.max_bytes is not None and self.size() > self.max_bytes:
+                self.evict()
+
+    def _add_coverage(self, key: Key, start: int, end: int) -> None:
+        """Insert a range, merging every range it overlaps or touches (within one bar)"""
+        step = INTERVALS.get(key[1], 0)
+        candidates = self._db.execute(
+            "SELECT start_ms, end_ms FROM coverage WHERE pair=? AND interval=? AND currency=? "
+            "AND start_ms <= ? AND end_ms >= ? ORDER BY start_ms",
+            key + (end + step, start - step),
+        ).fetchall()
+        for old_start, old_end in candidates:
+            if _contiguous(old_end, start, step) and _contiguous(end, old_start, step):
+                start, end = min(start, old_start), max(end, old_end)
+        self._db.execute(
+            "DELETE FROM coverage WHERE pair=? AND interval=? AND currency=? AND start_ms >= ? AND start_ms <= ?",
+            key + (start, end),
+        )
+        self._db.execute("INSERT INTO coverage VALUES (?, ?, ?, ?, ?)", key + (start, end))
+
+    # Reading
+
+    def coverage(self, pair_address: str, interval: str, currency: str = "USD") -> List[Tuple[int, int]]:
+        with self._lock:
+            self.flush()
+            return self._db.execute(
+                "SELECT start_ms, end_ms FROM coverage WHERE pair=? AND interval=? AND currency=? ORDER BY start_ms",
+                (pair_address, interval, currency),
+            ).fetchall()
+
+    def missing(
+        self, pair_address: str, interval: str, currency: str, start: int, end: int
+    ) -> List[Tuple[int, int]]:
+        """Sub-ranges of ``[start, end]`` (ms) that are not covered yet"""
+        gaps = []
+        cursor = start
+        for covered_start, covered_end in self.coverage(pair_address, interval, currency):
+            if covered_end < cursor:
+                continue
+            if covered_start > end:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+            if cursor >= end:
+                return gaps
+        gaps.append((cursor, end))
+        return gaps
+
+    def _select(self, pair_address: str, interval: str, currency: str, start: Optional[int], end: Optional[int]):
+        key = (pair_address, interval, currency)
+        with self._lock:
+            self.flush()
+            self._db.execute(
+                "UPDATE series SET accessed=? WHERE pair=? AND interval=? AND currency=?",
+                (time.time(),) + key,
+            )
+            return self._db.execute(
+                "SELECT time, open, high, low, close, volume FROM bars "
+                "WHERE pair=? AND interval=? AND currency=? AND time >= ? AND time <= ? ORDER BY time",
+                key + (start if start is not None else -2 ** 63, end if end is not None else 2 ** 63 - 1),
+            ).fetchall()
+
+    def read(
+        self,
+        pair_address: str,
+        interval: str,
+        currency: str = "USD",
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> List[models.ChartBar]:
+        """Cached bars with ``start <= time <= end`` as ``ChartBar`` models"""
+        return [models.ChartBar(*row) for row in self._select(pair_address, interval, currency, start, end)]
+
+    def read_series(
+        self,
+        pair_address: str,
+        interval: str,
+        currency: str = "USD",
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> BarSeries:
+        """Cached bars as a columnar ``BarSeries`` (needs numpy)"""
+        _require_numpy()
+        rows = self._select(pair_address, interval, currency, start, end)
+        matrix = np.array(rows, dtype=np.float64).reshape(-1, 6)
+        columns = {
+            "time": matrix[:, 0].astype(np.int64),
+            "open": matrix[:, 1].copy(),
+            "high": matrix[:, 2].copy(),
+            "low": matrix[:, 3].copy(),
+            "close": matrix[:, 4].copy(),
+            "volume": matrix[:, 5].copy(),
+        }
+        return BarSeries.from_columns(pair_address, interval, columns, copy=False, currency=currency)
+
+    def keys(self) -> List[Key]:
+        with self._lock:
+            self.flush()
+            return [tuple(row) for row in self._db.execute("SELECT pair, interval, currency FROM series")]
+
+    # Maintenance
+
+    def size(self) -> int:
+        """Bytes used by live pages (freed pages are excluded)"""
+        with self._lock:
+            page_size = self._db.execute("PRAGMA page_size").fetchone()[0]
+            pages = self._db.execute("PRAGMA page_count").fetchone()[0]
+            free = self._db.execute("PRAGMA freelist_count").fetchone()[0]
+        return (pages - free) * page_size
+
+    def drop(self, pair_address: str, interval: Optional[str] = None, currency: Optional[str] = None) -> None:
+        """Delete a series (or every interval/currency of a pair)"""
+        where = "pair=?" + (" AND interval=?" if interval else "") + (" AND currency=?" if currency else "")
+        args = tuple(value for value in (pair_address, interval, currency) if value)
+        with self._lock:
+            self.flush()
+            self._db.execute("BEGIN")
+            for table in ("bars", "coverage", "series"):
+                self._db.execute(f"DELETE FROM {table} WHERE {where}", args)
+            self._db.execute("COMMIT")
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Drop least recently used series until the cache fits ``max_bytes``
+
+        Returns:
+            int: Series evicted
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        if limit is None:
+            return 0
+        evicted = 0
+        with self._lock:
+            while self.size() > limit:
+                row = self._db.execute(
+                    "SELECT pair, interval, currency FROM series ORDER BY accessed LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    break
+                self.drop(*row)
+                evicted += 1
+            if evicted:
+                self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return evicted
+
+    def compact(self) -> None:
+        """Merge coverage ranges, drop orphaned rows and rewrite the file"""
+        with self._lock:
+            self.flush()
+            ranges = self._db.execute(
+                "SELECT pair, interval, currency, start_ms, end_ms FROM coverage "
+                "ORDER BY pair, interval, currency, start_ms"
+            ).fetchall()
+            merged: List[list] = []
+            for pair, interval, currency, start, end in ranges:
+                last = merged[-1] if merged else None
+                if (
+                    last
+                    and last[:3] == [pair, interval, currency]
+                    and _contiguous(last[4], start, INTERVALS.get(interval, 0))
+                ):
+                    last[4] = max(last[4], end)
+                else:
+                    merged.append([pair, interval, currency, start, end])
+            self._db.execute("BEGIN")
+            self._db.execute("DELETE FROM coverage")
+            self._db.executemany("INSERT INTO coverage VALUES (?, ?, ?, ?, ?)", merged)
+            self._db.execute(
+                "DELETE FROM bars WHERE NOT EXISTS (SELECT 1 FROM series s WHERE "
+                "s.pair=bars.pair AND s.interval=bars.interval AND s.currency=bars.currency)"
+            )
+            self._db.execute("COMMIT")
+            self._db.execute("VACUUM")
+            self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self._db.close()
+
+    def __enter__(self) -> "BarCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,251 @@
+"""
+Streaming OHLCV candles from trade events
+Builds 1s/1m/5m (or any chart interval) candles per pair from wallet transaction events with bounded memory
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Iterable, List, Optional
+
+from axiomtradeapi import models
+from axiomtradeapi.charts.fetcher import interval_ms
+
+CandleListener = Callable[["Candle"], None]
+
+
+class Candle:
+    """One OHLCV bar built from trades, with buy/sell volume split"""
+
+    __slots__ = (
+        "pair_address", "interval", "time", "open", "high", "low", "close",
+        "volume", "buy_volume", "sell_volume", "trades",
+    )
+
+    def __init__(self, pair_address: str, interval: str, time: int, price: float):
+        self.pair_address = pair_address
+        self.interval = interval
+        self.time = time  # open time, epoch ms
+        self.open = self.high = self.low = self.close = price
+        self.volume = 0.0
+        self.buy_volume = 0.0
+        self.sell_volume = 0.0
+        self.trades = 0
+
+    def add(self, price: float, volume: float, is_buy: bool) -> None:
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += volume
+        if is_buy:
+            self.buy_volume += volume
+        else:
+            self.sell_volume += volume
+        self.trades += 1
+
+    def to_bar(self) -> models.ChartBar:
+        return models.ChartBar(self.time, self.open, self.high, self.low, self.close, self.volume)
+
+    def __repr__(self) -> str:
+        return (
+            f"Candle({self.pair_address!r}, {self.interval!r}, time={self.time}, "
+            f"o={self.open}, h={self.high}, l={self.low}, c={self.close}, v={self.volume})"
+        )
+
+
+class _PairCandles:
+    __slots__ = ("open", "closed")
+
+    def __init__(self, intervals: int, history: int):
+        self.open: List[Optional[Candle]] = [None] * intervals
+        self.closed: List[Deque[Candle]] = [deque(maxlen=history) for _ in range(intervals)]
+
+
+class CandleBuilder:
+    """
+    Aggregates trade events into OHLCV candles per pair
+
+    Each event updates the open candle of every interval in O(1). When a
+    trade falls into a later bucket the open candle is closed, kept in a
+    fixed-size ring of recent candles and passed to every listener. Only
+    ``max_pairs`` pairs are tracked (least recently traded pairs are
+    dropped), so memory stays bounded. A trade older than any of a pair's
+    open candles is counted in ``stats["late"]`` and ignored for every
+    interval, so coarser candles stay the sum of the finer ones.
+
+    ``on_transaction`` accepts wallet transaction content and can be
+    passed straight to ``subscribe_wallet_transactions``.
+    """
+
+    def __init__(
+        self,
+        intervals: Iterable[str] = ("1s", "1m", "5m"),
+        history: int = 500,
+        currency: str = "USD",
+        max_pairs: int = 10000,
+        on_close: Optional[CandleListener] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Args:
+            intervals: Chart intervals to build (see ``charts.INTERVALS``)
+            history: Closed candles kept per pair and interval
+            currency: "USD" (price_usd/total_usd) or "SOL" (price_sol/total_sol)
+            max_pairs: Pairs tracked at once
+            on_close: Listener called with every closed candle
+            logger: Logger for listener errors
+        """
+        self.intervals = tuple(intervals)
+        self._steps = tuple(interval_ms(interval) for interval in self.intervals)
+        self.history = history
+        self.currency = currency.upper()
+        self._price_key, self._volume_key = (
+            ("price_sol", "total_sol") if self.currency == "SOL" else ("price_usd", "total_usd")
+        )
+        self.max_pairs = max_pairs
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.listeners: List[CandleListener] = [on_close] if on_close else []
+        self._pairs: "OrderedDict[str, _PairCandles]" = OrderedDict()
+        # Sync callbacks from several wallet rooms may run on different threads
+        self._lock = threading.RLock()
+        self.stats = {"trades": 0, "closed": 0, "late": 0, "skipped": 0, "evicted": 0}
+
+    def add_listener(self, listener: CandleListener) -> None:
+        self.listeners.append(listener)
+
+    def _pair(self, pair_address: str) -> _PairCandles:
+        pair = self._pairs.get(pair_address)
+        if pair is None:
+            pair = self._pairs[pair_address] = _PairCandles(len(self.intervals), self.history)
+            if len(self._pairs) > self.max_pairs:
+                self._pairs.popitem(last=False)
+                self.stats["evicted"] += 1
+        else:
+            self._pairs.move_to_end(pair_address)
+        return pair
+
+    def update(
+        self, pair_address: str, price: float, volume: float, is_buy: bool, timestamp: Optional[int] = None
+    ) -> None:
+        """
+        Add one trade
+
+        Args:
+            pair_address: Pair traded
+            price: Trade price
+            volume: Trade size in the builder's currency
+            is_buy: True for buys, False for sells
+            timestamp: Trade time, epoch ms (now if None)
+        """
+        timestamp = int(time.time() * 1000) if timestamp is None else timestamp
+        buckets = [timestamp - timestamp % step for step in self._steps]
+        with self._lock:
+            pair = self._pair(pair_address)
+            self.stats["trades"] += 1
+            open_candles = pair.open
+            # Checked for every interval before any candle is touched
+            for candle, bucket in zip(open_candles, buckets):
+                if candle is not None and bucket < candle.time:
+                    self.stats["late"] += 1
+                    return
+            for i, bucket in enumerate(buckets):
+                candle = open_candles[i]
+                if candle is not None and bucket != candle.time:
+                    self._close(pair, i, candle)
+                    candle = None
+                if candle is None:
+                    candle = open_candles[i] = Candle(pair_address, self.intervals[i], bucket, price)
+                candle.add(price, volume, is_buy)
+
+    def on_transaction(self, content: Any) -> None:
+        """Feed a wallet transaction event (dict or ``WalletTransaction``)"""
+        get = content.get
+        pair_address = get("pair_address")
+        price = get(self._price_key)
+        if not pair_address or price is None:
+            self.stats["skipped"] += 1
+            return
+        created_at = (
+            content.created_at
+            if isinstance(content, models.WalletTransaction)
+            else models.parse_timestamp(get("created_at"))
+        )
+        timestamp = int(created_at.timestamp() * 1000) if created_at is not None else None
+        self.update(pair_address, float(price), float(get(self._volume_key) or 0.0), get("type") == "buy", timestamp)
+
+    def _close(self, pair: _PairCandles, i: int, candle: Candle) -> None:
+        pair.open[i] = None
+        pair.closed[i].append(candle)
+        self.stats["closed"] += 1
+        for listener in self.listeners:
+            try:
+                listener(candle)
+            except Exception as e:
+                self.logger.error(f"Candle listener failed: {e}")
+
+    def close_due(self, now: Optional[int] = None) -> List[Candle]:
+        """
+        Close open candles whose interval has ended (for pairs that stopped trading)
+
+        Args:
+            now: Current time, epoch ms (wall clock if None)
+
+        Returns:
+            List of candles closed
+        """
+        now = int(time.time() * 1000) if now is None else now
+        closed = []
+        with self._lock:
+            for pair in self._pairs.values():
+                for i, step in enumerate(self._steps):
+                    candle = pair.open[i]
+                    if candle is not None and now >= candle.time + step:
+                        self._close(pair, i, candle)
+                        closed.append(candle)
+        return closed
+
+    def _index(self, interval: str) -> int:
+        try:
+            return self.intervals.index(interval)
+        except ValueError:
+            raise ValueError(
+                f"Interval '{interval}' is not built. Choose from: {', '.join(self.intervals)}"
+            ) from None
+
+    def current(self, pair_address: str, interval: str) -> Optional[Candle]:
+        """The open candle of a pair, if any"""
+        pair = self._pairs.get(pair_address)
+        return pair.open[self._index(interval)] if pair is not None else None
+
+    def candles(self, pair_address: str, interval: str, include_open: bool = False) -> List[Candle]:
+        """Recent closed candles, oldest first (plus the open one if requested)"""
+        pair = self._pairs.get(pair_address)
+        if pair is None:
+            return []
+        i = self._index(interval)
+        candles = list(pair.closed[i])
+        if include_open and pair.open[i] is not None:
+            candles.append(pair.open[i])
+        return candles
+
+    def to_series(self, pair_address: str, interval: str, include_open: bool = False):
+        """Recent candles as a columnar ``BarSeries`` (needs numpy)"""
+        from axiomtradeapi.charts.store import BarSeries
+
+        series = BarSeries(pair_address, interval, capacity=self.history + 1, currency=self.currency)
+        series.extend([candle.to_bar() for candle in self.candles(pair_address, interval, include_open)])
+        return series
+
+    def pairs(self) -> List[str]:
+        return list(self._pairs)
+
+    def drop(self, pair_address: str) -> bool:
+        with self._lock:
+            return self._pairs.pop(pair_address, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._pairs)
@@ -0,0 +1,198 @@
+"""
+Paged chart fetching for arbitrary time ranges
+Splits a range into ``countBars``-sized windows, fetches them concurrently and stitches the bars together
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from axiomtradeapi import models
+
+# Bar length in milliseconds for the intervals accepted by pair-chart
+INTERVALS = {
+    "1s": 1000,
+    "15s": 15 * 1000,
+    "30s": 30 * 1000,
+    "1m": 60 * 1000,
+    "5m": 5 * 60 * 1000,
+    "15m": 15 * 60 * 1000,
+    "30m": 30 * 60 * 1000,
+    "1h": 60 * 60 * 1000,
+    "4h": 4 * 60 * 60 * 1000,
+    "12h": 12 * 60 * 60 * 1000,
+    "24h": 24 * 60 * 60 * 1000,
+    "1d": 24 * 60 * 60 * 1000,
+}
+
+
+def interval_ms(interval: str) -> int:
+    """
+    Bar length of a chart interval in milliseconds
+
+    Raises:
+        ValueError: If the interval is unknown
+    """
+    try:
+        return INTERVALS[interval]
+    except KeyError:
+        raise ValueError(
+            f"Unknown chart interval '{interval}'. Choose from: {', '.join(INTERVALS)}"
+        ) from None
+
+
+def closed_until(interval: str, now_ms: Optional[int] = None) -> int:
+    """Open time of the newest bar that can no longer change"""
+    step = interval_ms(interval)
+    now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+    return (now_ms // step - 1) * step
+
+
+def chart_windows(start: int, end: int, interval: str, count_bars: int) -> List[Tuple[int, int]]:
+    """Split ``[start, end]`` (ms) into consecutive windows of at most ``count_bars`` bars"""
+    if end < start:
+        raise ValueError("end must not be before start")
+    span = interval_ms(interval) * count_bars
+    windows = []
+    window_start = start
+    while True:
+        window_end = min(window_start + span, end)
+        windows.append((window_start, window_end))
+        if window_end >= end:
+            return windows
+        window_start = window_end
+
+
+def chart_bars(chart: Any) -> List[Any]:
+    """Bars of a ``get_pair_chart`` result (model, ``{"bars": [...]}`` or bare list)"""
+    if isinstance(chart, models.PairChart):
+        return list(chart.bars or ())
+    if isinstance(chart, dict):
+        return list(chart.get("bars") or ())
+    if isinstance(chart, list):
+        return chart
+    return []
+
+
+def bar_time(bar: Any) -> Optional[float]:
+    """Bar open time in epoch milliseconds (bars may carry seconds, ms or ISO strings)"""
+    time = bar.time if isinstance(bar, models.ChartBar) else models.ChartBar.from_wire(bar).time
+    if isinstance(time, (int, float)):
+        return time if time > 1e11 else time * 1000
+    parsed = models.parse_timestamp(time)
+    return parsed.timestamp() * 1000 if parsed is not None else None
+
+
+def merge_bars(pages: List[List[Any]], start: Optional[int] = None, end: Optional[int] = None) -> List[Any]:
+    """
+    Merge pages of bars into one time-ordered list
+
+    A bar that appears in two adjacent windows (the shared edge) is kept
+    once; the copy from the later page wins since it was fetched as that
+    window's first bar rather than its last.
+    """
+    by_time: Dict[float, Any] = {}
+    for page in pages:
+        for bar in page:
+            time = bar_time(bar)
+            if time is None:
+                continue
+            if start is not None and time < start:
+                continue
+            if end is not None and time > end:
+                continue
+            by_time[time] = bar
+    return [by_time[time] for time in sorted(by_time)]
+
+
+def fetch_chart_range(
+    client,
+    pair_address: str,
+    start: int,
+    end: int,
+    interval: str = "1m",
+    currency: str = "USD",
+    count_bars: int = 329,
+    max_workers: int = 4,
+    store=None,
+    cache=None,
+    **chart_kwargs,
+) -> Any:
+    """
+    Fetch every bar of ``[start, end]`` with concurrent ``get_pair_chart`` calls
+
+    Args:
+        client: ``AxiomTradeClient``; its ``rate_limiter`` (if any) paces the calls
+        pair_address: Pair to fetch
+        start: Range start, epoch milliseconds
+        end: Range end, epoch milliseconds
+        interval: Bar interval (see ``INTERVALS``)
+        currency: "USD" or "SOL"
+        count_bars: Bars requested per window
+        max_workers: Concurrent requests
+        store: ``BarStore`` to append the bars to instead of building a PairChart
+        cache: ``BarCache`` consulted first; only uncovered ranges are fetched
+               and fetched bars are written back to it
+        **chart_kwargs: Extra ``get_pair_chart`` arguments (e.g. ``show_outliers``)
+
+    Returns:
+        PairChart with de-duplicated, time-ordered bars ({"bars": [...]}
+        if the client returns raw responses), or the ``BarSeries`` when a
+        store is given
+    """
+    ranges = [(start, end)]
+    if cache is not None:
+        ranges = cache.missing(pair_address, interval, currency, start, end)
+    windows = [
+        (i, window)
+        for i, (range_start, range_end) in enumerate(ranges)
+        for window in chart_windows(range_start, range_end, interval, count_bars)
+    ]
+    limiter = getattr(client, "rate_limiter", None)
+
+    def fetch(item: Tuple[int, Tuple[int, int]]) -> List[Any]:
+        window = item[1]
+        if limiter is not None:
+            limiter.acquire()
+        chart = client.get_pair_chart(
+            pair_address,
+            from_ts=window[0],
+            to_ts=window[1],
+            interval=interval,
+            currency=currency,
+            count_bars=count_bars,
+            **chart_kwargs,
+        )
+        return chart_bars(chart)
+
+    if len(windows) <= 1 or max_workers <= 1:
+        pages = [fetch(item) for item in windows]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(windows)), thread_name_prefix="axiom-chart"
+        ) as executor:
+            pages = list(executor.map(fetch, windows))
+
+    if cache is not None:
+        # Only closed bars count as covered; the open bar is fetched again next time
+        closed = closed_until(interval)
+        for i, (range_start, range_end) in enumerate(ranges):
+            range_pages = [page for (index, _), page in zip(windows, pages) if index == i]
+            cache.put(
+                pair_address,
+                interval,
+                currency,
+                merge_bars(range_pages, range_start, range_end),
+                covered=(range_start, min(range_end, closed)),
+            )
+        bars = cache.read(pair_address, interval, currency, start, end)
+        if getattr(client, "raw_responses", False) and store is None:
+            bars = [list(bar) for bar in bars]
+    else:
+        bars = merge_bars(pages, start, end)
+
+    if store is not None:
+        return store.add_bars(pair_address, interval, bars, currency)
+    if getattr(client, "raw_responses", False):
+        return {"bars": bars}
+    return models.PairChart.from_dict({"bars": tuple(bars)})
@@ -0,0 +1,356 @@
+"""
+Columnar OHLCV storage for pair chart bars
+NumPy arrays per column, one time-ordered series per pair, interval and currency
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from axiomtradeapi import models
+from axiomtradeapi.charts.fetcher import bar_time, chart_bars, interval_ms
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+COLUMNS = ("time", "open", "high", "low", "close", "volume")
+PRICE_COLUMNS = COLUMNS[1:]
+
+Key = Tuple[str, str, str]
+
+
+def _require_numpy():
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy library not installed. Run: pip install numpy")
+
+
+def bars_to_columns(bars: Iterable[Any]) -> Tuple["np.ndarray", ...]:
+    """
+    Convert chart bars to ``(time, open, high, low, close, volume)`` arrays
+
+    Accepts ``[t, o, h, l, c, v]`` arrays, bar objects and ``ChartBar``
+    models. Times are normalized to epoch milliseconds (int64).
+    """
+    _require_numpy()
+    bars = bars if isinstance(bars, (list, tuple)) else list(bars)
+    if not bars:
+        return (np.empty(0, np.int64),) + tuple(np.empty(0) for _ in PRICE_COLUMNS)
+
+    if isinstance(bars[0], (list, tuple)):
+        try:
+            matrix = np.array([bar[:6] for bar in bars], dtype=np.float64)
+        except (TypeError, ValueError):
+            matrix = None  # ISO timestamps or ragged rows
+        if matrix is not None and matrix.ndim == 2:
+            if matrix.shape[1] == 5:
+                matrix = np.column_stack([matrix, np.zeros(len(matrix))])
+            times = matrix[:, 0]
+            times = np.where(times < 1e11, times * 1000, times).astype(np.int64)
+            return (times,) + tuple(
+                np.ascontiguousarray(matrix[:, i]) for i in range(1, 6)
+            )
+
+    rows = []
+    row_times = []
+    for bar in bars:
+        bar = bar if isinstance(bar, models.ChartBar) else models.ChartBar.from_wire(bar)
+        timestamp = bar_time(bar)
+        if timestamp is not None:
+            rows.append(bar)
+            row_times.append(timestamp)
+    times = np.array(row_times, dtype=np.float64).astype(np.int64)
+    columns = [
+        np.array([getattr(bar, name) or 0.0 for bar in rows], dtype=np.float64)
+        for name in PRICE_COLUMNS
+    ]
+    return (times,) + tuple(columns)
+
+
+class BarSeries:
+    """
+    OHLCV bars of one pair and interval as NumPy columns
+
+    Bars are kept in time order. A bar with the same time as a stored one
+    replaces it (the API keeps updating the open bar). Newer bars are
+    appended; storage grows geometrically, so appends are amortized O(1).
+    Older bars (e.g. a backfilled earlier range) are merged in, which
+    rebuilds the columns. Column properties return views of the filled part.
+    """
+
+    def __init__(self, pair_address: str, interval: str, capacity: int = 256, currency: str = "USD"):
+        """
+        Args:
+            pair_address: Pair the bars belong to
+            interval: Bar interval (see ``charts.INTERVALS``)
+            capacity: Initial number of bars allocated
+            currency: Quote currency of the prices ("USD" or "SOL")
+        """
+        _require_numpy()
+        self.pair_address = pair_address
+        self.interval = interval
+        self.currency = currency
+        self._size = 0
+        self._owned = True
+        self._data = {
+            name: np.empty(capacity, np.int64 if name == "time" else np.float64)
+            for name in COLUMNS
+        }
+
+    @classmethod
+    def from_columns(
+        cls,
+        pair_address: str,
+        interval: str,
+        columns: Dict[str, "np.ndarray"],
+        copy: bool = True,
+        currency: str = "USD",
+    ) -> "BarSeries":
+        """Build a series from time-ordered column arrays"""
+        self = cls(pair_address, interval, capacity=0, currency=currency)
+        self._data = {
+            name: np.array(columns[name], copy=True) if copy else columns[name]
+            for name in COLUMNS
+        }
+        self._size = len(self._data["time"])
+        # Views into another series' buffers are copied before being written
+        self._owned = copy
+        return self
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"BarSeries({self.pair_address!r}, {self.interval!r}, {self.currency!r}, bars={self._size})"
+
+    def column(self, name: str) -> "np.ndarray":
+        return self._data[name][: self._size]
+
+    time = property(lambda self: self.column("time"))
+    open = property(lambda self: self.column("open"))
+    high = property(lambda self: self.column("high"))
+    low = property(lambda self: self.column("low"))
+    close = property(lambda self: self.column("close"))
+    volume = property(lambda self: self.column("volume"))
+
+    @property
+    def last_time(self) -> Optional[int]:
+        return int(self._data["time"][self._size - 1]) if self._size else None
+
+    @property
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in self._data.values())
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        capacity = len(self._data["time"])
+        if needed <= capacity and self._owned:
+            return
+        capacity = max(needed, capacity * 2, 16)
+        for name, array in self._data.items():
+            grown = np.empty(capacity, array.dtype)
+            grown[: self._size] = array[: self._size]
+            self._data[name] = grown
+        self._owned = True
+
+    def append(self, time: int, open: float, high: float, low: float, close: float, volume: float = 0.0) -> bool:
+        """
+        Add one bar
+
+        Returns:
+            bool: True once stored; a bar older than the last one is merged into place
+        """
+        last = self.last_time
+        if last is not None and time < last:
+            return self.extend_columns([time], [open], [high], [low], [close], [volume]) > 0
+        if last is None or time > last:
+            self._reserve(1)
+            self._size += 1
+        elif not self._owned:
+            self._reserve(0)
+        i = self._size - 1
+        for name, value in zip(COLUMNS, (time, open, high, low, close, volume)):
+            self._data[name][i] = value
+        return True
+
+    def extend(self, bars: Iterable[Any]) -> int:
+        """Append chart bars (see ``bars_to_columns``); returns bars added or replaced"""
+        return self.extend_columns(*bars_to_columns(bars))
+
+    def extend_columns(self, time, open, high, low, close, volume) -> int:
+        """
+        Append column arrays
+
+        Input is sorted by time and de-duplicated (last copy wins). Bars
+        at the time of a stored bar replace it; bars older than the last
+        one are merged into place.
+        """
+        time = np.asarray(time, dtype=np.int64)
+        if not len(time):
+            return 0
+        columns = [time] + [np.asarray(c, dtype=np.float64) for c in (open, high, low, close, volume)]
+
+        if np.any(time[1:] <= time[:-1]):
+            order = np.argsort(time, kind="stable")
+            columns = [c[order] for c in columns]
+            time = columns[0]
+            keep = np.append(time[1:] != time[:-1], True)  # last copy of each time
+            columns = [c[keep] for c in columns]
+            time = columns[0]
+
+        last = self.last_time
+        if last is not None and time[0] < last:
+            return self._merge(columns)
+        start = self._size
+        if last is not None:
+            first = int(np.searchsorted(time, last, side="left"))
+            columns = [c[first:] for c in columns]
+            time = columns[0]
+            if len(time) and time[0] == last:
+                start -= 1
+        if not len(time):
+            return 0
+
+        self._reserve(start + len(time) - self._size)
+        for name, values in zip(COLUMNS, columns):
+            self._data[name][start : start + len(values)] = values
+        self._size = start + len(time)
+        return len(time)
+
+    def _merge(self, columns: List["np.ndarray"]) -> int:
+        """Merge sorted, de-duplicated columns reaching before the last bar"""
+        merged = [
+            np.concatenate((self.column(name), values)) for name, values in zip(COLUMNS, columns)
+        ]
+        # Stable sort keeps stored bars ahead of new ones at equal times, so the new copy wins
+        order = np.argsort(merged[0], kind="stable")
+        merged = [c[order] for c in merged]
+        keep = np.append(merged[0][1:] != merged[0][:-1], True)
+        self._data = {name: c[keep] for name, c in zip(COLUMNS, merged)}
+        self._size = len(self._data["time"])
+        self._owned = True
+        return len(columns[0])
+
+    def index(self, start: Optional[int] = None, end: Optional[int] = None) -> Tuple[int, int]:
+        """Row range of bars with ``start <= time <= end`` (binary search)"""
+        times = self.time
+        i = 0 if start is None else int(np.searchsorted(times, start, side="left"))
+        j = self._size if end is None else int(np.searchsorted(times, end, side="right"))
+        return i, max(i, j)
+
+    def slice(self, start: Optional[int] = None, end: Optional[int] = None) -> "BarSeries":
+        """Bars with ``start <= time <= end`` (ms) as a series of views, without copying"""
+        i, j = self.index(start, end)
+        return BarSeries.from_columns(
+            self.pair_address,
+            self.interval,
+            {name: self._data[name][i:j] for name in COLUMNS},
+            copy=False,
+            currency=self.currency,
+        )
+
+    def resample(self, interval: str) -> "BarSeries":
+        """
+        Aggregate into a coarser interval
+
+        Bars are grouped by ``time // interval`` boundary: first open, max
+        high, min low, last close and summed volume per group.
+        """
+        step = interval_ms(interval)
+        if not self._size:
+            return BarSeries(self.pair_address, interval, capacity=0, currency=self.currency)
+        buckets = self.time // step * step
+        starts = np.flatnonzero(np.append(True, buckets[1:] != buckets[:-1]))
+        ends = np.append(starts[1:], self._size) - 1
+        return BarSeries.from_columns(
+            self.pair_address,
+            interval,
+            {
+                "time": buckets[starts],
+                "open": self.open[starts],
+                "high": np.maximum.reduceat(self.high, starts),
+                "low": np.minimum.reduceat(self.low, starts),
+                "close": self.close[ends],
+                "volume": np.add.reduceat(self.volume, starts),
+            },
+            copy=False,
+            currency=self.currency,
+        )
+
+    def to_bars(self) -> List[models.ChartBar]:
+        """Bars as ``ChartBar`` models"""
+        columns = [self.column(name).tolist() for name in COLUMNS]
+        return [models.ChartBar(*row) for row in zip(*columns)]
+
+    def __iter__(self) -> Iterator[models.ChartBar]:
+        return iter(self.to_bars())
+
+
+class BarStore:
+    """
+    Bar series for many pairs, keyed by ``(pair_address, interval, currency)``
+
+    Pass it to ``get_pair_chart(..., store=store)`` or
+    ``fetch_chart_range(..., store=store)`` to decode bars straight into
+    columns instead of per-bar objects. USD and SOL bars of a pair are
+    kept in separate series.
+    """
+
+    def __init__(self, capacity: int = 256):
+        """
+        Args:
+            capacity: Initial bars allocated for each new series
+        """
+        _require_numpy()
+        self.capacity = capacity
+        self._series: Dict[Key, BarSeries] = {}
+
+    def series(self, pair_address: str, interval: str, currency: str = "USD") -> BarSeries:
+        """The series for a pair, interval and currency, created empty if missing"""
+        key = (pair_address, interval, currency)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = BarSeries(pair_address, interval, self.capacity, currency)
+        return series
+
+    def get(self, pair_address: str, interval: str, currency: str = "USD") -> Optional[BarSeries]:
+        return self._series.get((pair_address, interval, currency))
+
+    def add_bars(
+        self, pair_address: str, interval: str, bars: Iterable[Any], currency: str = "USD"
+    ) -> BarSeries:
+        """Append bars to a series and return it"""
+        series = self.series(pair_address, interval, currency)
+        series.extend(bars)
+        return series
+
+    def add_chart(self, pair_address: str, interval: str, chart: Any, currency: str = "USD") -> BarSeries:
+        """Append a ``get_pair_chart`` result (model, dict or bar list)"""
+        return self.add_bars(pair_address, interval, chart_bars(chart), currency)
+
+    def drop(self, pair_address: str, interval: Optional[str] = None, currency: Optional[str] = None) -> int:
+        """Remove one series, or every interval/currency of a pair; returns series removed"""
+        keys = [
+            key
+            for key in self._series
+            if key[0] == pair_address
+            and (interval is None or key[1] == interval)
+            and (currency is None or key[2] == currency)
+        ]
+        for key in keys:
+            del self._series[key]
+        return len(keys)
+
+    def keys(self) -> List[Key]:
+        return list(self._series)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._series
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(series.nbytes for series in self._series.values())
@@ -0,0 +1,279 @@
+"""
+Incremental chart synchronization
+Keeps tracked pairs' bar series current by fetching only bars newer than the last one seen
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from axiomtradeapi import models
+from axiomtradeapi.charts.fetcher import chart_bars, fetch_chart_range, interval_ms
+from axiomtradeapi.charts.store import BarSeries, BarStore
+
+# Response keys that may carry the pair's latest transaction time
+_LAST_TRANSACTION_KEYS = ("lastTransactionTime", "last_transaction_time")
+
+
+def _epoch_ms(value: Any) -> Optional[int]:
+    parsed = models.parse_timestamp(value)
+    return int(parsed.timestamp() * 1000) if parsed is not None else None
+
+
+@dataclass
+class SyncState:
+    """What the synchronizer knows about one tracked pair and interval"""
+
+    pair_address: str
+    interval: str
+    last_bar_time: Optional[int] = None  # open time of the newest stored bar (ms)
+    last_transaction_time: Optional[int] = None  # passed back as lastTransactionTime (ms)
+    open_trading: Optional[int] = None
+    activity_time: Optional[int] = None  # newest transaction seen outside polling (ms)
+    active: bool = False  # a trade was reported since the last poll started
+    synced_at: float = 0.0  # time.time() of the last successful poll
+    polls: int = 0
+    errors: int = 0
+
+
+class ChartSynchronizer:
+    """
+    Poll-based chart sync for many pairs
+
+    Each tracked ``(pair, interval)`` remembers its newest bar and last
+    transaction time. A poll requests bars from the newest stored bar
+    onwards (so a still-open bar is fetched again and replaced in place)
+    with ``lastTransactionTime`` set, and appends them to a ``BarStore``.
+    A gap longer than ``max_bars`` (e.g. after downtime) is paged through
+    with ``fetch_chart_range`` so no bars are skipped.
+
+    ``refresh_all`` polls every tracked pair that may have changed on a
+    thread pool under the client's rate limiter. Feeding transaction
+    events through ``record_event`` (e.g. as a wallet-transaction
+    callback) lets it skip pairs without trades entirely.
+    """
+
+    def __init__(
+        self,
+        client,
+        store: Optional[BarStore] = None,
+        interval: str = "1m",
+        currency: str = "USD",
+        history_bars: int = 329,
+        max_bars: int = 329,
+        max_workers: int = 8,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Args:
+            client: ``AxiomTradeClient`` used for ``get_pair_chart``
+            store: Bar store to keep series in (a new one if None)
+            interval: Default interval for ``track``
+            currency: "USD" or "SOL" for every tracked series
+            history_bars: Bars fetched on a pair's first sync
+            max_bars: Upper bound on ``countBars`` per request; longer gaps are paged
+            max_workers: Concurrent polls in ``refresh_all``
+            logger: Logger for poll errors
+        """
+        interval_ms(interval)
+        self.client = client
+        self.store = store if store is not None else BarStore()
+        self.interval = interval
+        self.currency = currency
+        self.history_bars = history_bars
+        self.max_bars = max_bars
+        self.max_workers = max_workers
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.states: Dict[Tuple[str, str], SyncState] = {}
+        self._by_pair: Dict[str, List[SyncState]] = {}
+        self._lock = threading.Lock()
+
+    def track(
+        self, pair_address: str, interval: Optional[str] = None, open_trading: Optional[int] = None
+    ) -> SyncState:
+        """Start tracking a pair (idempotent)"""
+        interval = interval or self.interval
+        interval_ms(interval)
+        key = (pair_address, interval)
+        with self._lock:
+            state = self.states.get(key)
+            if state is None:
+                state = self.states[key] = SyncState(pair_address, interval, open_trading=open_trading)
+                self._by_pair.setdefault(pair_address, []).append(state)
+                series = self.store.get(pair_address, interval, self.currency)
+                if series is not None:
+                    state.last_bar_time = series.last_time
+            elif open_trading is not None:
+                state.open_trading = open_trading
+        return state
+
+    def untrack(self, pair_address: str, interval: Optional[str] = None, drop_bars: bool = False) -> int:
+        """Stop tracking one interval of a pair, or all of them"""
+        with self._lock:
+            keys = [
+                key
+                for key in self.states
+                if key[0] == pair_address and (interval is None or key[1] == interval)
+            ]
+            for key in keys:
+                self._by_pair[pair_address].remove(self.states.pop(key))
+            if not self._by_pair.get(pair_address, True):
+                del self._by_pair[pair_address]
+        if drop_bars:
+            self.store.drop(pair_address, interval, self.currency)
+        return len(keys)
+
+    def record_transaction(self, pair_address: str, when: Any = None) -> None:
+        """Note a trade on a pair (epoch s/ms or ISO time; now if None)"""
+        timestamp = _epoch_ms(when) if when is not None else int(time.time() * 1000)
+        if timestamp is None:
+            return
+        with self._lock:
+            states = list(self._by_pair.get(pair_address, ()))
+        for state in states:
+            state.active = True
+            if state.activity_time is None or timestamp > state.activity_time:
+                state.activity_time = timestamp
+
+    def record_event(self, content: Any) -> None:
+        """Wallet-transaction callback: marks the event's pair as active"""
+        pair_address = content.get("pair_address")
+        if pair_address:
+            self.record_transaction(pair_address, content.get("created_at"))
+
+    def sync(self, pair_address: str, interval: Optional[str] = None, now_ms: Optional[int] = None) -> int:
+        """
+        Fetch bars newer than the last stored one
+
+        Every request waits for the client's ``rate_limiter`` (if any).
+
+        Returns:
+            int: Bars added or updated (the open bar counts when it changed)
+        """
+        state = self.track(pair_address, interval)
+        step = interval_ms(state.interval)
+        now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+        if state.last_bar_time is None:
+            from_ts = now_ms - step * self.history_bars
+            count_bars = self.history_bars
+        else:
+            from_ts = state.last_bar_time
+            count_bars = max(1, (now_ms - from_ts) // step + 1)
+
+        polled_at = time.time()
+        # Trades reported from here on may be missing from this response
+        state.active = False
+        try:
+            if count_bars > self.max_bars:
+                self.logger.info(
+                    f"Chart gap of {count_bars} bars for {pair_address} ({state.interval}); paging"
+                )
+                chart = fetch_chart_range(
+                    self.client,
+                    pair_address,
+                    from_ts,
+                    now_ms,
+                    interval=state.interval,
+                    currency=self.currency,
+                    count_bars=self.max_bars,
+                    max_workers=1,
+                    open_trading=state.open_trading,
+                    last_transaction_time=state.last_transaction_time,
+                )
+            else:
+                # fetch_chart_range paces its own windows; a single request is paced here
+                limiter = getattr(self.client, "rate_limiter", None)
+                if limiter is not None:
+                    limiter.acquire()
+                chart = self.client.get_pair_chart(
+                    pair_address,
+                    from_ts=from_ts,
+                    to_ts=now_ms,
+                    interval=state.interval,
+                    currency=self.currency,
+                    count_bars=count_bars,
+                    open_trading=state.open_trading,
+                    last_transaction_time=state.last_transaction_time,
+                )
+        except Exception:
+            state.active = True
+            raise
+        series = self.store.series(pair_address, state.interval, self.currency)
+        updated = series.extend(chart_bars(chart))
+
+        state.polls += 1
+        state.synced_at = polled_at
+        state.last_bar_time = series.last_time
+        last_transaction = self._last_transaction_time(chart)
+        if last_transaction is None:
+            last_transaction = state.activity_time
+        if last_transaction is not None:
+            state.last_transaction_time = last_transaction
+        return updated
+
+    @staticmethod
+    def _last_transaction_time(chart: Any) -> Optional[int]:
+        if not hasattr(chart, "get"):
+            return None
+        for key in _LAST_TRANSACTION_KEYS:
+            value = chart.get(key)
+            if value is not None:
+                return _epoch_ms(value)
+        return None
+
+    def due(self, only_active: bool = False) -> List[SyncState]:
+        """Tracked series to poll: all of them, or only never-synced and active ones"""
+        with self._lock:
+            states = list(self.states.values())
+        if not only_active:
+            return states
+        return [state for state in states if not state.polls or state.active]
+
+    def refresh_all(self, only_active: bool = False) -> Dict[Tuple[str, str], int]:
+        """
+        Poll every due pair concurrently
+
+        Args:
+            only_active: Poll only pairs with trades reported through
+                         ``record_transaction``/``record_event`` since their
+                         last sync (plus never-synced ones)
+
+        Returns:
+            Dict mapping ``(pair, interval)`` to bars added or updated;
+            failed polls are logged, counted in ``SyncState.errors`` and omitted
+        """
+        states = self.due(only_active)
+        if not states:
+            return {}
+        now_ms = int(time.time() * 1000)
+
+        def poll(state: SyncState) -> Optional[int]:
+            # sync() acquires the client's rate limiter once per request
+            try:
+                return self.sync(state.pair_address, state.interval, now_ms)
+            except Exception as e:
+                state.errors += 1
+                self.logger.error(f"Chart sync for {state.pair_address} ({state.interval}) failed: {e}")
+                return None
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(states)), thread_name_prefix="axiom-chart-sync"
+        ) as executor:
+            results = list(executor.map(poll, states))
+        return {
+            (state.pair_address, state.interval): updated
+            for state, updated in zip(states, results)
+            if updated is not None
+        }
+
+    def series(self, pair_address: str, interval: Optional[str] = None) -> Optional[BarSeries]:
+        return self.store.get(pair_address, interval or self.interval, self.currency)
+
+    def track_many(self, pair_addresses: Iterable[str], interval: Optional[str] = None) -> int:
+        for pair_address in pair_addresses:
+            self.track(pair_address, interval)
+        return len(self.states)
@@ -4,8 +4,11 @@ from typing import Dict, Optional, Union
 
 import requests
 
+from . import codec, models
 from .auth.auth_manager import AuthManager
+from .charts.fetcher import fetch_chart_range
 from .content.endpoints import Endpoints
+from .ratelimit import RateLimiter
 
 # Trading-related imports
 try:
@@ -38,6 +41,8 @@ class AxiomTradeClient:
         refresh_token: str = None,
         storage_dir: str = None,
         use_saved_tokens: bool = True,
+        raw_responses: bool = True,
+        rate_limit: Optional[float] = 10.0,
     ):
         """
         Initialize AxiomTradeClient with enhanced authentication
@@ -49,6 +54,10 @@ class AxiomTradeClient:
             refresh_token: Existing refresh token (optional)
             storage_dir: Directory for secure token storage
             use_saved_tokens: Whether to load/save tokens automatically (default: True)
+            raw_responses: Return plain dicts/lists (default: True); set False to get
+                           typed, dict-compatible models from the decoding endpoints
+            rate_limit: Requests per second for bulk helpers such as
+                        fetch_chart_range (None disables limiting)
         """
         # Initialize the enhanced auth manager
         self.auth_manager = AuthManager(
@@ -66,6 +75,12 @@ class AxiomTradeClient:
         # Keep backward compatibility
         self.auth = self.auth_manager  # For legacy code
 
+        # Typed models are opt-in; existing callers keep getting plain JSON
+        self.raw_responses = raw_responses
+
+        # Shared by concurrent bulk requests so they stay under the API's limits
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+
         # Setup logging
         self.logger = logging.getLogger(__name__)
 
@@ -197,6 +212,10 @@ class AxiomTradeClient:
         """Get detailed information about current tokens"""
         return self.auth_manager.get_token_info()
 
+    def _decode_response(self, response: requests.Response, model):
+        """Decode a response body into ``model`` (or a raw dict if configured)"""
+        return models.decode(model, codec.response_json(response), self.raw_responses)
+
     def get_trending_tokens(self, time_period: str = "1h") -> Dict:
         """
         Get trending meme tokens
@@ -211,7 +230,7 @@ class AxiomTradeClient:
         try:
             response = self.auth_manager.make_authenticated_request("GET", url)
             response.raise_for_status()
-            return response.json()
+            return codec.response_json(response)
         except Exception as e:
             raise Exception(f"Failed to get trending tokens: {e}")
 
@@ -229,7 +248,7 @@ class AxiomTradeClient:
         try:
             response = self.auth_manager.make_authenticated_request("GET", url)
             response.raise_for_status()
-            return response.json()
+            return codec.response_json(response)
         except Exception as e:
             raise Exception(f"Failed to get token info: {e}")
 
@@ -246,7 +265,7 @@ class AxiomTradeClient:
         try:
             response = self.auth_manager.make_authenticated_request("GET", url)
             response.raise_for_status()
-            return response.json()
+            return codec.response_json(response)
         except Exception as e:
             raise Exception(f"Failed to get portfolio: {e}")
 
@@ -269,7 +288,7 @@ class AxiomTradeClient:
         try:
             response = self.auth_manager.make_authenticated_request("GET", url)
             response.raise_for_status()
-            return response.json()
+            return codec.response_json(response)
         except Exception as e:
             raise Exception(f"Failed to get token info: {e}")
 
@@ -292,7 +311,7 @@ class AxiomTradeClient:
         try:
             response = self.auth_manager.make_authenticated_request("GET", url)
             response.raise_for_status()
-            return response.json()
+            return codec.response_json(response)
         except Exception as e:
             raise Exception(f"Failed to get last transaction: {e}")
 
@@ -304,7 +323,7 @@ class AxiomTradeClient:
             pair_address (str): The pair address to get info for
 
         Returns:
-            Dict: Pair information
+            Dict: Pair information (a PairInfo model if raw_responses is False)
         """
         # Ensure we have valid authentication
         if not self.ensure_authenticated():
@@ -315,7 +334,7 @@ class AxiomTradeClient:
         try:
             response = self.auth_manager.make_authenticated_request("GET", url)
             response.raise_for_status()
-            return response.json()
+            return self._decode_response(response, models.PairInfo)
         except Exception as e:
             raise Exception(f"Failed to get pair info: {e}")
 
@@ -327,7 +346,7 @@ class AxiomTradeClient:
             pair_address (str): The pair address to get stats for
 
         Returns:
-            Dict: Pair statistics
+            Dict: Pair statistics (a PairStats model if raw_responses is False)
         """
         # Ensure we have valid authentication
         if not self.ensure_authenticated():
@@ -338,7 +357,7 @@ class AxiomTradeClient:
         try:
             response = self.auth_manager.make_authenticated_request("GET", url)
             response.raise_for_status()
-            return response.json()
+            return self._decode_response(response, models.PairStats)
         except Exception as e:
             raise Exception(f"Failed to get pair stats: {e}")
 
@@ -361,7 +380,7 @@ class AxiomTradeClient:
         try:
             response = self.auth_manager.make_authenticated_request("GET", url)
             response.raise_for_status()
-            return response.json()
+            return codec.response_json(response)
         except Exception as e:
             raise Exception(f"Failed to get open positions: {e}")
 
@@ -376,7 +395,7 @@ class AxiomTradeClient:
             only_tracked_wallets (bool): Whether to only include tracked wallets
 
         Returns:
-            Dict: Holder data information
+            Holder data (Holder models if raw_responses is False)
         """
         # Ensure we have valid authentication
         if not self.ensure_authenticated():
@@ -387,7 +406,7 @@ class AxiomTradeClient:
         try:
             response = self.auth_manager.make_authenticated_request("GET", url)
             response.raise_for_status()
-            return response.json()
+            return self._decode_response(response, models.Holder)
         except Exception as e:
             raise Exception(f"Failed to get holder data: {e}")
 
@@ -410,7 +429,7 @@ class AxiomTradeClient:
         try:
             response = self.auth_manager.make_authenticated_request("GET", url)
             response.raise_for_status()
-            return response.json()
+            return codec.response_json(response)
         except Exception as e:
             raise Exception(f"Failed to get dev tokens: {e}")
 
@@ -425,7 +444,7 @@ class AxiomTradeClient:
         try:
             response = self.auth_manager.make_authenticated_request("GET", url)
             response.raise_for_status()
-            return response.json()
+            return codec.response_json(response)
         except Exception as e:
             raise Exception(f"Failed to get twitter community info: {e}")
 
@@ -441,9 +460,19 @@ class AxiomTradeClient:
         is_new: bool = False,
         open_trading: Optional[int] = None,
         last_transaction_time: Optional[int] = None,
+        store=None,
     ) -> Dict:
         """
         Get pair chart (OHLC bars) for a given pair address
+
+        Args:
+            store: Optional ``charts.BarStore``; bars are decoded straight
+                   into its columnar series for this pair, interval and currency
+
+        Returns:
+            Chart data with bars (a PairChart, or a list of ChartBar for list-shaped
+            responses, if raw_responses is False),
+            or the updated ``BarSeries`` when ``store`` is given
         """
 
         if not self.ensure_authenticated():
@@ -469,10 +498,65 @@ class AxiomTradeClient:
         try:
             response = self.auth_manager.make_authenticated_request("GET", url)
             response.raise_for_status()
-            return response.json()
+            if store is not None:
+                return store.add_chart(pair_address, interval, codec.response_json(response), currency)
+            return self._decode_response(response, models.PairChart)
         except Exception as e:
             raise Exception(f"Failed to get pair chart: {e}")
 
+    def fetch_chart_range(
+        self,
+        pair_address: str,
+        start: int,
+        end: int,
+        interval: str = "1m",
+        currency: str = "USD",
+        count_bars: int = 329,
+        max_workers: int = 4,
+        store=None,
+        cache=None,
+        **chart_kwargs,
+    ) -> Dict:
+        """
+        Get every chart bar between two timestamps
+
+        The range is split into ``count_bars``-sized windows that are fetched
+        concurrently under ``rate_limiter``; bars shared by adjacent windows
+        are kept once.
+
+        Args:
+            pair_address (str): The pair address to get bars for
+            start (int): Range start, epoch milliseconds
+            end (int): Range end, epoch milliseconds
+            interval (str): Bar interval, e.g. "1s", "1m", "5m", "1h"
+            max_workers (int): Concurrent requests
+            store (BarStore): Optional columnar store to append the bars to
+            cache (BarCache): Optional on-disk cache; only ranges it does not
+                              cover are requested
+
+        Returns:
+            ``{"bars": [...]}`` with time-ordered bars (a PairChart if raw_responses is False),
+            or the updated ``BarSeries`` when ``store`` is given
+        """
+        try:
+            return fetch_chart_range(
+                self,
+                pair_address,
+                start,
+                end,
+                interval=interval,
+                currency=currency,
+                count_bars=count_bars,
+                max_workers=max_workers,
+                store=store,
+                cache=cache,
+                **chart_kwargs,
+            )
+        except ValueError:
+            raise
+        except Exception as e:
+            raise Exception(f"Failed to fetch chart range: {e}")
+
     def get_twitter_user_info(self, twitter_handle: str) -> Dict:
         """
         Get Twitter user info by handle
@@ -486,7 +570,7 @@ class AxiomTradeClient:
         try:
             response = self.auth_manager.make_authenticated_request("GET", url)
             response.raise_for_status()
-            return response.json()
+            return codec.response_json(response)
         except Exception as e:
             raise Exception(f"Failed to get twitter user info: {e}")
 
@@ -501,7 +585,7 @@ class AxiomTradeClient:
         try:
             response = self.auth_manager.make_authenticated_request("GET", url)
             response.raise_for_status()
-            return response.json()
+            return codec.response_json(response)
         except Exception as e:
             raise Exception(f"Failed to get tweet info: {e}")
 
@@ -525,7 +609,7 @@ class AxiomTradeClient:
         try:
             response = self.auth_manager.make_authenticated_request("GET", url)
             response.raise_for_status()
-            return response.json()
+            return codec.response_json(response)
         except Exception as e:
             raise Exception(f"Failed to get token analysis: {e}")
 
@@ -582,7 +666,7 @@ class AxiomTradeClient:
             response = requests.post(rpc_url, headers=headers, json=payload, timeout=30)
 
             if response.status_code == 200:
-                result = response.json()
+                result = codec.response_json(response)
                 if "result" in result:
                     signature = result["result"]
                     self.logger.info(
@@ -719,7 +803,7 @@ class AxiomTradeClient:
             )
 
             if response.status_code == 200:
-                result = response.json()
+                result = codec.response_json(response)
                 if "result" in result:
                     tx_signature = result["result"]
                     self.logger.info(
@@ -859,7 +943,7 @@ class AxiomTradeClient:
             )
 
             if response.status_code == 200:
-                result = response.json()
+                result = codec.response_json(response)
                 if "result" in result:
                     tx_signature = result["result"]
                     self.logger.info(
@@ -915,7 +999,7 @@ class AxiomTradeClient:
             )
 
             if response.status_code == 200:
-                result = response.json()
+                result = codec.response_json(response)
                 balance = result.get("balance", 0)
                 self.logger.info(f"Token balance for {token_mint}: {balance}")
                 return float(balance)
@@ -952,7 +1036,7 @@ class AxiomTradeClient:
             )
 
             if response.status_code == 200:
-                result = response.json()
+                result = codec.response_json(response)
                 balance = result.get("balance", 0)
                 self.logger.info(f"SOL balance for {wallet_address}: {balance}")
                 return float(balance)
@@ -1012,7 +1096,7 @@ class AxiomTradeClient:
             )
 
             if response.status_code == 200:
-                result = response.json()
+                result = codec.response_json(response)
                 if "result" in result:
                     signature = result["result"]
                     self.logger.info(
@@ -1115,7 +1199,7 @@ class AxiomTradeClient:
             )
 
             if response.status_code == 200:
-                result = response.json()
+                result = codec.response_json(response)
                 signature = result.get("signature", "")
                 self.logger.info(
                     f"Transaction sent successfully. Signature: {signature}"
@@ -0,0 +1,191 @@
+"""
+JSON codec for Axiom Trade API
+Selects the fastest available JSON backend (orjson, msgspec, stdlib json) at import time
+"""
+
+import json
+import os
+import re
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+
+class StdlibCodec:
+    """JSON codec backed by the standard library ``json`` module"""
+
+    name = "json"
+    decode_errors = (json.JSONDecodeError,)
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+    def loads(self, data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        if not isinstance(data, str):
+            data = bytes(data).decode("utf-8")
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj)
+
+
+class OrjsonCodec:
+    """JSON codec backed by ``orjson``"""
+
+    name = "orjson"
+    decode_errors = (json.JSONDecodeError,)  # orjson.JSONDecodeError subclasses it
+
+    def __init__(self):
+        if not ORJSON_AVAILABLE:
+            raise ImportError("orjson library not installed. Run: pip install orjson")
+        self.loads = orjson.loads
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+
+class MsgspecCodec:
+    """JSON codec backed by ``msgspec.json``"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        if not MSGSPEC_AVAILABLE:
+            raise ImportError("msgspec library not installed. Run: pip install msgspec")
+        self.decode_errors = (msgspec.DecodeError,)
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+        self.loads = self._decoder.decode
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode("utf-8")
+
+
+_BACKENDS = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": StdlibCodec,
+}
+
+# Preference order used when no backend is forced
+_PREFERENCE = ("orjson", "msgspec", "json")
+
+
+def available_codecs() -> Dict[str, Any]:
+    """
+    Instantiate every JSON backend that can be imported
+
+    Returns:
+        dict: Backend name -> codec instance, in preference order
+    """
+    codecs = {}
+    for name in _PREFERENCE:
+        try:
+            codecs[name] = _BACKENDS[name]()
+        except ImportError:
+            continue
+    return codecs
+
+
+def get_codec(name: str = None):
+    """
+    Get a codec instance by backend name
+
+    Args:
+        name: "orjson", "msgspec" or "json". If omitted, the fastest
+              installed backend is used. The AXIOMTRADEAPI_JSON environment
+              variable can force a backend.
+
+    Returns:
+        Codec instance with ``loads``, ``dumps`` and ``decode_errors``
+
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If an explicitly requested backend is not installed
+    """
+    name = name or os.environ.get("AXIOMTRADEAPI_JSON")
+    if name:
+        if name not in _BACKENDS:
+            raise ValueError(
+                f"Unknown JSON backend '{name}'. Choose from: {', '.join(_PREFERENCE)}"
+            )
+        return _BACKENDS[name]()
+
+    for backend in _PREFERENCE:
+        try:
+            return _BACKENDS[backend]()
+        except ImportError:
+            continue
+    return StdlibCodec()
+
+
+# Module-level codec, selected once at import time
+codec = get_codec()
+
+BACKEND = codec.name
+loads = codec.loads
+dumps = codec.dumps
+
+# Exceptions raised by ``loads`` on malformed input; usable in ``except`` clauses
+DecodeError = codec.decode_errors
+
+
+def response_json(response) -> Any:
+    """
+    Decode the body of a ``requests.Response`` with the selected codec
+
+    Equivalent to ``response.json()`` but uses the fast backend.
+    """
+    return loads(response.content)
+
+
+_ROOM_PREFIXES = ('{"room":"', '{"room": "')
+_ROOM_PREFIXES_BYTES = (b'{"room":"', b'{"room": "')
+_ROOM_PATTERN = re.compile(r'"room"\s*:\s*"([^"\\]*)"')
+_ROOM_PATTERN_BYTES = re.compile(rb'"room"\s*:\s*"([^"\\]*)"')
+
+
+def peek_room(frame: Union[str, bytes]) -> Optional[str]:
+    """
+    Extract the ``room`` of a WebSocket frame without decoding it
+
+    Axiom frames look like ``{"room":"<name>","content":{...}}``, so the
+    room is normally read straight from the frame prefix. Other layouts
+    fall back to a regex scan. Returns None when the room cannot be read
+    unambiguously (escaped characters, several ``"room"`` keys), in which
+    case the caller should fully decode the frame.
+    """
+    if isinstance(frame, str):
+        if frame.startswith(_ROOM_PREFIXES):
+            start = 9 if frame[8] == '"' else 10
+            end = frame.find('"', start)
+            if end != -1 and "\\" not in frame[start:end]:
+                return frame[start:end]
+        if frame.count('"room"') != 1:
+            return None
+        match = _ROOM_PATTERN.search(frame)
+        return match.group(1) if match else None
+
+    frame = bytes(frame)
+    if frame.startswith(_ROOM_PREFIXES_BYTES):
+        start = 9 if frame[8:9] == b'"' else 10
+        end = frame.find(b'"', start)
+        if end != -1 and b"\\" not in frame[start:end]:
+            return frame[start:end].decode("utf-8")
+    if frame.count(b'"room"') != 1:
+        return None
+    match = _ROOM_PATTERN_BYTES.search(frame)
+    return match.group(1).decode("utf-8") if match else None
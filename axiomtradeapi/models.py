@@ -0,0 +1,459 @@
+"""
+Typed response models for Axiom Trade API
+Slotted, schema-driven wrappers around decoded JSON with lazy nested objects
+"""
+
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+_SCALAR = 0
+_TIMESTAMP = 1
+_NESTED = 2
+_NESTED_LIST = 3
+
+_UNSET = object()
+_NO_KEYS = frozenset()
+
+
+class Field:
+    """Schema entry mapping a wire key to a model attribute"""
+
+    __slots__ = ("attr", "key", "kind", "model", "slot")
+
+    def __init__(self, attr: str, key: str = None, kind: int = _SCALAR, model=None):
+        self.attr = attr
+        self.key = key or attr
+        self.kind = kind
+        self.model = model
+        # Lazy fields keep their wire value in a private slot behind a descriptor
+        self.slot = attr if kind == _SCALAR else "_" + attr
+
+
+def timestamp(attr: str, key: str = None) -> Field:
+    """ISO-8601 field parsed into a ``datetime`` on first attribute access"""
+    return Field(attr, key, _TIMESTAMP)
+
+
+def nested(attr: str, key: str, model) -> Field:
+    """Object field materialized into ``model`` on first access"""
+    return Field(attr, key, _NESTED, model)
+
+
+def nested_list(attr: str, key: str, model) -> Field:
+    """List field materialized into a tuple of ``model`` on first access"""
+    return Field(attr, key, _NESTED_LIST, model)
+
+
+def _slots(*fields: Field) -> tuple:
+    slots = [f.slot for f in fields]
+    slots.extend(f.slot + "_parsed" for f in fields if f.kind == _TIMESTAMP)
+    return tuple(slots)
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """
+    Parse an Axiom timestamp into an aware UTC ``datetime``
+
+    Accepts ISO-8601 strings (with ``Z`` or an explicit offset) and epoch
+    numbers in seconds or milliseconds. Returns None if unparseable.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        if value > 1e11:  # milliseconds
+            value = value / 1000
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    try:
+        text = value[:-1] + "+00:00" if value.endswith("Z") else value
+        parsed = datetime.fromisoformat(text)
+    except (AttributeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class _LazyField:
+    """Descriptor that converts a wire value once and caches the result"""
+
+    __slots__ = ("field", "cache")
+
+    def __init__(self, field: Field):
+        self.field = field
+        self.cache = field.slot + "_parsed"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        field = self.field
+        if field.kind == _TIMESTAMP:
+            value = getattr(obj, self.cache)
+            if value is _UNSET:
+                value = parse_timestamp(getattr(obj, field.slot))
+                setattr(obj, self.cache, value)
+            return value
+
+        value = getattr(obj, field.slot)
+        if field.kind == _NESTED:
+            if type(value) is dict:
+                value = field.model.from_dict(value)
+                setattr(obj, field.slot, value)
+        elif type(value) is list:
+            value = tuple(field.model.from_wire(item) for item in value)
+            setattr(obj, field.slot, value)
+        return value
+
+
+class Model(Mapping):
+    """
+    Base class for typed response models
+
+    Fields are declared once in ``_fields``. Scalars are copied into slots,
+    timestamps are parsed on first attribute access, and nested objects are
+    only materialized when read. Models also behave as read-only mappings
+    keyed by the original wire names, so ``model.get("pairAddress")`` keeps
+    working for code written against raw dicts. Keys that are not part of
+    the schema are kept and remain reachable through mapping access.
+    """
+
+    __slots__ = ("_missing", "_extra")
+    _fields = ()
+    _repr_fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._by_key = {f.key: f for f in cls._fields}
+        cls._keys = frozenset(cls._by_key)
+        cls._cache_slots = tuple(
+            f.slot + "_parsed" for f in cls._fields if f.kind == _TIMESTAMP
+        )
+        for f in cls._fields:
+            if f.kind != _SCALAR:
+                setattr(cls, f.attr, _LazyField(f))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Model":
+        """Build a model from a decoded JSON object"""
+        self = object.__new__(cls)
+        get = data.get
+        for f in cls._fields:
+            setattr(self, f.slot, get(f.key))
+        for slot in cls._cache_slots:
+            setattr(self, slot, _UNSET)
+
+        keys = data.keys()
+        self._missing = cls._keys.difference(keys) or _NO_KEYS
+        present = len(cls._keys) - len(self._missing)
+        self._extra = {k: data[k] for k in keys - cls._keys} if len(keys) > present else None
+        return self
+
+    @classmethod
+    def from_wire(cls, data: Any) -> Any:
+        """Decode an object, a list of objects, or pass anything else through"""
+        if type(data) is dict:
+            return cls.from_dict(data)
+        if type(data) is list:
+            return [cls.from_wire(item) for item in data]
+        return data
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to the raw wire representation"""
+        result = {}
+        for f in self._fields:
+            if f.key in self._missing:
+                continue
+            value = getattr(self, f.slot)
+            if isinstance(value, (Model, ChartBar)):
+                value = value.to_dict()
+            elif type(value) is tuple and f.kind == _NESTED_LIST:
+                value = [
+                    item.to_dict() if isinstance(item, (Model, ChartBar)) else item
+                    for item in value
+                ]
+            result[f.key] = value
+        if self._extra:
+            result.update(self._extra)
+        return result
+
+    def __getitem__(self, key: str) -> Any:
+        field = self._by_key.get(key)
+        if field is None:
+            if self._extra and key in self._extra:
+                return self._extra[key]
+            raise KeyError(key)
+        if key in self._missing:
+            raise KeyError(key)
+        if field.kind == _NESTED or field.kind == _NESTED_LIST:
+            return getattr(self, field.attr)
+        return getattr(self, field.slot)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._by_key:
+            return key not in self._missing
+        return bool(self._extra) and key in self._extra
+
+    def __iter__(self):
+        for f in self._fields:
+            if f.key not in self._missing:
+                yield f.key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return len(self._keys) - len(self._missing) + len(self._extra or ())
+
+    def __repr__(self) -> str:
+        parts = ", ".join(
+            f"{attr}={getattr(self, attr)!r}" for attr in self._repr_fields
+        )
+        return f"{type(self).__name__}({parts})"
+
+
+class ChartBar:
+    """
+    Single OHLCV bar from ``get_pair_chart``
+
+    Bars arrive either as ``[time, open, high, low, close, volume]`` arrays
+    or as objects; both index by position and by name.
+    """
+
+    __slots__ = ("time", "open", "high", "low", "close", "volume")
+
+    _NAMES = ("time", "open", "high", "low", "close", "volume")
+    _ALIASES = {"t": "time", "o": "open", "h": "high", "l": "low", "c": "close", "v": "volume"}
+
+    def __init__(self, time, open, high, low, close, volume=0.0):
+        self.time = time
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    @classmethod
+    def from_wire(cls, data: Any) -> "ChartBar":
+        if isinstance(data, (list, tuple)):
+            return cls(*data[:6])
+        get = data.get
+        return cls(
+            get("time", get("t")),
+            get("open", get("o")),
+            get("high", get("h")),
+            get("low", get("l")),
+            get("close", get("c")),
+            get("volume", get("v", 0.0)),
+        )
+
+    from_dict = from_wire
+
+    @property
+    def timestamp(self) -> Optional[datetime]:
+        return parse_timestamp(self.time)
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return getattr(self, self._NAMES[key])
+        return getattr(self, self._ALIASES.get(key, key))
+
+    def __iter__(self):
+        return iter((self.time, self.open, self.high, self.low, self.close, self.volume))
+
+    def __len__(self) -> int:
+        return 6
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ChartBar):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(self._NAMES, self))
+
+    def __repr__(self) -> str:
+        return (
+            f"ChartBar(time={self.time!r}, open={self.open!r}, high={self.high!r}, "
+            f"low={self.low!r}, close={self.close!r}, volume={self.volume!r})"
+        )
+
+
+class ProtocolDetails(Model):
+    """AMM account details of a pair (``protocolDetails``)"""
+
+    _fields = (
+        Field("pair_sol_account", "pairSolAccount"),
+        Field("token_program", "tokenProgram"),
+        Field("pair_token_account", "pairTokenAccount"),
+        Field("is_token_side_x", "isTokenSideX"),
+    )
+    __slots__ = _slots(*_fields)
+    _repr_fields = ("pair_sol_account", "pair_token_account")
+
+
+class TransactionPair(Model):
+    """Pair summary embedded in wallet transaction events (``pair``)"""
+
+    _fields = (
+        Field("token_address", "tokenAddress"),
+        Field("token_name", "tokenName"),
+        Field("token_ticker", "tokenTicker"),
+        Field("token_image", "tokenImage"),
+        Field("protocol"),
+        nested("protocol_details", "protocolDetails", ProtocolDetails),
+        Field("supply"),
+        Field("token_decimals", "tokenDecimals"),
+        timestamp("pair_created_at", "pairCreatedAt"),
+        Field("extra"),
+    )
+    __slots__ = _slots(*_fields)
+    _repr_fields = ("token_address", "token_ticker", "protocol")
+
+
+class WalletTransaction(Model):
+    """Trade event from a ``v:<wallet>`` room"""
+
+    _fields = (
+        timestamp("created_at"),
+        Field("liquidity_sol"),
+        Field("liquidity_token"),
+        Field("maker_address"),
+        Field("price_sol"),
+        Field("price_usd"),
+        Field("signature"),
+        Field("token_amount"),
+        Field("total_sol"),
+        Field("total_usd"),
+        Field("type"),
+        Field("pair_address"),
+        Field("f"),
+        nested("pair", "pair", TransactionPair),
+    )
+    __slots__ = _slots(*_fields)
+    _repr_fields = ("type", "pair_address", "total_sol", "signature")
+
+    @property
+    def is_buy(self) -> bool:
+        return self.type == "buy"
+
+
+class NewPair(Model):
+    """Content of a ``new_pairs`` event"""
+
+    _fields = (
+        Field("pair_address"),
+        Field("token_address"),
+        Field("deployer_address"),
+        Field("token_name"),
+        Field("token_ticker"),
+        Field("token_image"),
+        Field("token_decimals"),
+        Field("protocol"),
+        Field("protocol_details"),
+        timestamp("created_at"),
+        Field("initial_liquidity_sol"),
+        Field("initial_liquidity_token"),
+        Field("supply"),
+        Field("dev_holds_percent"),
+        Field("top_10_holders"),
+        Field("lp_burned"),
+        Field("twitter"),
+        Field("telegram"),
+        Field("website"),
+        Field("discord"),
+    )
+    __slots__ = _slots(*_fields)
+    _repr_fields = ("token_ticker", "pair_address", "protocol")
+
+
+class PairInfo(Model):
+    """Response of ``get_pair_info``"""
+
+    _fields = (
+        Field("pair_address", "pairAddress"),
+        Field("token_address", "tokenAddress"),
+        Field("deployer_address", "deployerAddress"),
+        Field("token_name", "tokenName"),
+        Field("token_ticker", "tokenTicker"),
+        Field("token_image", "tokenImage"),
+        Field("token_decimals", "tokenDecimals"),
+        Field("protocol"),
+        nested("protocol_details", "protocolDetails", ProtocolDetails),
+        Field("supply"),
+        timestamp("created_at", "createdAt"),
+        Field("initial_liquidity_sol", "initialLiquiditySol"),
+        Field("initial_liquidity_token", "initialLiquidityToken"),
+        Field("lp_burned", "lpBurned"),
+        Field("top10_holders", "top10Holders"),
+        Field("dex_paid", "dexPaid"),
+        Field("website"),
+        Field("twitter"),
+        Field("telegram"),
+        Field("discord"),
+    )
+    __slots__ = _slots(*_fields)
+    _repr_fields = ("token_ticker", "pair_address", "protocol")
+
+
+class PairStats(Model):
+    """Response of ``get_pair_stats``"""
+
+    _fields = (
+        Field("pair_address", "pairAddress"),
+        Field("buy_count", "buyCount"),
+        Field("sell_count", "sellCount"),
+        Field("buy_volume", "buyVolume"),
+        Field("sell_volume", "sellVolume"),
+        Field("price_change", "priceChange"),
+        timestamp("updated_at", "updatedAt"),
+    )
+    __slots__ = _slots(*_fields)
+    _repr_fields = ("pair_address", "buy_count", "sell_count")
+
+
+class Holder(Model):
+    """Single holder entry of ``get_holder_data``"""
+
+    _fields = (
+        Field("wallet_address", "walletAddress"),
+        Field("token_balance", "tokenBalance"),
+        Field("sol_balance", "solBalance"),
+        Field("is_dev", "isDev"),
+        Field("is_insider", "isInsider"),
+        Field("is_sniper", "isSniper"),
+        Field("is_bundler", "isBundler"),
+        Field("is_tracked_wallet", "isTrackedWallet"),
+    )
+    __slots__ = _slots(*_fields)
+    _repr_fields = ("wallet_address", "token_balance")
+
+
+class PairChart(Model):
+    """Response of ``get_pair_chart``"""
+
+    _fields = (nested_list("bars", "bars", ChartBar),)
+    __slots__ = _slots(*_fields)
+
+    @classmethod
+    def from_wire(cls, data: Any) -> Any:
+        # Some chart responses are a bare list of bars; keep them list-shaped
+        if type(data) is list:
+            return [ChartBar.from_wire(bar) for bar in data]
+        return super().from_wire(data)
+
+    def __repr__(self) -> str:
+        return f"PairChart(bars={len(self.bars or ())})"
+
+
+def decode(model, data: Any, raw: bool = False) -> Any:
+    """
+    Decode JSON data into ``model`` unless ``raw`` is requested
+
+    Args:
+        model: Model class to build
+        data: Decoded JSON (object, list of objects, or anything else)
+        raw: Return ``data`` untouched
+
+    Returns:
+        Model instance, list of model instances, or ``data`` as-is
+    """
+    if raw:
+        return data
+    return model.from_wire(data)
@@ -0,0 +1,23 @@
+"""
+WebSocket streaming for Axiom Trade API
+"""
+
+from .capture import CaptureWriter, read_capture
+from .clusters import ClusterProbe, ClusterSelector, rank_clusters
+from .continuity import ContinuityTracker, last_transaction_backfill
+from .latency import LatencyTracker
+from .profiles import PROFILES, ConnectionProfile, install_uvloop
+from ._client import AxiomTradeWebSocketClient
+from .dedup import DedupWindow
+from .redundant import RedundantWebSocketClient
+from .threaded import ThreadedWebSocketClient
+from .warmup import WarmUpReport, warm_up_feeds
+from .watchdog import LoopWatchdog
+
+__all__ = ['AxiomTradeWebSocketClient', 'CaptureWriter', 'read_capture', 'LatencyTracker',
+           'RedundantWebSocketClient', 'DedupWindow',
+           'ClusterSelector', 'ClusterProbe', 'rank_clusters',
+           'warm_up_feeds', 'WarmUpReport', 'LoopWatchdog',
+           'ContinuityTracker', 'last_transaction_backfill',
+           'ConnectionProfile', 'PROFILES', 'install_uvloop',
+           'ThreadedWebSocketClient']
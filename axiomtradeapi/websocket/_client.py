@@ -1,16 +1,64 @@
-import json
+import asyncio
+import functools
 import logging
-from typing import Any, Callable, Dict, Optional
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import websockets
 
+from axiomtradeapi import codec
+from axiomtradeapi.models import NewPair, WalletTransaction
+from axiomtradeapi.websocket.capture import CaptureWriter, read_capture
+from axiomtradeapi.websocket.clusters import ClusterSelector
+from axiomtradeapi.websocket.continuity import ContinuityTracker
+from axiomtradeapi.websocket.dedup import DedupWindow
+from axiomtradeapi.websocket.dispatch import SyncCallbackRunner, is_async_callback
+from axiomtradeapi.websocket.latency import LatencyTracker
+from axiomtradeapi.websocket.profiles import (
+    UVLOOP_AVAILABLE,
+    ConnectionProfile,
+    get_profile,
+    running_uvloop,
+)
+from axiomtradeapi.websocket.watchdog import LoopWatchdog
+
 
 class AxiomTradeWebSocketClient:
-    def __init__(self, auth_manager, log_level=logging.INFO) -> None:
+    # Gap between recorded frames (seconds) treated as an idle socket on replay
+    REPLAY_IDLE_GAP = 0.001
+    # Seconds during which frames seen on the old socket are filtered after a migration
+    MIGRATION_OVERLAP = 5.0
+
+    def __init__(
+        self,
+        auth_manager,
+        log_level=logging.INFO,
+        raw_events: bool = True,
+        conflate_rooms: Optional[Iterable[str]] = None,
+        track_latency: bool = False,
+        clock_offset: Optional[float] = None,
+        cluster_selector: Optional[ClusterSelector] = None,
+        max_rooms: Optional[int] = 1000,
+        watchdog: Optional[LoopWatchdog] = None,
+        callback_executor: Union[str, Executor] = "thread",
+        callback_workers: int = 4,
+        callback_max_pending: Optional[int] = 10000,
+        continuity: Optional[ContinuityTracker] = None,
+        profile: Union[str, ConnectionProfile, None] = None,
+    ) -> None:
         self.ws_url = "wss://cluster-euc2.axiom.trade/"
         self.ws_url_token_price = "wss://socket8.axiom.trade/"
         self.ws_url_sol_price = "wss://cluster8.axiom.trade/"
         self.ws: Optional[websockets.WebSocketClientProtocol] = None
+        self.current_url: Optional[str] = None
+
+        # Optional RTT-based cluster selection for the main feed (ws_url)
+        self.cluster_selector = cluster_selector
+        self._cluster_task: Optional[asyncio.Future] = None
+
+        # Rooms joined on the current socket, replayed when migrating
+        self._joined_rooms: Dict[str, None] = {}
 
         if not auth_manager:
             raise ValueError(
@@ -19,6 +67,10 @@ class AxiomTradeWebSocketClient:
 
         self.auth_manager = auth_manager
 
+        # new_pairs and wallet transaction content is delivered as plain dicts
+        # unless typed models are requested (raw_events=False)
+        self.raw_events = raw_events
+
         # Setup logging
         self.logger = logging.getLogger("AxiomTradeWebSocket")
         self.logger.setLevel(log_level)
@@ -35,6 +87,66 @@ class AxiomTradeWebSocketClient:
 
         self._callbacks: Dict[str, Callable] = {}
 
+        # Consumers per joined room; the room is left when the last one
+        # unsubscribes. max_rooms caps how many rooms can be live at once
+        # (None lifts the cap).
+        self._consumers: Dict[str, List[Callable]] = {}
+        self.max_rooms = max_rooms
+
+        # Plain (non-async) callbacks run on this pool, in order per room;
+        # a room more than callback_max_pending calls behind drops its oldest
+        self.sync_runner = SyncCallbackRunner(
+            callback_executor,
+            max_workers=callback_workers,
+            logger=self.logger,
+            max_pending=callback_max_pending,
+        )
+
+        # Optional event-loop lag/stall monitor, active while the handler runs
+        self.watchdog = watchdog
+
+        # Connection tuning ("default", "low_latency", "throughput" or a
+        # ConnectionProfile). The event loop belongs to the application:
+        # a uvloop profile is only a hint, checked on the first connect
+        self.profile = get_profile(profile)
+        self._loop_checked = False
+
+        # Optional gap detection and backfill for wallet rooms on reconnect
+        self.continuity = continuity
+        self._has_connected = False
+
+        # Warm-up bookkeeping: rooms waiting for their first frame, and the
+        # message handler when it runs in the background
+        self._first_event_waiters: Dict[str, asyncio.Future] = {}
+        self._handler_task: Optional[asyncio.Future] = None
+
+        # Two-phase decoding: frames for rooms without a callback are dropped
+        # before parsing, and conflated rooms keep only their latest frame
+        self._conflated_rooms = set(conflate_rooms or ())
+        self._pending_frames: Dict[str, Any] = {}
+        self._pending_event: Optional[asyncio.Event] = None
+        self._pending_received: Dict[str, Tuple[float, float]] = {}
+        self.frame_stats = {
+            "received": 0,
+            "dropped": 0,
+            "conflated": 0,
+            "decoded": 0,
+            "duplicates": 0,
+        }
+        self._drain_task: Optional[asyncio.Future] = None
+
+        # Optional raw frame recorder (see start_recording)
+        self._recorder: Optional[CaptureWriter] = None
+
+        # Shared duplicate filter when this client is one leg of a
+        # RedundantWebSocketClient; None for a standalone client
+        self.dedup = None
+
+        # Optional per-room latency histograms, from server event to callback end
+        self.latency: Optional[LatencyTracker] = None
+        if track_latency:
+            self.latency = LatencyTracker(clock_offset=clock_offset)
+
     async def connect(
         self,
         is_token_price: bool = False,
@@ -55,17 +167,8 @@ class AxiomTradeWebSocketClient:
             self.logger.error("No authentication tokens available")
             return False
 
-        headers = {
-            "Origin": "https://axiom.trade",
-            "Cache-Control": "no-cache",
-            "Accept-Language": "en-US,en;q=0.9,es;q=0.8",
-            "Pragma": "no-cache",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36 OPR/120.0.0.0",
-        }
-
-        # Add authentication cookies from auth manager
-        cookie_header = f"auth-access-token={tokens.access_token}; auth-refresh-token={tokens.refresh_token}"
-        headers["Cookie"] = cookie_header
+        headers = self._build_headers(tokens)
+        self._check_event_loop()
 
         self.logger.debug(f"Connecting to WebSocket with headers: {headers}")
         self.logger.debug(
@@ -78,11 +181,18 @@ class AxiomTradeWebSocketClient:
             elif is_sol_price:
                 current_url = self.ws_url_sol_price
             else:
+                if self.cluster_selector is not None:
+                    await self._select_cluster(headers)
                 current_url = self.ws_url
 
             # Try the primary URL first
             self.logger.info(f"Attempting to connect to WebSocket: {current_url}")
-            self.ws = await websockets.connect(current_url, extra_headers=headers)
+            self.ws = await websockets.connect(
+                current_url, extra_headers=headers, **self.profile.connect_kwargs()
+            )
+            self.current_url = current_url
+            self._joined_rooms.clear()
+            self._on_connected()
             self.logger.info("Connected to WebSocket server")
             return True
         except Exception as e:
@@ -106,8 +216,13 @@ class AxiomTradeWebSocketClient:
                             f"Trying alternative WebSocket URL: {alternative_url}"
                         )
                         self.ws = await websockets.connect(
-                            alternative_url, extra_headers=headers
+                            alternative_url,
+                            extra_headers=headers,
+                            **self.profile.connect_kwargs(),
                         )
+                        self.current_url = alternative_url
+                        self._joined_rooms.clear()
+                        self._on_connected()
                         self.logger.info("Connected to alternative WebSocket server")
                         return True
                     except Exception as e2:
@@ -116,27 +231,68 @@ class AxiomTradeWebSocketClient:
                         )
             return False
 
+    def _check_event_loop(self) -> None:
+        """Warn once if the profile expects uvloop but the loop is not one."""
+        if self._loop_checked or not self.profile.uvloop:
+            return
+        self._loop_checked = True
+        if not UVLOOP_AVAILABLE:
+            self.logger.debug("uvloop not installed; using the default event loop")
+        elif not running_uvloop():
+            self.logger.warning(
+                "Connection profile prefers uvloop but the event loop is not uvloop; "
+                "call install_uvloop() before starting the loop to use it"
+            )
+
+    def _on_connected(self) -> None:
+        """On a reconnect, open continuity gaps for subscribed wallet rooms."""
+        if self.continuity is not None and self._has_connected:
+            now = time.time()
+            for room in self._consumers:
+                if room.startswith("v:"):
+                    gap = self.continuity.mark_gap(room, now)
+                    asyncio.ensure_future(
+                        self.continuity.recover(
+                            gap, functools.partial(self._deliver_recovered, room)
+                        )
+                    )
+        self._has_connected = True
+
+    async def _deliver_recovered(self, room: str, content: Dict[str, Any]) -> None:
+        """Deliver a backfilled or held-back wallet transaction."""
+        callback = self._callbacks.get(self._callback_key(room))
+        if callback is None:
+            return
+        if not self.raw_events:
+            content = WalletTransaction.from_dict(content)
+        await callback(content)
+
     async def subscribe_new_tokens(self, callback: Callable[[Dict[str, Any]], None]):
         """Subscribe to new token updates."""
         if not self.ws:
             if not await self.connect():
                 return False
 
-        self._callbacks["new_pairs"] = callback
-        self._callbacks["update_pulse_v2"] = callback
-
+        # Both rooms or neither: a failed second join undoes the first
+        added = [
+            room
+            for room in ("new_pairs", "update_pulse_v2")
+            if callback not in self._consumers.get(room, ())
+        ]
         try:
-            await self.ws.send(json.dumps({"action": "join", "room": "new_pairs"}))
+            if not await self._subscribe_room("new_pairs", callback):
+                return False
             self.logger.info("Subscribed to new token updates")
 
-            await self.ws.send(
-                json.dumps({"action": "join", "room": "update_pulse_v2"})
-            )
-            self.logger.info("Subscribed to new token updates_v2")
-            return True
+            if await self._subscribe_room("update_pulse_v2", callback):
+                self.logger.info("Subscribed to new token updates_v2")
+                return True
         except Exception as e:
             self.logger.error(f"Failed to subscribe to new tokens: {e}")
-            return False
+        for room in added:
+            if callback in self._consumers.get(room, ()):
+                await self._unsubscribe_room(room, callback)
+        return False
 
     async def subscribe_sol_price(self, callback: Callable[[Dict[str, Any]], None]):
         """Subscribe to sol price updates."""
@@ -144,10 +300,9 @@ class AxiomTradeWebSocketClient:
             if not await self.connect(is_sol_price=True):
                 return False
 
-        self._callbacks["sol_price"] = callback
-
         try:
-            await self.ws.send(json.dumps({"action": "join", "room": "sol_price"}))
+            if not await self._subscribe_room("sol_price", callback):
+                return False
             self.logger.info("Subscribed to sol price updates")
             return True
         except Exception as e:
@@ -162,10 +317,9 @@ class AxiomTradeWebSocketClient:
             if not await self.connect(is_token_price=True):
                 return False
 
-        self._callbacks[f"token_price_{token}"] = callback
-
         try:
-            await self.ws.send(json.dumps({"action": "join", "room": token}))
+            if not await self._subscribe_room(token, callback):
+                return False
             self.logger.info(f"Subscribed to token price updates for {token}")
             return True
         except Exception as e:
@@ -218,68 +372,617 @@ class AxiomTradeWebSocketClient:
             if not await self.connect():
                 return False
 
-        self._callbacks[f"wallet_transactions_{wallet_address}"] = callback
-
         try:
-            await self.ws.send(
-                json.dumps({"action": "join", "room": f"v:{wallet_address}"})
-            )
+            if not await self._subscribe_room(f"v:{wallet_address}", callback):
+                return False
             self.logger.info(f"Subscribed to wallet transactions for {wallet_address}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to subscribe to wallet transactions: {e}")
             return False
 
-    async def _message_handler(self):
-        """Handle incoming WebSocket messages."""
+    async def unsubscribe_new_tokens(self, callback: Optional[Callable] = None) -> bool:
+        """Stop new token updates for ``callback`` (or the latest consumer)."""
+        left = await self._unsubscribe_room("new_pairs", callback)
+        return await self._unsubscribe_room("update_pulse_v2", callback) or left
+
+    async def unsubscribe_sol_price(self, callback: Optional[Callable] = None) -> bool:
+        """Stop sol price updates for ``callback`` (or the latest consumer)."""
+        return await self._unsubscribe_room("sol_price", callback)
+
+    async def unsubscribe_token_price(
+        self, token: str, callback: Optional[Callable] = None
+    ) -> bool:
+        """Stop token price updates for ``callback`` (or the latest consumer)."""
+        return await self._unsubscribe_room(token, callback)
+
+    async def unsubscribe_wallet_transactions(
+        self, wallet_address: str, callback: Optional[Callable] = None
+    ) -> bool:
+        """Stop wallet transaction updates for ``callback`` (or the latest consumer)."""
+        return await self._unsubscribe_room(f"v:{wallet_address}", callback)
+
+    @property
+    def subscriptions(self) -> Dict[str, int]:
+        """Live rooms and their number of consumers"""
+        return {room: len(consumers) for room, consumers in self._consumers.items()}
+
+    @property
+    def joined_rooms(self) -> List[str]:
+        """Rooms joined on the current socket"""
+        return list(self._joined_rooms)
+
+    async def _subscribe_room(self, room: str, callback: Callable) -> bool:
+        """Add a consumer to a room, joining it on the socket if needed."""
+        if not self._add_consumer(room, callback):
+            return False
+
+        # Re-subscribing after a reconnect joins the room on the new socket
+        if room not in self._joined_rooms:
+            await self._join_room(room)
+        return True
+
+    def _add_consumer(self, room: str, callback: Callable) -> bool:
+        consumers = self._consumers.get(room)
+        if consumers is None:
+            if self.max_rooms is not None and len(self._consumers) >= self.max_rooms:
+                self.logger.error(
+                    f"Cannot join {room}: {self.max_rooms} rooms already subscribed"
+                )
+                return False
+            consumers = self._consumers[room] = []
+        if callback not in consumers:
+            consumers.append(callback)
+        self._callbacks[self._callback_key(room)] = self._room_callback(room, consumers)
+        return True
+
+    async def _unsubscribe_room(self, room: str, callback: Optional[Callable]) -> bool:
+        """Remove a consumer; leave the room once no consumer is left."""
+        consumers = self._consumers.get(room)
+        if not consumers:
+            return False
+        if callback is None:
+            consumers.pop()
+        elif callback in consumers:
+            consumers.remove(callback)
+        else:
+            return False
+
+        key = self._callback_key(room)
+        if consumers:
+            self._callbacks[key] = self._room_callback(room, consumers)
+            return True
+
+        del self._consumers[room]
+        self._callbacks.pop(key, None)
+        self._pending_frames.pop(room, None)
+        self._pending_received.pop(room, None)
+        if self.latency is not None:
+            self.latency.rooms.pop(room, None)
+        if self.continuity is not None:
+            self.continuity.forget(room)
+        if room in self._joined_rooms:
+            del self._joined_rooms[room]
+            try:
+                await self.ws.send(codec.dumps({"action": "leave", "room": room}))
+                self.logger.info(f"Left room {room}")
+            except Exception as e:
+                self.logger.error(f"Failed to leave room {room}: {e}")
+        return True
+
+    def _room_callback(self, room: str, consumers: List[Callable]) -> Callable:
+        """
+        Build the callable stored in ``_callbacks`` for a room.
+
+        Synchronous consumers are scheduled on ``sync_runner`` instead of
+        being awaited; several consumers are fanned out in order. With a
+        watchdog, each async consumer is watched (and offloaded) on its own.
+        """
+        handlers = [
+            self.sync_runner.wrap(room, consumer)
+            if not is_async_callback(consumer)
+            else consumer
+            if self.watchdog is None
+            else self._watched(room, consumer)
+            for consumer in consumers
+        ]
+        if len(handlers) == 1:
+            return handlers[0]
+
+        async def fan_out(payload):
+            for handler in handlers:
+                await handler(payload)
+
+        return fan_out
+
+    def _build_headers(self, tokens) -> Dict[str, str]:
+        """Handshake headers carrying the auth cookies."""
+        headers = {
+            "Origin": "https://axiom.trade",
+            "Cache-Control": "no-cache",
+            "Accept-Language": "en-US,en;q=0.9,es;q=0.8",
+            "Pragma": "no-cache",
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36 OPR/120.0.0.0",
+        }
+
+        # Add authentication cookies from auth manager
+        cookie_header = f"auth-access-token={tokens.access_token}; auth-refresh-token={tokens.refresh_token}"
+        headers["Cookie"] = cookie_header
+        return headers
+
+    async def _join_room(self, room: str) -> None:
+        """Join a room on the current socket and remember it for migration."""
+        await self.ws.send(codec.dumps({"action": "join", "room": room}))
+        self._joined_rooms[room] = None
+
+    async def _join_rooms(self, rooms: Iterable[str]) -> None:
+        """Join several rooms with pipelined sends instead of one at a time."""
+        ws = self.ws
+        rooms = [room for room in rooms if room not in self._joined_rooms]
+        await asyncio.gather(
+            *(ws.send(codec.dumps({"action": "join", "room": room})) for room in rooms)
+        )
+        for room in rooms:
+            self._joined_rooms[room] = None
+
+    async def warm_up(
+        self,
+        rooms: Dict[str, Callable],
+        feed: str = "main",
+        timeout: float = 10.0,
+    ) -> Dict[str, Optional[float]]:
+        """
+        Connect, join every room in one batch and wait for their first events.
+
+        The message handler is started in the background so events flow as
+        soon as they arrive; ``start()`` afterwards simply waits on it.
+        Axiom does not acknowledge joins, so a room counts as subscribed
+        once its first frame has been received.
+
+        Args:
+            rooms: Room name -> callback (``"new_pairs"``, ``"sol_price"``,
+                   ``"v:<wallet>"``, a token address, ...)
+            feed: Socket to open if not connected yet: "main",
+                  "token_price" or "sol_price"
+            timeout: Seconds to wait for first events
+
+        Returns:
+            dict: Room -> seconds from warm-up start to its first event,
+                  None for rooms that timed out
+        """
+        started = time.perf_counter()
+        loop = asyncio.get_event_loop()
+        waiters = {room: loop.create_future() for room in rooms}
+        self._first_event_waiters.update(waiters)
         try:
-            async for message in self.ws:
-                room = None  # Инициализируем переменную ДО блока try
-                try:
-                    data = json.loads(message)
-                    self.logger.debug(f"Received message: {data}")
+            if not self.ws and not await self.connect(
+                is_token_price=feed == "token_price", is_sol_price=feed == "sol_price"
+            ):
+                return {room: None for room in rooms}
+
+            joining = [
+                room
+                for room, callback in rooms.items()
+                if self._add_consumer(room, callback)
+            ]
+            await self._join_rooms(joining)
+            self._ensure_handler()
+
+            if waiters:
+                await asyncio.wait(list(waiters.values()), timeout=timeout)
+            report = {
+                room: waiter.result() - started if waiter.done() else None
+                for room, waiter in waiters.items()
+            }
+        finally:
+            for room, waiter in waiters.items():
+                if self._first_event_waiters.get(room) is waiter:
+                    del self._first_event_waiters[room]
+                waiter.cancel()
+
+        for room, elapsed in report.items():
+            if elapsed is None:
+                self.logger.warning(f"No event from {room} within {timeout:.1f}s")
+            else:
+                self.logger.info(f"First event from {room} after {elapsed * 1e3:.1f}ms")
+        return report
+
+    def _ensure_handler(self) -> None:
+        """Run the message handler in the background if it is not running."""
+        if self._handler_task is None or self._handler_task.done():
+            self._handler_task = asyncio.ensure_future(self._message_handler())
+
+    async def _select_cluster(self, headers: Dict[str, str]) -> None:
+        """Probe the candidate clusters and point ws_url at the fastest."""
+        ranking = await self.cluster_selector.rank(headers)
+        for probe in ranking:
+            self.logger.debug(
+                f"Cluster {probe.url}: score={probe.score * 1e3:.1f}ms error={probe.error}"
+            )
+        best = self.cluster_selector.best()
+        if best is not None:
+            self.ws_url = best
+        else:
+            self.logger.warning("No candidate cluster reachable; keeping ws_url")
+
+    async def migrate(self, url: str) -> bool:
+        """
+        Move the feed to another cluster without a gap.
 
-                    room = data.get("room", "")
+        Connects and joins every current room on the new cluster before
+        closing the old socket (make-before-break). Frames already
+        delivered by the old socket are filtered from the new one for a
+        short overlap window.
 
-                    # Handle new token updates
-                    if room == "new_pairs" and "new_pairs" in self._callbacks:
-                        await self._callbacks["new_pairs"](data)
+        Args:
+            url: WebSocket URL of the target cluster
+
+        Returns:
+            bool: True if the feed now runs on ``url``
+        """
+        tokens = self.auth_manager.get_tokens()
+        if not tokens:
+            self.logger.error("No authentication tokens available")
+            return False
+
+        # Filter launches and transactions (by pair address / signature) seen
+        # on both sockets while they overlap; installed before joining so the
+        # old socket's events from then on are recorded
+        overlap = None
+        if self.dedup is None:
+            overlap = self.dedup = DedupWindow()
+
+        def end_overlap():
+            if overlap is not None and self.dedup is overlap:
+                self.dedup = None
+
+        new_ws = None
+        try:
+            new_ws = await websockets.connect(
+                url,
+                extra_headers=self._build_headers(tokens),
+                **self.profile.connect_kwargs(),
+            )
+            for room in self._joined_rooms:
+                await new_ws.send(codec.dumps({"action": "join", "room": room}))
+        except Exception as e:
+            end_overlap()
+            if new_ws is not None:
+                await new_ws.close()
+            self.logger.error(f"Migration to {url} failed: {e}")
+            return False
+
+        asyncio.get_event_loop().call_later(self.MIGRATION_OVERLAP, end_overlap)
+
+        old_ws, old_url = self.ws, self.current_url
+        self.ws, self.ws_url, self.current_url = new_ws, url, url
+        if old_ws is not None:
+            await old_ws.close()
+        self.logger.info(f"Migrated WebSocket feed from {old_url} to {url}")
+        return True
+
+    async def _monitor_clusters(self) -> None:
+        """Re-probe clusters periodically and migrate to a faster one."""
+        selector = self.cluster_selector
+        while True:
+            await asyncio.sleep(selector.interval)
+            tokens = self.auth_manager.get_tokens()
+            if not tokens or self.current_url is None:
+                continue
+            try:
+                await selector.rank(self._build_headers(tokens))
+            except Exception as e:
+                self.logger.warning(f"Cluster probe failed: {e}")
+                continue
+            target = selector.should_migrate(self.current_url)
+            if target is not None:
+                await self.migrate(target)
+
+    def _callback_key(self, room: str) -> str:
+        """Map a room name to its key in ``_callbacks``."""
+        if room in ("new_pairs", "update_pulse_v2", "sol_price"):
+            return room
+        if room.startswith("v:"):
+            return f"wallet_transactions_{room[2:]}"
+        return f"token_price_{room}"
+
+    def set_conflation(self, room: str, enabled: bool = True) -> None:
+        """
+        Enable or disable conflation for a room.
+
+        Frames of a conflated room are not decoded on arrival; only the most
+        recent undecoded frame is kept and delivered once the receive loop is
+        idle. Use it for rooms where only the latest value matters, such as
+        ``sol_price`` or token price rooms, never for wallet transactions.
+        """
+        if enabled:
+            self._conflated_rooms.add(room)
+        else:
+            self._conflated_rooms.discard(room)
 
-                    elif (
-                        room == "update_pulse_v2"
-                        and "update_pulse_v2" in self._callbacks
+    def start_recording(self, path: str, compress: bool = False) -> None:
+        """
+        Record every received frame to a capture file.
+
+        Frames are written raw, with their receive timestamp, before any
+        filtering so the capture can be replayed with ``replay``.
+
+        Args:
+            path: Capture file (appended to if it already exists)
+            compress: Compress the capture with zstd (requires ``zstandard``)
+        """
+        self.stop_recording()
+        self._recorder = CaptureWriter(path, compress=compress)
+        self.logger.info(f"Recording WebSocket frames to {path}")
+
+    def stop_recording(self) -> None:
+        """Stop recording and close the capture file."""
+        if self._recorder is not None:
+            self._recorder.close()
+            self.logger.info(
+                f"Stopped recording ({self._recorder.frames_written} frames)"
+            )
+            self._recorder = None
+
+    async def replay(self, path: str, speed: Optional[float] = None) -> int:
+        """
+        Feed a recorded capture through the normal dispatch path.
+
+        Args:
+            path: Capture file written by ``start_recording``
+            speed: Playback rate relative to the original timing (1.0 is
+                real time, 2.0 twice as fast). None replays as fast as
+                possible while keeping the recorded burst boundaries, so
+                conflation behaves the same on every run.
+
+        Returns:
+            int: Number of frames replayed
+        """
+        loop = asyncio.get_event_loop()
+        self._start_drain()
+        # Replayed frames must not be appended to an active recording
+        recorder, self._recorder = self._recorder, None
+        count = 0
+        try:
+            first_ts = previous_ts = None
+            started = loop.time()
+            for received_at, message in read_capture(path):
+                if first_ts is None:
+                    first_ts = previous_ts = received_at
+                if speed:
+                    delay = (received_at - first_ts) / speed - (loop.time() - started)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                elif received_at - previous_ts > self.REPLAY_IDLE_GAP:
+                    # The live socket went idle here; let deferred work run
+                    await asyncio.sleep(0)
+                previous_ts = received_at
+                await self._safe_handle_frame(message)
+                count += 1
+            await asyncio.sleep(0)
+        finally:
+            self._stop_drain()
+            if self._recorder is None:
+                self._recorder = recorder
+        return count
+
+    async def _handle_frame(self, message) -> None:
+        """Route a raw frame, decoding it only if someone will consume it."""
+        received = None
+        if self._recorder is not None or self.latency is not None:
+            received = (time.time(), time.perf_counter())
+            if self._recorder is not None:
+                self._recorder.write(message, received[0])
+
+        stats = self.frame_stats
+        stats["received"] += 1
+
+        # Phase one: read the room without parsing the JSON document
+        room = codec.peek_room(message)
+        if room is not None:
+            if self._first_event_waiters:
+                waiter = self._first_event_waiters.pop(room, None)
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(time.perf_counter())
+            if self._callback_key(room) not in self._callbacks:
+                stats["dropped"] += 1
+                return
+            if room in self._conflated_rooms:
+                if room in self._pending_frames:
+                    stats["conflated"] += 1
+                self._pending_frames[room] = message
+                if self.latency is not None:
+                    self._pending_received[room] = received
+                if self._pending_event is not None:
+                    self._pending_event.set()
+                return
+
+        # Phase two: full decode and dispatch
+        await self._process_frame(message, received)
+
+    async def _process_frame(self, message, received=None) -> None:
+        """Decode a frame and invoke the matching callback."""
+        tracker = self.latency
+        if tracker is not None:
+            if received is None:
+                received = (time.time(), time.perf_counter())
+            decode_started = time.perf_counter()
+
+        data = codec.loads(message)
+        self.frame_stats["decoded"] += 1
+        self.logger.debug("Received message: %s", data)
+
+        room = data.get("room", "")
+        callback = None
+        event_time = None
+        event_key = None
+
+        # Handle new token updates
+        if room == "new_pairs" and "new_pairs" in self._callbacks:
+            content = data.get("content")
+            if type(content) is dict:
+                event_time = content.get("created_at")
+                event_key = content.get("pair_address")
+                if not self.raw_events:
+                    data["content"] = NewPair.from_dict(content)
+            callback, payload = self._callbacks["new_pairs"], data
+
+        elif room == "update_pulse_v2" and "update_pulse_v2" in self._callbacks:
+            callback, payload = self._callbacks["update_pulse_v2"], data
+
+        # Handle SOL price updates
+        elif room == "sol_price" and "sol_price" in self._callbacks:
+            callback, payload = self._callbacks["sol_price"], data
+
+        # Handle token price updates
+        elif f"token_price_{room}" in self._callbacks:
+            callback_key = f"token_price_{room}"
+            callback, payload = self._callbacks[callback_key], data.get("content", data)
+
+        # Handle wallet transactions
+        elif room.startswith("v:"):
+            wallet_address = room[2:]  # Remove "v:" prefix
+            callback_key = f"wallet_transactions_{wallet_address}"
+            if callback_key in self._callbacks:
+                content = data.get("content", data)
+                if type(content) is dict:
+                    if self.continuity is not None and not self.continuity.accept(
+                        room, content
                     ):
-                        await self._callbacks["update_pulse_v2"](data)
-
-                    # Handle SOL price updates
-                    elif room == "sol_price" and "sol_price" in self._callbacks:
-                        await self._callbacks["sol_price"](data)
-
-                    # Handle token price updates
-                    elif f"token_price_{room}" in self._callbacks:
-                        callback_key = f"token_price_{room}"
-                        await self._callbacks[callback_key](data.get("content", data))
-
-                    # Handle wallet transactions
-                    elif room.startswith("v:"):
-                        wallet_address = room[2:]  # Remove "v:" prefix
-                        callback_key = f"wallet_transactions_{wallet_address}"
-                        if callback_key in self._callbacks:
-                            await self._callbacks[callback_key](
-                                data.get("content", data)
-                            )
-
-                except json.JSONDecodeError:
+                        return
+                    event_time = content.get("created_at")
+                    event_key = content.get("signature")
+                    if not self.raw_events:
+                        content = WalletTransaction.from_dict(content)
+                callback, payload = self._callbacks[callback_key], content
+
+        if callback is None:
+            return
+        # Copies of the same launch or transaction from another redundant leg
+        if event_key is not None and self.dedup is not None:
+            if not self.dedup.first((room, event_key)):
+                self.frame_stats["duplicates"] += 1
+                return
+        if tracker is None:
+            await callback(payload)
+            return
+
+        # Latency instrumentation: decode, dispatch and callback stages
+        callback_started = time.perf_counter()
+        tracker.record(room, "decode", callback_started - decode_started)
+        tracker.record(room, "dispatch", callback_started - received[1])
+        local_event_time = None
+        if event_time is not None:
+            local_event_time = tracker.record_event_time(room, received[0], event_time)
+        try:
+            await callback(payload)
+        finally:
+            finished = time.perf_counter()
+            tracker.record(room, "callback", finished - callback_started)
+            tracker.record(room, "total", finished - received[1])
+            if local_event_time is not None:
+                tracker.record(
+                    room,
+                    "end_to_end",
+                    received[0] + (finished - received[1]) - local_event_time,
+                )
+
+    def _watched(self, room: str, consumer: Callable) -> Callable:
+        """Wrap an async consumer so stalls are blamed on the consumer itself."""
+
+        async def watched(payload):
+            await self._invoke_watched(room, consumer, payload)
+
+        return watched
+
+    async def _invoke_watched(self, room: str, callback: Callable, payload) -> None:
+        """Run a consumer under the watchdog, on its thread pool once offloaded."""
+        watchdog = self.watchdog
+        if callback in watchdog.offloaded:
+            await watchdog.run_offloaded(callback, payload)
+            return
+        watchdog.enter(room, callback)
+        try:
+            await callback(payload)
+        finally:
+            watchdog.exit()
+
+    async def _safe_handle_frame(self, message) -> None:
+        """Handle a frame, logging instead of raising on bad frames."""
+        try:
+            await self._handle_frame(message)
+        except codec.DecodeError:
+            self.logger.error(f"Failed to parse WebSocket message: {message}")
+        except Exception as e:
+            self.logger.error(f"Error handling WebSocket message: {e}")
+            self.logger.debug(f"Problematic message: {message}")
+
+    async def _drain_conflated(self) -> None:
+        """Deliver the latest deferred frame of each conflated room."""
+        while True:
+            await self._pending_event.wait()
+            self._pending_event.clear()
+            while self._pending_frames:
+                room = next(iter(self._pending_frames))
+                message = self._pending_frames.pop(room)
+                received = self._pending_received.pop(room, None)
+                if received is not None:
+                    self.latency.record(room, "queue", time.perf_counter() - received[1])
+                try:
+                    await self._process_frame(message, received)
+                except codec.DecodeError:
                     self.logger.error(f"Failed to parse WebSocket message: {message}")
                 except Exception as e:
                     self.logger.error(f"Error handling WebSocket message: {e}")
-                    self.logger.debug(f"Problematic message: {message}")
+
+    def _start_drain(self) -> None:
+        self._pending_event = asyncio.Event()
+        if self._pending_frames:
+            self._pending_event.set()
+        self._drain_task = asyncio.ensure_future(self._drain_conflated())
+
+    def _stop_drain(self) -> None:
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+        self._pending_event = None
+
+    async def _message_handler(self):
+        """Handle incoming WebSocket messages."""
+        self._start_drain()
+        if self.watchdog is not None:
+            self.watchdog.start()
+        if (
+            self.cluster_selector is not None
+            and self.cluster_selector.interval
+            and self.current_url == self.ws_url
+        ):
+            self._cluster_task = asyncio.ensure_future(self._monitor_clusters())
+        try:
+            while True:
+                ws = self.ws
+                try:
+                    async for message in ws:
+                        await self._safe_handle_frame(message)
+                except websockets.exceptions.ConnectionClosed:
+                    if self.ws is ws:
+                        raise
+                # A migration swaps self.ws; keep reading from the new socket
+                if self.ws is ws:
+                    break
 
         except websockets.exceptions.ConnectionClosed:
             self.logger.warning("WebSocket connection closed")
             raise Exception("WebSocket connection closed")
         except Exception as e:
             self.logger.error(f"WebSocket message handler error: {e}")
+        finally:
+            self._stop_drain()
+            if self.watchdog is not None:
+                self.watchdog.stop()
+            if self._cluster_task is not None:
+                self._cluster_task.cancel()
+                self._cluster_task = None
 
     async def start(self):
         """Start the WebSocket client and message handler."""
@@ -287,10 +990,19 @@ class AxiomTradeWebSocketClient:
             if not await self.connect():
                 return
 
+        if self._handler_task is not None and not self._handler_task.done():
+            # Already started by warm_up()
+            await self._handler_task
+            return
         await self._message_handler()
 
     async def close(self):
         """Close the WebSocket connection."""
+        self.stop_recording()
         if self.ws:
             await self.ws.close()
             self.logger.info("WebSocket connection closed")
+        if self._handler_task is not None:
+            self._handler_task.cancel()
+            self._handler_task = None
+        self.sync_runner.shutdown()
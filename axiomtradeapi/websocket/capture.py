@@ -0,0 +1,184 @@
+"""
+WebSocket capture files for Axiom Trade feeds
+Append-only, length-prefixed recordings of raw frames with receive timestamps
+"""
+
+import os
+import struct
+import time
+from typing import Iterator, Tuple, Union
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# File layout: MAGIC, then records of RECORD header + payload.
+# A compressed capture is the same byte stream wrapped in zstd frames.
+MAGIC = b"AXWSCAP1"
+RECORD = struct.Struct("<dIB")  # receive time (epoch seconds), payload length, kind
+KIND_TEXT = 0
+KIND_BINARY = 1
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+Frame = Union[str, bytes]
+
+
+def _require_zstd():
+    if not ZSTD_AVAILABLE:
+        raise ImportError("zstandard library not installed. Run: pip install zstandard")
+
+
+class CaptureWriter:
+    """
+    Append raw WebSocket frames to a capture file
+
+    Each record stores the receive timestamp, the payload length and whether
+    the frame was text or binary, followed by the untouched payload.
+    Appending to an existing capture continues it; a compressed capture must
+    be appended to with ``compress=True`` as well. Buffered frames are
+    flushed (ending the current zstd frame) every ``flush_every`` records
+    or ``flush_interval`` seconds, so a crash loses at most that tail.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        compress: bool = False,
+        level: int = 3,
+        flush_every: int = 1000,
+        flush_interval: float = 1.0,
+    ):
+        """
+        Open a capture for appending
+
+        Args:
+            path: Capture file path
+            compress: Wrap the stream in zstd (requires ``zstandard``)
+            level: zstd compression level
+            flush_every: Records written between flushes
+            flush_interval: Seconds between flushes (checked on write)
+        """
+        self.path = path
+        self.compress = compress
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.frames_written = 0
+        self._unflushed = 0
+        self._flushed_at = time.monotonic()
+
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        if not is_new and _is_compressed(path) != compress:
+            raise ValueError(
+                f"Capture {path} is {'' if compress else 'not '}expected to be compressed"
+            )
+
+        self._file = open(path, "ab")
+        if compress:
+            _require_zstd()
+            self._compressor = zstandard.ZstdCompressor(level=level)
+            self._out = self._compressor.stream_writer(self._file, closefd=False)
+        else:
+            self._out = self._file
+
+        if is_new:
+            self._out.write(MAGIC)
+
+    def write(self, frame: Frame, received_at: float) -> None:
+        """Append a single frame received at ``received_at`` (epoch seconds)"""
+        if isinstance(frame, str):
+            payload = frame.encode("utf-8")
+            kind = KIND_TEXT
+        else:
+            payload = bytes(frame)
+            kind = KIND_BINARY
+        self._out.write(RECORD.pack(received_at, len(payload), kind))
+        self._out.write(payload)
+        self.frames_written += 1
+        self._unflushed += 1
+        if (
+            self._unflushed >= self.flush_every
+            or time.monotonic() - self._flushed_at >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Flush buffered frames to disk (ends the current zstd frame)"""
+        if self.compress:
+            self._out.flush(zstandard.FLUSH_FRAME)
+        self._file.flush()
+        self._unflushed = 0
+        self._flushed_at = time.monotonic()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.flush()
+        if self.compress:
+            self._out.close()
+        self._file.close()
+
+    def __enter__(self) -> "CaptureWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _is_compressed(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(4) == _ZSTD_MAGIC
+
+
+def read_capture(path: str) -> Iterator[Tuple[float, Frame]]:
+    """
+    Iterate over the frames of a capture file
+
+    Compression is detected automatically. A truncated trailing record
+    (e.g. from a crash while recording) is ignored.
+
+    Yields:
+        tuple: (received_at, frame) with text frames as ``str``
+    """
+    with open(path, "rb") as raw:
+        if _is_compressed(path):
+            _require_zstd()
+            stream = zstandard.ZstdDecompressor().stream_reader(
+                raw, read_across_frames=True
+            )
+        else:
+            stream = raw
+
+        if _read_exact(stream, len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not an Axiom WebSocket capture")
+
+        header_size = RECORD.size
+        unpack = RECORD.unpack
+        while True:
+            header = _read_exact(stream, header_size)
+            if len(header) < header_size:
+                return
+            received_at, length, kind = unpack(header)
+            payload = _read_exact(stream, length)
+            if len(payload) < length:
+                return
+            yield received_at, payload.decode("utf-8") if kind == KIND_TEXT else payload
+
+
+def _read_exact(stream, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) == size or not data:
+        return data
+    # Decompression streams may return short reads
+    chunks = [data]
+    remaining = size - len(data)
+    while remaining:
+        chunk = stream.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
@@ -0,0 +1,176 @@
+"""
+Cluster discovery and selection for Axiom Trade WebSocket feeds
+Measures handshake and ping RTT to candidate clusters and picks the fastest
+"""
+
+import asyncio
+import math
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import websockets
+
+DEFAULT_CLUSTERS = (
+    "wss://cluster-euc2.axiom.trade/",
+    "wss://cluster-usc2.axiom.trade/",
+    "wss://cluster3.axiom.trade/",
+    "wss://cluster8.axiom.trade/",
+)
+
+
+@dataclass
+class ClusterProbe:
+    """RTT measurement of one cluster (seconds)"""
+
+    url: str
+    handshake_rtt: Optional[float] = None
+    ping_rtt: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def score(self) -> float:
+        """Median ping RTT, else handshake RTT; infinite if unreachable"""
+        if not self.ok:
+            return math.inf
+        if self.ping_rtt is not None:
+            return self.ping_rtt
+        return self.handshake_rtt if self.handshake_rtt is not None else math.inf
+
+
+async def probe_cluster(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    pings: int = 3,
+    timeout: float = 5.0,
+) -> ClusterProbe:
+    """
+    Measure the handshake time and median ping RTT of one cluster
+
+    Args:
+        url: WebSocket URL
+        headers: Handshake headers (Origin, auth cookies)
+        pings: Number of ping/pong round trips
+        timeout: Timeout for the handshake and for each ping
+
+    Returns:
+        ClusterProbe: Measurement; ``error`` is set if the cluster is unreachable
+    """
+    probe = ClusterProbe(url)
+    started = time.perf_counter()
+    try:
+        ws = await websockets.connect(url, extra_headers=headers, open_timeout=timeout)
+    except Exception as e:
+        probe.error = str(e) or type(e).__name__
+        return probe
+    probe.handshake_rtt = time.perf_counter() - started
+
+    try:
+        rtts = []
+        for _ in range(pings):
+            sent = time.perf_counter()
+            pong = await ws.ping()
+            await asyncio.wait_for(pong, timeout)
+            rtts.append(time.perf_counter() - sent)
+        if rtts:
+            probe.ping_rtt = statistics.median(rtts)
+    except Exception as e:
+        probe.error = str(e) or type(e).__name__
+    finally:
+        try:
+            await ws.close()
+        except Exception:
+            pass
+    return probe
+
+
+async def rank_clusters(
+    urls: Sequence[str],
+    headers: Optional[Dict[str, str]] = None,
+    pings: int = 3,
+    timeout: float = 5.0,
+) -> List[ClusterProbe]:
+    """Probe clusters concurrently; returns probes fastest first, unreachable last"""
+    probes = await asyncio.gather(
+        *(probe_cluster(url, headers, pings, timeout) for url in urls)
+    )
+    return sorted(probes, key=lambda probe: probe.score)
+
+
+class ClusterSelector:
+    """
+    Chooses the fastest cluster and decides when migrating is worth it
+
+    Pass it as ``AxiomTradeWebSocketClient(cluster_selector=...)``: the
+    client connects to the fastest candidate and re-probes every
+    ``interval`` seconds, migrating its subscriptions when another cluster
+    is faster by both ``hysteresis`` (relative) and ``min_improvement``
+    (absolute seconds).
+    """
+
+    def __init__(
+        self,
+        candidates: Sequence[str] = DEFAULT_CLUSTERS,
+        interval: Optional[float] = 300.0,
+        hysteresis: float = 0.2,
+        min_improvement: float = 0.005,
+        pings: int = 3,
+        timeout: float = 5.0,
+    ):
+        """
+        Args:
+            candidates: Cluster WebSocket URLs to choose from
+            interval: Seconds between re-probes (None probes only at connect)
+            hysteresis: Required relative RTT improvement to migrate
+            min_improvement: Required absolute RTT improvement to migrate
+            pings: Ping round trips per probe
+            timeout: Per-probe timeout
+        """
+        if not candidates:
+            raise ValueError("At least one candidate cluster is required")
+        self.candidates = list(candidates)
+        self.interval = interval
+        self.hysteresis = hysteresis
+        self.min_improvement = min_improvement
+        self.pings = pings
+        self.timeout = timeout
+        self.probes: Dict[str, ClusterProbe] = {}
+
+    async def rank(self, headers: Optional[Dict[str, str]] = None) -> List[ClusterProbe]:
+        """Probe every candidate and remember the results"""
+        ranking = await rank_clusters(self.candidates, headers, self.pings, self.timeout)
+        self.probes = {probe.url: probe for probe in ranking}
+        return ranking
+
+    def best(self) -> Optional[str]:
+        """Fastest reachable cluster of the last probe round"""
+        reachable = [probe for probe in self.probes.values() if probe.ok]
+        if not reachable:
+            return None
+        return min(reachable, key=lambda probe: probe.score).url
+
+    def should_migrate(self, current_url: str) -> Optional[str]:
+        """
+        Decide whether to leave ``current_url`` based on the last probe round
+
+        Returns:
+            str: URL to migrate to, or None to stay
+        """
+        best = self.best()
+        if best is None or best == current_url:
+            return None
+        current = self.probes.get(current_url)
+        if current is None or not current.ok:
+            return best
+        best_score = self.probes[best].score
+        improvement = current.score - best_score
+        if improvement >= self.min_improvement and best_score <= current.score * (
+            1 - self.hysteresis
+        ):
+            return best
+        return None
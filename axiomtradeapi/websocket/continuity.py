@@ -0,0 +1,257 @@
+"""
+Continuity tracking and backfill for wallet transaction rooms
+Detects windows where ``v:<wallet>`` events may have been missed and merges recovered events back into the stream
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional
+
+from axiomtradeapi.models import parse_timestamp
+from axiomtradeapi.websocket.dedup import DedupWindow
+
+# backfill(room, since, until, pair_addresses) -> iterable of transaction dicts (sync or async)
+Backfill = Callable[[str, Optional[float], float, List[str]], Any]
+
+
+@dataclass
+class Gap:
+    """A window in which a room's events may have been missed"""
+
+    room: str
+    since: Optional[float]  # last event time before the gap (epoch seconds)
+    until: float  # reconnect time
+    recovered: int = 0
+
+
+def event_time(content: Dict[str, Any]) -> Optional[float]:
+    value = content.get("created_at")
+    if value is None:
+        value = content.get("createdAt")
+    parsed = parse_timestamp(value)
+    return parsed.timestamp() if parsed is not None else None
+
+
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+
+def _snake_case_keys(content: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Top-level keys in the ``v:<wallet>`` event spelling
+
+    REST endpoints such as ``/last-transaction`` answer in camelCase
+    (``createdAt``, ``makerAddress``, ``priceUsd``).
+    """
+    normalized = {_CAMEL_BOUNDARY.sub("_", key).lower(): value for key, value in content.items()}
+    # Keys already in snake_case win over their camelCase twins
+    normalized.update((key, value) for key, value in content.items() if key in normalized)
+    return normalized
+
+
+class _RoomState:
+    __slots__ = ("last_time", "signatures", "pairs", "recovering", "buffer")
+
+    def __init__(self, history: int, pair_history: int):
+        self.last_time: Optional[float] = None
+        self.signatures = DedupWindow(history)
+        self.pairs: Deque[str] = deque(maxlen=pair_history)
+        self.recovering = False
+        self.buffer: List[Dict[str, Any]] = []
+
+
+class ContinuityTracker:
+    """
+    Per-room continuity for wallet transaction feeds
+
+    Tracks each ``v:<wallet>`` room's last event time, a bounded history of
+    transaction signatures and the pair addresses it recently traded. When
+    the client reconnects, every wallet room gets a gap from its last event
+    to the reconnect time; live events for the room are held back while
+    ``backfill`` is queried, recovered events are delivered in time order
+    without the ones already seen, and then the held-back live events
+    follow. Pass it as ``AxiomTradeWebSocketClient(continuity=...)``.
+    """
+
+    def __init__(
+        self,
+        backfill: Optional[Backfill] = None,
+        history: int = 1024,
+        pair_history: int = 32,
+        recovery_timeout: float = 10.0,
+        max_gaps: int = 100,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Args:
+            backfill: Callable returning transactions for a gap, e.g.
+                      ``last_transaction_backfill(client)``; None only
+                      records gaps
+            history: Signatures remembered per room for de-duplication
+            pair_history: Recently traded pair addresses kept per room
+            recovery_timeout: Seconds to wait for ``backfill`` before
+                              releasing held-back live events
+            max_gaps: Number of recent gaps kept in ``gaps``
+            logger: Logger for gap reports
+        """
+        self.backfill = backfill
+        self.history = history
+        self.pair_history = pair_history
+        self.recovery_timeout = recovery_timeout
+        self.logger = logger or logging.getLogger("AxiomTradeWebSocket")
+
+        self.rooms: Dict[str, _RoomState] = {}
+        self.gaps: Deque[Gap] = deque(maxlen=max_gaps)
+        self.stats = {"duplicates": 0, "out_of_order": 0, "gaps": 0, "recovered": 0}
+
+    def _state(self, room: str) -> _RoomState:
+        state = self.rooms.get(room)
+        if state is None:
+            state = self.rooms[room] = _RoomState(self.history, self.pair_history)
+        return state
+
+    def forget(self, room: str) -> None:
+        self.rooms.pop(room, None)
+
+    def _record(self, state: _RoomState, content: Dict[str, Any]) -> bool:
+        """Remember an event; False if its signature was already seen"""
+        signature = content.get("signature")
+        if signature is not None and not state.signatures.first(signature):
+            self.stats["duplicates"] += 1
+            return False
+        timestamp = event_time(content)
+        if timestamp is not None:
+            if state.last_time is not None and timestamp < state.last_time:
+                self.stats["out_of_order"] += 1
+            else:
+                state.last_time = timestamp
+        pair_address = content.get("pair_address")
+        if pair_address and pair_address not in state.pairs:
+            state.pairs.append(pair_address)
+        return True
+
+    def accept(self, room: str, content: Dict[str, Any]) -> bool:
+        """
+        Check a live event before delivery
+
+        Returns:
+            bool: True to deliver now; False for a duplicate or an event held
+                  back while the room is recovering
+        """
+        state = self._state(room)
+        if state.recovering:
+            state.buffer.append(content)
+            return False
+        return self._record(state, content)
+
+    def mark_gap(self, room: str, until: Optional[float] = None) -> Gap:
+        """Open a gap for ``room`` and hold back its live events"""
+        state = self._state(room)
+        gap = Gap(room, state.last_time, time.time() if until is None else until)
+        state.recovering = True
+        self.gaps.append(gap)
+        self.stats["gaps"] += 1
+        self.logger.warning(
+            f"Possible gap in {room} since "
+            + (f"{gap.since:.3f}" if gap.since is not None else "subscription")
+        )
+        return gap
+
+    async def recover(
+        self, gap: Gap, deliver: Callable[[Dict[str, Any]], Awaitable[None]]
+    ) -> int:
+        """
+        Backfill a gap and release held-back events through ``deliver``
+
+        Returns:
+            int: Number of recovered events delivered
+        """
+        state = self._state(gap.room)
+        recovered = []
+        if self.backfill is not None:
+            try:
+                recovered = await asyncio.wait_for(
+                    self._run_backfill(gap, list(state.pairs)), self.recovery_timeout
+                )
+            except Exception as e:
+                self.logger.error(f"Backfill for {gap.room} failed: {e!r}")
+
+        try:
+            events = []
+            for content in recovered or ():
+                timestamp = event_time(content)
+                if gap.since is not None and timestamp is not None and timestamp < gap.since:
+                    continue
+                events.append((timestamp if timestamp is not None else gap.until, content))
+            events.sort(key=lambda item: item[0])
+            for _, content in events:
+                if self._record(state, content):
+                    gap.recovered += 1
+                    await deliver(content)
+        finally:
+            # Release live events that arrived during recovery, in arrival order
+            state.recovering = False
+            buffer, state.buffer = state.buffer, []
+            for content in buffer:
+                if self._record(state, content):
+                    await deliver(content)
+
+        self.stats["recovered"] += gap.recovered
+        if gap.recovered:
+            self.logger.info(f"Recovered {gap.recovered} event(s) for {gap.room}")
+        return gap.recovered
+
+    async def _run_backfill(self, gap: Gap, pairs: List[str]) -> Iterable[Dict[str, Any]]:
+        if asyncio.iscoroutinefunction(self.backfill):
+            return await self.backfill(gap.room, gap.since, gap.until, pairs)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, self.backfill, gap.room, gap.since, gap.until, pairs
+        )
+
+
+def last_transaction_backfill(api_client) -> Backfill:
+    """
+    Backfill from REST using ``get_last_transaction`` per affected pair
+
+    Queries the last transaction of every pair the wallet recently traded
+    and keeps the ones made by the wallet inside the gap (keys normalized
+    to snake_case; transactions without a maker or a timestamp are
+    skipped). This recovers at most one transaction per pair, which covers
+    the common case of short reconnects.
+
+    Args:
+        api_client: ``AxiomTradeClient`` (enhanced client)
+    """
+
+    def backfill(room: str, since, until, pair_addresses: List[str]):
+        wallet = room[2:] if room.startswith("v:") else None
+        transactions = []
+        for pair_address in pair_addresses:
+            try:
+                result = api_client.get_last_transaction(pair_address)
+            except Exception:
+                continue
+            if isinstance(result, dict) and isinstance(result.get("transaction"), dict):
+                result = result["transaction"]
+            for transaction in result if isinstance(result, list) else [result]:
+                if not isinstance(transaction, dict):
+                    continue
+                transaction = _snake_case_keys(transaction)
+                if not transaction.get("signature"):
+                    continue
+                if wallet is not None and transaction.get("maker_address") != wallet:
+                    continue
+                timestamp = event_time(transaction)
+                if timestamp is None or timestamp > until:
+                    continue
+                if since is not None and timestamp < since:
+                    continue
+                transaction.setdefault("pair_address", pair_address)
+                transactions.append(transaction)
+        return transactions
+
+    return backfill
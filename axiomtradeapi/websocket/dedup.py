@@ -0,0 +1,34 @@
+"""
+Bounded duplicate filter for WebSocket events
+"""
+
+from collections import deque
+from typing import Hashable
+
+
+class DedupWindow:
+    """Bounded set of recently seen keys; the oldest key is forgotten first"""
+
+    def __init__(self, size: int = 8192):
+        self.size = size
+        self._keys = set()
+        self._order = deque()
+
+    def first(self, key: Hashable) -> bool:
+        """Return True the first time ``key`` is seen within the window"""
+        keys = self._keys
+        if key in keys:
+            return False
+        keys.add(key)
+        order = self._order
+        order.append(key)
+        if len(order) > self.size:
+            keys.discard(order.popleft())
+        return True
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._order.clear()
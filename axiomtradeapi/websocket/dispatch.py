@@ -0,0 +1,174 @@
+"""
+Off-loop delivery of synchronous WebSocket callbacks
+Runs plain functions on a bounded thread or process pool, in order per room
+"""
+
+import asyncio
+import inspect
+import logging
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Union
+
+EXECUTOR_KINDS = ("thread", "process")
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest")
+
+
+def is_async_callback(callback: Callable) -> bool:
+    """True for ``async def`` functions and objects with an ``async def __call__``"""
+    if asyncio.iscoroutinefunction(callback):
+        return True
+    return asyncio.iscoroutinefunction(getattr(callback, "__call__", None))
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+def _call(callback: Callable, payload: Any, loop: Optional[asyncio.AbstractEventLoop] = None) -> Any:
+    """
+    Run ``callback`` in a pool worker
+
+    Plain functions may still return a coroutine (``lambda d: handler(d)``);
+    it is run on ``loop`` and waited for, so the room's order holds. In a
+    worker process there is no loop to return to, so it runs there.
+    """
+    result = callback(payload)
+    if inspect.isawaitable(result):
+        if loop is None:
+            return asyncio.run(_await(result))
+        return asyncio.run_coroutine_threadsafe(_await(result), loop).result()
+    return result
+
+
+class SyncCallbackRunner:
+    """
+    Runs synchronous callbacks off the event loop
+
+    Each room has its own FIFO of pending payloads and at most one job in
+    the pool at a time, so a room's callbacks see events in arrival order
+    while different rooms run in parallel. Scheduling returns immediately;
+    the receive loop never waits for a callback.
+
+    Each FIFO holds at most ``max_pending`` calls. When a room falls that
+    far behind, ``overflow`` decides what goes: "drop_oldest" discards the
+    oldest waiting call (consumers see the latest events), "drop_newest"
+    discards the incoming one. Dropped calls are counted in ``stats``.
+
+    With ``executor="process"`` callbacks and payloads must be picklable
+    (module-level functions, not lambdas).
+    """
+
+    def __init__(
+        self,
+        executor: Union[str, Executor] = "thread",
+        max_workers: int = 4,
+        logger: Optional[logging.Logger] = None,
+        max_pending: Optional[int] = 10000,
+        overflow: str = "drop_oldest",
+    ):
+        """
+        Args:
+            executor: "thread", "process" or an existing ``Executor``
+            max_workers: Pool size when the pool is created here
+            logger: Logger for callback errors
+            max_pending: Calls queued per room before ``overflow`` applies (None for no limit)
+            overflow: "drop_oldest" or "drop_newest"
+        """
+        if isinstance(executor, str) and executor not in EXECUTOR_KINDS:
+            raise ValueError(
+                f"Unknown executor '{executor}'. Choose from: {', '.join(EXECUTOR_KINDS)}"
+            )
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy '{overflow}'. Choose from: {', '.join(OVERFLOW_POLICIES)}"
+            )
+        self.executor_kind = executor
+        self.max_workers = max_workers
+        self.logger = logger or logging.getLogger("AxiomTradeWebSocket")
+        self.max_pending = max_pending
+        self.overflow = overflow
+
+        self._executor: Optional[Executor] = executor if not isinstance(executor, str) else None
+        self._owns_executor = isinstance(executor, str)
+        self._queues: Dict[str, Deque[tuple]] = {}
+        self._workers: Dict[str, asyncio.Future] = {}
+        self.stats = {"scheduled": 0, "completed": 0, "failed": 0, "dropped": 0}
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="axiom-callback"
+                )
+        return self._executor
+
+    def wrap(self, room: str, callback: Callable) -> Callable:
+        """Async callable that schedules ``callback`` for ``room`` and returns at once"""
+
+        async def schedule(payload):
+            self.submit(room, callback, payload)
+
+        schedule.__qualname__ = getattr(callback, "__qualname__", repr(callback))
+        return schedule
+
+    def submit(self, room: str, callback: Callable, payload: Any) -> None:
+        """Queue a call; starts the room's worker if it is idle"""
+        queue = self._queues.get(room)
+        if queue is None:
+            queue = self._queues[room] = deque()
+        # queue[0] is the call in the pool; only waiting calls are dropped
+        if self.max_pending is not None and len(queue) > self.max_pending:
+            self.stats["dropped"] += 1
+            if self.overflow == "drop_newest" or len(queue) == 1:
+                return
+            del queue[1]
+        queue.append((callback, payload))
+        self.stats["scheduled"] += 1
+        if room not in self._workers:
+            self._workers[room] = asyncio.ensure_future(self._work(room, queue))
+
+    def backlog(self) -> Dict[str, int]:
+        """Pending calls per room (including the one running)"""
+        return {room: len(queue) for room, queue in self._queues.items()}
+
+    async def drain(self) -> None:
+        """Wait until every queued call has run"""
+        while self._workers:
+            await asyncio.gather(*list(self._workers.values()), return_exceptions=True)
+
+    def shutdown(self, wait: bool = False) -> None:
+        for worker in self._workers.values():
+            worker.cancel()
+        self._workers.clear()
+        self._queues.clear()
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    async def _work(self, room: str, queue: Deque[tuple]) -> None:
+        loop = asyncio.get_event_loop()
+        executor = self.executor
+        # Coroutines returned by plain functions come back to this loop
+        target = None if isinstance(executor, ProcessPoolExecutor) else loop
+        try:
+            while queue:
+                callback, payload = queue[0]
+                try:
+                    await loop.run_in_executor(executor, _call, callback, payload, target)
+                    self.stats["completed"] += 1
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.stats["failed"] += 1
+                    self.logger.error(f"Sync callback for {room} failed: {e}")
+                queue.popleft()
+        finally:
+            # Idle rooms hold no state, so the maps stay bounded by live rooms
+            if self._workers.get(room) is asyncio.current_task():
+                del self._workers[room]
+                if not queue:
+                    self._queues.pop(room, None)
@@ -0,0 +1,196 @@
+"""
+Feed latency instrumentation for the Axiom WebSocket client
+Per-room histograms of where time goes between the server event and the end of a callback
+"""
+
+import math
+from bisect import bisect_left
+from collections import deque
+from typing import Dict, Optional
+
+from axiomtradeapi.models import parse_timestamp
+
+# Stages recorded per room:
+#   network    server event time -> frame received (clock-offset corrected)
+#   queue      frame received -> taken from the conflation queue (conflated rooms only)
+#   decode     JSON decode and model wrapping
+#   dispatch   frame received -> callback start
+#   callback   callback start -> callback end
+#   total      frame received -> callback end
+#   end_to_end server event time -> callback end (clock-offset corrected)
+STAGES = ("network", "queue", "decode", "dispatch", "callback", "total", "end_to_end")
+
+# Log-spaced bucket upper bounds: 1 us to ~2 min, four buckets per doubling
+_BUCKETS_PER_DOUBLING = 4
+_BOUNDS = tuple(1e-6 * 2 ** (i / _BUCKETS_PER_DOUBLING) for i in range(27 * _BUCKETS_PER_DOUBLING))
+
+
+class LatencyHistogram:
+    """Fixed log-bucket latency histogram (values in seconds, ~19% bucket width)"""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        if seconds < 0:
+            seconds = 0.0
+        self.counts[bisect_left(_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile (0 < q <= 1)"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                bound = _BOUNDS[index] if index < len(_BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, float]:
+        """Summary in milliseconds"""
+        return {
+            "count": self.count,
+            "mean_ms": self.mean * 1e3,
+            "p50_ms": self.percentile(0.5) * 1e3,
+            "p90_ms": self.percentile(0.9) * 1e3,
+            "p99_ms": self.percentile(0.99) * 1e3,
+            "max_ms": self.max * 1e3,
+        }
+
+
+class ClockOffsetEstimator:
+    """
+    Estimate local clock minus server clock from event timestamps
+
+    Uses the minimum of ``received - server_time`` over a sliding window.
+    That minimum is the clock offset plus the fastest network delay seen,
+    so corrected network latency is relative to the best-case path. Pass a
+    known offset (e.g. from NTP) to measure absolute network latency.
+    """
+
+    def __init__(self, window: int = 512, offset: Optional[float] = None):
+        self.fixed = offset
+        self._samples = deque(maxlen=window)
+        self._min: Optional[float] = None
+
+    @property
+    def offset(self) -> Optional[float]:
+        return self.fixed if self.fixed is not None else self._min
+
+    def update(self, received_at: float, server_time: float) -> float:
+        """Add a sample; returns the current offset"""
+        if self.fixed is not None:
+            return self.fixed
+        delta = received_at - server_time
+        samples = self._samples
+        if len(samples) == samples.maxlen and samples[0] == self._min:
+            samples.append(delta)
+            self._min = min(samples)
+        else:
+            samples.append(delta)
+            if self._min is None or delta < self._min:
+                self._min = delta
+        return self._min
+
+
+class LatencyTracker:
+    """
+    Per-room latency histograms for the WebSocket pipeline
+
+    Enabled with ``AxiomTradeWebSocketClient(track_latency=True)`` and
+    available as ``client.latency``.
+    """
+
+    def __init__(self, clock_offset: Optional[float] = None, window: int = 512):
+        """
+        Args:
+            clock_offset: Known local-minus-server clock offset in seconds;
+                          estimated from event timestamps if omitted
+            window: Samples used for the clock offset estimate
+        """
+        self.clock = ClockOffsetEstimator(window=window, offset=clock_offset)
+        self.rooms: Dict[str, Dict[str, LatencyHistogram]] = {}
+
+    @property
+    def clock_offset(self) -> Optional[float]:
+        return self.clock.offset
+
+    def record(self, room: str, stage: str, seconds: float) -> None:
+        stages = self.rooms.get(room)
+        if stages is None:
+            stages = self.rooms[room] = {}
+        histogram = stages.get(stage)
+        if histogram is None:
+            histogram = stages[stage] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def record_event_time(self, room: str, received_at: float, event_time) -> Optional[float]:
+        """
+        Record network latency for an event timestamp
+
+        Args:
+            room: Room name
+            received_at: Local wall-clock receive time (epoch seconds)
+            event_time: Server timestamp (ISO string or epoch number)
+
+        Returns:
+            float: Corrected server event time in local epoch seconds, or
+                   None if the timestamp cannot be parsed
+        """
+        parsed = parse_timestamp(event_time)
+        if parsed is None:
+            return None
+        server_time = parsed.timestamp()
+        offset = self.clock.update(received_at, server_time)
+        local_event_time = server_time + offset
+        self.record(room, "network", received_at - local_event_time)
+        return local_event_time
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Summaries as ``{room: {stage: {count, mean_ms, p50_ms, ...}}}``"""
+        return {
+            room: {stage: stages[stage].to_dict() for stage in STAGES if stage in stages}
+            for room, stages in self.rooms.items()
+        }
+
+    def reset(self) -> None:
+        self.rooms.clear()
+
+    def report(self) -> str:
+        """Format the histograms as a plain-text table"""
+        offset = self.clock_offset
+        lines = [
+            "clock offset: "
+            + ("unknown" if offset is None else f"{offset * 1e3:.3f} ms"),
+            f"{'room':<24} {'stage':<10} {'count':>8} {'p50 ms':>9} "
+            f"{'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}",
+        ]
+        for room, stages in sorted(self.rooms.items()):
+            for stage in STAGES:
+                if stage not in stages:
+                    continue
+                s = stages[stage].to_dict()
+                lines.append(
+                    f"{room[:24]:<24} {stage:<10} {s['count']:>8} {s['p50_ms']:>9.3f} "
+                    f"{s['p90_ms']:>9.3f} {s['p99_ms']:>9.3f} {s['max_ms']:>9.3f}"
+                )
+        return "\n".join(lines)
@@ -0,0 +1,335 @@
+"""
+Local stand-in for the Axiom WebSocket cluster
+Speaks the join/leave room protocol and emits synthetic traffic for load and soak testing
+
+Example:
+    server = LocalAxiomServer(rates={"new_pairs": 500, "wallet": 50}, shape="burst")
+    await server.start()
+    client = AxiomTradeWebSocketClient(auth_manager=LocalAuthManager())
+    client.ws_url = server.url
+
+Or from a shell:
+    python -m axiomtradeapi.websocket.local_server --port 8765 --rate new_pairs=500
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import time
+from typing import Dict, Optional, Set
+
+import websockets
+
+from axiomtradeapi import codec
+from axiomtradeapi.auth.auth_manager import AuthTokens
+from axiomtradeapi.websocket.synthetic import SyntheticFeed, room_kind
+
+# Frames per second, per room
+DEFAULT_RATES = {
+    "new_pairs": 5.0,
+    "update_pulse_v2": 20.0,
+    "sol_price": 1.0,
+    "token_price": 10.0,
+    "wallet": 5.0,
+}
+
+SHAPES = ("steady", "poisson", "burst")
+
+
+class LocalAuthManager:
+    """Auth manager stand-in that always holds valid dummy tokens"""
+
+    def __init__(self):
+        now = time.time()
+        self.tokens = AuthTokens(
+            access_token="local-access-token",
+            refresh_token="local-refresh-token",
+            expires_at=now + 10 * 365 * 24 * 3600,
+            issued_at=now,
+        )
+
+    def ensure_valid_authentication(self) -> bool:
+        return True
+
+    def get_tokens(self) -> AuthTokens:
+        return self.tokens
+
+
+class LocalAxiomServer:
+    """
+    In-process WebSocket server that mimics the Axiom room protocol
+
+    Clients send ``{"action": "join", "room": ...}`` (and ``leave``); each
+    joined room then receives synthetic frames at its configured rate.
+    Room kinds are ``new_pairs``, ``update_pulse_v2``, ``sol_price``,
+    ``wallet`` (``v:<wallet>`` rooms) and ``token_price`` (any other room).
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        rates: Optional[Dict[str, float]] = None,
+        shape: str = "steady",
+        burst_size: int = 50,
+        tick: float = 0.005,
+        disconnect_every: Optional[float] = None,
+        abrupt_disconnects: bool = True,
+        require_auth: bool = False,
+        seed: Optional[int] = None,
+        log_level: int = logging.INFO,
+    ):
+        """
+        Configure the stand-in server
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port, see ``url`` after start)
+            rates: Frames per second per room kind, merged over DEFAULT_RATES
+            shape: "steady" (evenly spaced), "poisson" (random arrivals) or
+                   "burst" (``burst_size`` frames back to back)
+            burst_size: Frames per burst when shape is "burst"
+            tick: Scheduler resolution in seconds
+            disconnect_every: Drop all client connections every N seconds
+            abrupt_disconnects: Abort the TCP connection instead of a close handshake
+            require_auth: Reject clients without an auth-access-token cookie (HTTP 401)
+            seed: Seed for reproducible synthetic content and arrivals
+            log_level: Logging level
+        """
+        if shape not in SHAPES:
+            raise ValueError(f"Unknown shape '{shape}'. Choose from: {', '.join(SHAPES)}")
+
+        self.host = host
+        self.port = port
+        self.rates = dict(DEFAULT_RATES)
+        self.rates.update(rates or {})
+        self.shape = shape
+        self.burst_size = max(1, burst_size)
+        self.tick = tick
+        self.disconnect_every = disconnect_every
+        self.abrupt_disconnects = abrupt_disconnects
+        self.require_auth = require_auth
+
+        self.feed = SyntheticFeed(seed)
+
+        self.logger = logging.getLogger("LocalAxiomServer")
+        self.logger.setLevel(log_level)
+
+        self._server = None
+        self._connections: Set = set()
+        self._subscribers: Dict[str, Set] = {}
+        self._streams: Dict[str, asyncio.Task] = {}
+        self._disconnector: Optional[asyncio.Task] = None
+
+        self.stats = {"connections": 0, "joins": 0, "frames_sent": 0, "disconnects": 0}
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}/"
+
+    async def start(self) -> "LocalAxiomServer":
+        """Start listening; returns self once the port is bound"""
+        self._server = await websockets.serve(
+            self._handler,
+            self.host,
+            self.port,
+            process_request=self._check_auth if self.require_auth else None,
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        if self.disconnect_every:
+            self._disconnector = asyncio.ensure_future(self._disconnect_loop())
+        self.logger.info(f"Local Axiom server listening on {self.url}")
+        return self
+
+    async def stop(self) -> None:
+        """Stop streams and close every connection"""
+        if self._disconnector:
+            self._disconnector.cancel()
+        for task in self._streams.values():
+            task.cancel()
+        self._streams.clear()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "LocalAxiomServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    def drop_connections(self, abrupt: Optional[bool] = None) -> int:
+        """
+        Disconnect every client now
+
+        Args:
+            abrupt: Abort the TCP connection (default: ``abrupt_disconnects``)
+
+        Returns:
+            int: Number of connections dropped
+        """
+        abrupt = self.abrupt_disconnects if abrupt is None else abrupt
+        connections = list(self._connections)
+        for websocket in connections:
+            if abrupt:
+                websocket.transport.abort()
+            else:
+                asyncio.ensure_future(websocket.close(code=1012, reason="restart"))
+        self.stats["disconnects"] += len(connections)
+        return len(connections)
+
+    async def _check_auth(self, path, request_headers):
+        if "auth-access-token=" not in request_headers.get("Cookie", ""):
+            return 401, [], b"Unauthorized\n"
+        return None
+
+    async def _handler(self, websocket, path: str = "/") -> None:
+        self.stats["connections"] += 1
+        self._connections.add(websocket)
+        rooms = set()
+        try:
+            async for message in websocket:
+                try:
+                    request = codec.loads(message)
+                    action, room = request.get("action"), request.get("room")
+                except (codec.DecodeError + (AttributeError,)):
+                    continue
+                if not isinstance(room, str):
+                    continue
+                if action == "join":
+                    rooms.add(room)
+                    self._join(websocket, room)
+                elif action == "leave":
+                    rooms.discard(room)
+                    self._leave(websocket, room)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            self._connections.discard(websocket)
+            for room in rooms:
+                self._leave(websocket, room)
+
+    def _join(self, websocket, room: str) -> None:
+        self.stats["joins"] += 1
+        self._subscribers.setdefault(room, set()).add(websocket)
+        if room not in self._streams:
+            self._streams[room] = asyncio.ensure_future(self._stream(room))
+
+    def _leave(self, websocket, room: str) -> None:
+        subscribers = self._subscribers.get(room)
+        if subscribers is None:
+            return
+        subscribers.discard(websocket)
+        if not subscribers:
+            del self._subscribers[room]
+            task = self._streams.pop(room, None)
+            if task:
+                task.cancel()
+
+    def _arrivals(self, expected: float) -> int:
+        """Number of frames to emit this tick for the configured shape"""
+        if self.shape == "poisson":
+            # Knuth's method is fine for the small per-tick means used here
+            if expected > 30:
+                return max(0, int(round(self.feed.rng.gauss(expected, math.sqrt(expected)))))
+            limit, count, product = math.exp(-expected), 0, self.feed.rng.random()
+            while product > limit:
+                count += 1
+                product *= self.feed.rng.random()
+            return count
+        return int(expected)
+
+    async def _stream(self, room: str) -> None:
+        rate = self.rates.get(room_kind(room), 0.0)
+        if rate <= 0:
+            return
+        loop = asyncio.get_event_loop()
+        frame_for = self.feed.frame_for
+        carry = 0.0
+        last = loop.time()
+        burst_interval = self.burst_size / rate
+        next_burst = last + burst_interval
+        while True:
+            await asyncio.sleep(self.tick)
+            now = loop.time()
+            if self.shape == "burst":
+                if now < next_burst:
+                    continue
+                count = self.burst_size
+                next_burst += burst_interval
+            else:
+                carry += rate * (now - last)
+                count = self._arrivals(carry) if self.shape == "poisson" else int(carry)
+                carry = carry - count if self.shape == "steady" else 0.0
+            last = now
+
+            subscribers = self._subscribers.get(room)
+            if not subscribers or not count:
+                continue
+            event_time = time.time()
+            for _ in range(count):
+                websockets.broadcast(subscribers, frame_for(room, event_time))
+            self.stats["frames_sent"] += count * len(subscribers)
+
+    async def _disconnect_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.disconnect_every)
+            dropped = self.drop_connections()
+            self.logger.info(f"Injected disconnect of {dropped} connection(s)")
+
+
+def _parse_rates(values) -> Dict[str, float]:
+    rates = {}
+    for value in values or ():
+        kind, _, rate = value.partition("=")
+        rates[kind] = float(rate)
+    return rates
+
+
+async def _serve_forever(args) -> None:
+    server = LocalAxiomServer(
+        host=args.host,
+        port=args.port,
+        rates=_parse_rates(args.rate),
+        shape=args.shape,
+        burst_size=args.burst_size,
+        disconnect_every=args.disconnect_every,
+        require_auth=args.require_auth,
+        seed=args.seed,
+    )
+    await server.start()
+    print(server.url, flush=True)
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in Axiom WebSocket server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--rate",
+        action="append",
+        metavar="KIND=HZ",
+        help="per-room rate, e.g. new_pairs=500 wallet=50 (repeatable)",
+    )
+    parser.add_argument("--shape", choices=SHAPES, default="steady")
+    parser.add_argument("--burst-size", type=int, default=50)
+    parser.add_argument("--disconnect-every", type=float, default=None)
+    parser.add_argument("--require-auth", action="store_true")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_serve_forever(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
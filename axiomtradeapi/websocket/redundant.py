@@ -0,0 +1,207 @@
+"""
+Active-active WebSocket feeds for Axiom Trade API
+Keeps sockets to several clusters subscribed to the same rooms and delivers whichever copy of an event arrives first
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from axiomtradeapi.websocket._client import AxiomTradeWebSocketClient
+from axiomtradeapi.websocket.dedup import DedupWindow
+
+DEFAULT_CLUSTER_URLS = (
+    "wss://cluster-euc2.axiom.trade/",
+    "wss://cluster-usc2.axiom.trade/",
+)
+
+
+class RedundantWebSocketClient:
+    """
+    Hot-standby WebSocket client over several Axiom clusters
+
+    Every leg is an ``AxiomTradeWebSocketClient`` connected to its own
+    cluster and joined to the same rooms. Legs share one ``DedupWindow``:
+    ``new_pairs`` events (by ``pair_address``) and wallet transactions (by
+    ``signature``) are delivered once even if the clusters serialize them
+    differently. Other rooms (prices, pulse updates) carry no stable key
+    and are delivered by every leg. A leg
+    that disconnects reconnects in the background while the others keep
+    delivering, so failover has no gap.
+    """
+
+    def __init__(
+        self,
+        auth_manager,
+        urls: Sequence[str] = DEFAULT_CLUSTER_URLS,
+        log_level=logging.INFO,
+        raw_events: bool = True,
+        dedup_window: int = 8192,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ) -> None:
+        """
+        Args:
+            auth_manager: Authenticated AuthManager shared by every leg
+            urls: Cluster WebSocket URLs, one leg per URL
+            log_level: Logging level
+            raw_events: Deliver raw dicts (default) instead of typed models
+            dedup_window: Number of recent event keys remembered
+            reconnect_delay: Initial delay before reconnecting a dropped leg
+            max_reconnect_delay: Upper bound of the exponential backoff
+        """
+        if not urls:
+            raise ValueError("At least one cluster URL is required")
+
+        self.logger = logging.getLogger("AxiomTradeRedundantWebSocket")
+        self.logger.setLevel(log_level)
+
+        self.dedup = DedupWindow(dedup_window)
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self.legs: List[AxiomTradeWebSocketClient] = []
+        for url in urls:
+            leg = AxiomTradeWebSocketClient(
+                auth_manager, log_level=log_level, raw_events=raw_events
+            )
+            leg.ws_url = url
+            leg.dedup = self.dedup
+            self.legs.append(leg)
+
+        # (method name, args) replayed on every leg after each (re)connect
+        self._subscriptions: List[Tuple[str, tuple]] = []
+        self._tasks: List[asyncio.Future] = []
+        self.reconnects: Dict[str, int] = {url: 0 for url in urls}
+
+    async def subscribe_new_tokens(self, callback: Callable[[Dict[str, Any]], None]):
+        """Subscribe every leg to new token updates."""
+        return await self._subscribe("subscribe_new_tokens", (callback,))
+
+    async def subscribe_wallet_transactions(
+        self, wallet_address: str, callback: Callable[[Dict[str, Any]], None]
+    ):
+        """Subscribe every leg to wallet transaction updates."""
+        return await self._subscribe(
+            "subscribe_wallet_transactions", (wallet_address, callback)
+        )
+
+    async def subscribe_sol_price(self, callback: Callable[[Dict[str, Any]], None]):
+        """Subscribe every leg to sol price updates."""
+        return await self._subscribe("subscribe_sol_price", (callback,))
+
+    async def subscribe_token_price(
+        self, token: str, callback: Callable[[Dict[str, Any]], None]
+    ):
+        """Subscribe every leg to token price updates."""
+        return await self._subscribe("subscribe_token_price", (token, callback))
+
+    async def unsubscribe_new_tokens(self, callback: Optional[Callable] = None) -> bool:
+        """Stop new token updates on every leg."""
+        return await self._unsubscribe("new_tokens", (), callback)
+
+    async def unsubscribe_wallet_transactions(
+        self, wallet_address: str, callback: Optional[Callable] = None
+    ) -> bool:
+        """Stop wallet transaction updates on every leg."""
+        return await self._unsubscribe("wallet_transactions", (wallet_address,), callback)
+
+    async def unsubscribe_sol_price(self, callback: Optional[Callable] = None) -> bool:
+        """Stop sol price updates on every leg."""
+        return await self._unsubscribe("sol_price", (), callback)
+
+    async def unsubscribe_token_price(
+        self, token: str, callback: Optional[Callable] = None
+    ) -> bool:
+        """Stop token price updates on every leg."""
+        return await self._unsubscribe("token_price", (token,), callback)
+
+    @property
+    def subscriptions(self) -> Dict[str, int]:
+        """Live rooms and their number of consumers"""
+        return self.legs[0].subscriptions
+
+    async def _subscribe(self, method: str, args: tuple) -> bool:
+        if (method, args) not in self._subscriptions:
+            self._subscriptions.append((method, args))
+        results = await asyncio.gather(
+            *(getattr(leg, method)(*args) for leg in self.legs if leg.ws),
+            return_exceptions=True,
+        )
+        return any(result is True for result in results) or not results
+
+    async def _unsubscribe(self, feed: str, args: tuple, callback: Optional[Callable]) -> bool:
+        subscribe_method = f"subscribe_{feed}"
+        for index in range(len(self._subscriptions) - 1, -1, -1):
+            method, subscribed = self._subscriptions[index]
+            if method == subscribe_method and subscribed[:-1] == args:
+                if callback is None or subscribed[-1] is callback:
+                    del self._subscriptions[index]
+                    break
+        results = await asyncio.gather(
+            *(getattr(leg, f"unsubscribe_{feed}")(*args, callback) for leg in self.legs),
+            return_exceptions=True,
+        )
+        return any(result is True for result in results)
+
+    @property
+    def connected(self) -> List[str]:
+        """URLs of the legs that currently have an open socket"""
+        return [leg.ws_url for leg in self.legs if leg.ws and leg.ws.open]
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-leg frame counters; ``duplicates`` are copies another leg delivered first"""
+        return {
+            leg.ws_url: dict(leg.frame_stats, reconnects=self.reconnects[leg.ws_url])
+            for leg in self.legs
+        }
+
+    async def _connect_leg(self, leg: AxiomTradeWebSocketClient) -> bool:
+        if not await leg.connect():
+            return False
+        for method, args in self._subscriptions:
+            if not await getattr(leg, method)(*args):
+                return False
+        return True
+
+    async def _run_leg(self, leg: AxiomTradeWebSocketClient) -> None:
+        """Keep one leg connected and subscribed until cancelled."""
+        delay = self.reconnect_delay
+        while True:
+            try:
+                if await self._connect_leg(leg):
+                    delay = self.reconnect_delay
+                    await leg._message_handler()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"Leg {leg.ws_url} disconnected: {e}")
+
+            if leg.ws is not None:
+                try:
+                    await leg.ws.close()
+                except Exception:
+                    pass
+                leg.ws = None
+            self.reconnects[leg.ws_url] += 1
+            self.logger.info(f"Reconnecting leg {leg.ws_url} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def start(self) -> None:
+        """Run every leg until ``close`` is called."""
+        self._tasks = [asyncio.ensure_future(self._run_leg(leg)) for leg in self.legs]
+        try:
+            await asyncio.gather(*self._tasks)
+        except asyncio.CancelledError:
+            pass
+
+    async def close(self) -> None:
+        """Stop every leg and close its socket."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        for leg in self.legs:
+            await leg.close()
+            leg.ws = None
@@ -0,0 +1,161 @@
+"""
+Synthetic Axiom WebSocket traffic
+Generates frames shaped like the live feed for offline testing and benchmarks
+"""
+
+import random
+import string
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from axiomtradeapi import codec
+
+_ALPHABET = string.ascii_letters + string.digits
+
+# Rooms with a fixed name; anything else is a token price or "v:<wallet>" room
+FIXED_ROOMS = ("new_pairs", "update_pulse_v2", "sol_price")
+
+
+def room_kind(room: str) -> str:
+    """Classify a room as new_pairs, update_pulse_v2, sol_price, wallet or token_price"""
+    if room in FIXED_ROOMS:
+        return room
+    if room.startswith("v:"):
+        return "wallet"
+    return "token_price"
+
+
+def iso_timestamp(epoch: float) -> str:
+    """Format epoch seconds the way Axiom does (ISO-8601, UTC, ``Z`` suffix)"""
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).isoformat().replace(
+        "+00:00", "Z"
+    )
+
+
+class SyntheticFeed:
+    """
+    Reproducible generator of Axiom-like frames
+
+    Every method returns a compact JSON text frame. ``now`` is the event
+    time written into ``created_at`` fields (defaults to the current time),
+    so consumers can measure end-to-end latency against a local server.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
+
+    def address(self) -> str:
+        choice = self.rng.choice
+        return "".join(choice(_ALPHABET) for _ in range(44))
+
+    def new_pair(self, now: float = None) -> str:
+        rng = self.rng
+        now = time.time() if now is None else now
+        return codec.dumps(
+            {
+                "room": "new_pairs",
+                "content": {
+                    "pair_address": self.address(),
+                    "token_address": self.address(),
+                    "deployer_address": self.address(),
+                    "token_name": "Token " + str(rng.randint(0, 99999)),
+                    "token_ticker": "TKN",
+                    "token_image": "https://axiomtrading.sfo3.cdn.digitaloceanspaces.com/x.webp",
+                    "token_decimals": 6,
+                    "protocol": "Pump V1",
+                    "created_at": iso_timestamp(now),
+                    "initial_liquidity_sol": rng.random() * 100,
+                    "initial_liquidity_token": rng.random() * 1e9,
+                    "supply": 1_000_000_000,
+                    "dev_holds_percent": rng.random() * 10,
+                    "top_10_holders": rng.random() * 50,
+                    "lp_burned": 100,
+                    "twitter": None,
+                    "telegram": None,
+                    "website": None,
+                    "protocol_details": {"isTokenSideX": rng.random() > 0.5},
+                },
+            }
+        )
+
+    def update_pulse(self, now: float = None) -> str:
+        rng = self.rng
+        return codec.dumps(
+            {
+                "room": "update_pulse_v2",
+                "content": [
+                    [self.address(), rng.random() * 1e5, rng.randint(0, 5000)]
+                    for _ in range(rng.randint(1, 8))
+                ],
+            }
+        )
+
+    def sol_price(self, now: float = None) -> str:
+        return codec.dumps({"room": "sol_price", "content": 150 + self.rng.random() * 10})
+
+    def token_price(self, token: str, now: float = None) -> str:
+        rng = self.rng
+        return codec.dumps(
+            {
+                "room": token,
+                "content": {
+                    "price": rng.random() * 1e-4,
+                    "price_sol": rng.random() * 1e-6,
+                },
+            }
+        )
+
+    def wallet_transaction(self, wallet: str, now: float = None) -> str:
+        rng = self.rng
+        now = time.time() if now is None else now
+        return codec.dumps(
+            {
+                "room": f"v:{wallet}",
+                "content": {
+                    "created_at": iso_timestamp(now),
+                    "liquidity_sol": rng.random() * 100,
+                    "liquidity_token": rng.random() * 1e9,
+                    "maker_address": wallet,
+                    "price_sol": rng.random() * 1e-6,
+                    "price_usd": rng.random() * 1e-4,
+                    "signature": self.address() + self.address(),
+                    "token_amount": rng.random() * 1e7,
+                    "total_sol": rng.random() * 5,
+                    "total_usd": rng.random() * 800,
+                    "type": rng.choice(("buy", "sell")),
+                    "pair_address": self.address(),
+                    "f": 0,
+                    "pair": {
+                        "tokenAddress": self.address(),
+                        "tokenName": "Token",
+                        "tokenTicker": "TKN",
+                        "tokenImage": None,
+                        "protocol": "Pump V1",
+                        "protocolDetails": {
+                            "pairSolAccount": self.address(),
+                            "tokenProgram": self.address(),
+                            "pairTokenAccount": self.address(),
+                            "isTokenSideX": True,
+                        },
+                        "supply": 1_000_000_000,
+                        "tokenDecimals": 6,
+                        "pairCreatedAt": iso_timestamp(now - rng.random() * 3600),
+                        "extra": None,
+                    },
+                },
+            }
+        )
+
+    def frame_for(self, room: str, now: float = None) -> str:
+        """Generate a frame for any room name"""
+        kind = room_kind(room)
+        if kind == "new_pairs":
+            return self.new_pair(now)
+        if kind == "update_pulse_v2":
+            return self.update_pulse(now)
+        if kind == "sol_price":
+            return self.sol_price(now)
+        if kind == "wallet":
+            return self.wallet_transaction(room[2:], now)
+        return self.token_price(room, now)
@@ -0,0 +1,244 @@
+"""
+Background-thread runtime for Axiom WebSocket feeds
+Runs the socket reader and decoder on a private event loop so synchronous applications keep their main thread
+"""
+
+import asyncio
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+
+from axiomtradeapi.websocket._client import AxiomTradeWebSocketClient
+
+# Marks the end of the event queue after close()
+_CLOSED = object()
+
+
+class ThreadedWebSocketClient:
+    """
+    ``AxiomTradeWebSocketClient`` driven from a dedicated thread
+
+    The wrapped client, its socket reads and frame decoding live on a
+    private event loop in a daemon thread. All methods here are plain
+    blocking calls that can be used from any thread.
+
+    Events reach the application in one of two ways:
+
+    - subscribe without a callback and read ``(room, payload)`` tuples
+      from ``get()`` / ``events()``. The queue is bounded; when it is full
+      the oldest event is dropped (counted in ``stats["dropped"]``) so a
+      slow consumer never stalls the reader.
+    - subscribe with a plain function; it runs on the client's callback
+      pool (in order per room), never on the reader thread. ``async def``
+      callbacks run on the runtime's own loop.
+
+    Application CPU load then only competes with the reader for the GIL
+    instead of blocking it until the application yields. New token events
+    (``new_pairs`` and ``update_pulse_v2``) are queued under ``"new_pairs"``.
+    """
+
+    def __init__(
+        self,
+        auth_manager=None,
+        client: Optional[AxiomTradeWebSocketClient] = None,
+        max_events: int = 10000,
+        timeout: float = 10.0,
+        **client_kwargs,
+    ):
+        """
+        Args:
+            auth_manager: AuthManager for a new client (ignored if ``client`` is given)
+            client: Existing client to run instead of creating one
+            max_events: Capacity of the event queue
+            timeout: Default seconds to wait for calls made on the runtime loop
+            **client_kwargs: Passed to ``AxiomTradeWebSocketClient``
+        """
+        self.client = client or AxiomTradeWebSocketClient(auth_manager, **client_kwargs)
+        self.logger = self.client.logger
+        self.timeout = timeout
+
+        self.events_queue: "queue.Queue[Tuple[str, Any]]" = queue.Queue(maxsize=max_events)
+        self.stats = {"queued": 0, "dropped": 0}
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._handler: Optional[Future] = None
+        self._lock = threading.Lock()
+        self._queue_callbacks: Dict[str, Callable] = {}
+
+    # Runtime thread
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self.loop is None:
+                # Created on first use so a policy from install_uvloop() applies
+                self.loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(self.loop,),
+                    name="axiom-websocket",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self.loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def call(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the runtime loop and wait for its result"""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        return future.result(self.timeout if timeout is None else timeout)
+
+    @property
+    def running(self) -> bool:
+        """True while the message handler is reading the socket"""
+        return self._handler is not None and not self._handler.done()
+
+    def start(self) -> bool:
+        """
+        Start reading in the background and return immediately
+
+        Returns:
+            bool: False if the client could not connect
+        """
+        if self.running:
+            return True
+        if self.client.ws is None and not self.call(self.client.connect()):
+            return False
+        self._handler = asyncio.run_coroutine_threadsafe(
+            self.client.start(), self._ensure_loop()
+        )
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Close the socket, stop the runtime thread and end ``events()``"""
+        if self.loop is None:
+            return
+        try:
+            self.call(self.client.close(), timeout)
+        except Exception as e:
+            self.logger.error(f"Error closing WebSocket client: {e}")
+        if self._handler is not None:
+            self._handler.cancel()
+            self._handler = None
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(self.timeout if timeout is None else timeout)
+        self.loop = None
+        self._thread = None
+        self._put(_CLOSED)
+
+    def __enter__(self) -> "ThreadedWebSocketClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # Event queue
+
+    def _put(self, item: Any) -> None:
+        while True:
+            try:
+                self.events_queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.events_queue.get_nowait()
+                    self.stats["dropped"] += 1
+                except queue.Empty:
+                    pass
+
+    def _queue_callback(self, room: str) -> Callable:
+        """One enqueuing callback per room, so unsubscribe can find it again"""
+        callback = self._queue_callbacks.get(room)
+        if callback is None:
+
+            async def enqueue(payload):
+                self.stats["queued"] += 1
+                self._put((room, payload))
+
+            callback = self._queue_callbacks[room] = enqueue
+        return callback
+
+    def get(self, timeout: Optional[float] = None) -> Tuple[str, Any]:
+        """
+        Next queued ``(room, payload)`` event
+
+        Raises:
+            queue.Empty: If nothing arrives within ``timeout``
+            EOFError: If the client was closed
+        """
+        item = self.events_queue.get(timeout=timeout)
+        if item is _CLOSED:
+            raise EOFError("WebSocket client closed")
+        return item
+
+    def events(self, timeout: Optional[float] = None) -> Iterator[Tuple[str, Any]]:
+        """Iterate queued events until ``close`` (or ``timeout`` seconds of silence)"""
+        while True:
+            try:
+                yield self.get(timeout)
+            except (queue.Empty, EOFError):
+                return
+
+    # Subscriptions
+
+    def subscribe_new_tokens(self, callback: Optional[Callable] = None) -> bool:
+        """Subscribe to new token updates; queued under "new_pairs" without a callback"""
+        return self.call(
+            self.client.subscribe_new_tokens(callback or self._queue_callback("new_pairs"))
+        )
+
+    def subscribe_sol_price(self, callback: Optional[Callable] = None) -> bool:
+        """Subscribe to sol price updates"""
+        return self.call(
+            self.client.subscribe_sol_price(callback or self._queue_callback("sol_price"))
+        )
+
+    def subscribe_token_price(self, token: str, callback: Optional[Callable] = None) -> bool:
+        """Subscribe to token price updates"""
+        return self.call(
+            self.client.subscribe_token_price(token, callback or self._queue_callback(token))
+        )
+
+    def subscribe_wallet_transactions(
+        self, wallet_address: str, callback: Optional[Callable] = None
+    ) -> bool:
+        """Subscribe to wallet transaction updates; queued under "v:<wallet>" without a callback"""
+        room = f"v:{wallet_address}"
+        return self.call(
+            self.client.subscribe_wallet_transactions(
+                wallet_address, callback or self._queue_callback(room)
+            )
+        )
+
+    def unsubscribe_new_tokens(self, callback: Optional[Callable] = None) -> bool:
+        return self.call(
+            self.client.unsubscribe_new_tokens(callback or self._queue_callbacks.get("new_pairs"))
+        )
+
+    def unsubscribe_sol_price(self, callback: Optional[Callable] = None) -> bool:
+        return self.call(
+            self.client.unsubscribe_sol_price(callback or self._queue_callbacks.get("sol_price"))
+        )
+
+    def unsubscribe_token_price(self, token: str, callback: Optional[Callable] = None) -> bool:
+        return self.call(
+            self.client.unsubscribe_token_price(token, callback or self._queue_callbacks.get(token))
+        )
+
+    def unsubscribe_wallet_transactions(
+        self, wallet_address: str, callback: Optional[Callable] = None
+    ) -> bool:
+        room = f"v:{wallet_address}"
+        return self.call(
+            self.client.unsubscribe_wallet_transactions(
+                wallet_address, callback or self._queue_callbacks.get(room)
+            )
+        )
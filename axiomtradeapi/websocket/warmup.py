@@ -0,0 +1,65 @@
+"""
+Concurrent cold start of several Axiom WebSocket feeds
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from axiomtradeapi.websocket._client import AxiomTradeWebSocketClient
+
+# (client, {room: callback}, feed) -- feed is "main", "token_price" or "sol_price"
+FeedPlan = Tuple[AxiomTradeWebSocketClient, Dict[str, Callable], str]
+
+# (index of the socket in the plan, room)
+SocketRoom = Tuple[int, str]
+
+
+@dataclass
+class WarmUpReport:
+    """
+    Outcome of ``warm_up_feeds``
+
+    Times are keyed by ``(plan index, room)``, so a room warmed on several
+    sockets (e.g. redundant legs) is reported once per socket.
+    """
+
+    elapsed: float
+    first_event: Dict[SocketRoom, Optional[float]] = field(default_factory=dict)
+
+    @property
+    def pending(self) -> List[SocketRoom]:
+        """Sockets and rooms that produced no event before the timeout"""
+        return [key for key, seconds in self.first_event.items() if seconds is None]
+
+    @property
+    def ok(self) -> bool:
+        return not self.pending
+
+
+async def warm_up_feeds(plan: Sequence[FeedPlan], timeout: float = 10.0) -> WarmUpReport:
+    """
+    Open every socket concurrently and wait until each room has streamed
+
+    Each client connects, joins its rooms in one batch and starts its
+    message handler in the background (see
+    ``AxiomTradeWebSocketClient.warm_up``). Call ``start()`` on the clients
+    afterwards, or just keep the event loop running.
+
+    Args:
+        plan: (client, {room: callback}, feed) per socket
+        timeout: Seconds to wait for the first event of every room
+
+    Returns:
+        WarmUpReport: Total time and time-to-first-event per socket and room
+    """
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(client.warm_up(rooms, feed=feed, timeout=timeout) for client, rooms, feed in plan)
+    )
+    report = WarmUpReport(elapsed=time.perf_counter() - started)
+    for index, first_event in enumerate(results):
+        for room, seconds in first_event.items():
+            report.first_event[(index, room)] = seconds
+    return report
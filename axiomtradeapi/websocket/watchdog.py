@@ -0,0 +1,211 @@
+"""
+Event-loop watchdog for the Axiom WebSocket runtime
+Measures loop lag, reports the callback and stack behind each stall, and can move stalling callbacks to a thread pool
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional, Set
+
+from axiomtradeapi.websocket.latency import LatencyHistogram
+
+
+@dataclass
+class Stall:
+    """A period during which the event loop did not run"""
+
+    started_at: float
+    duration: float
+    callback: Optional[str]
+    room: Optional[str]
+    stack: str
+
+
+def callback_name(callback: Callable) -> str:
+    return getattr(callback, "__qualname__", None) or repr(callback)
+
+
+def _call_blocking(callback: Callable, payload: Any) -> None:
+    """Run a callback on a worker thread; coroutines get a private event loop"""
+    result = callback(payload)
+    if asyncio.iscoroutine(result):
+        asyncio.run(result)
+
+
+class LoopWatchdog:
+    """
+    Event-loop lag and stall monitor
+
+    A heartbeat task on the loop records scheduling lag every ``interval``
+    seconds. A monitor thread notices when the heartbeat stops for longer
+    than ``stall_threshold`` and captures the loop thread's stack together
+    with the callback the client was running. With ``offload_after`` set,
+    a callback blamed for that many stalls is run on a thread pool from
+    then on (coroutine callbacks get their own event loop there, so they
+    must not touch objects bound to the main loop).
+
+    Pass it as ``AxiomTradeWebSocketClient(watchdog=LoopWatchdog())``.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.05,
+        stall_threshold: float = 0.25,
+        offload_after: Optional[int] = None,
+        max_workers: int = 4,
+        history: int = 100,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Args:
+            interval: Heartbeat period in seconds
+            stall_threshold: Heartbeat silence (seconds) reported as a stall
+            offload_after: Stalls after which a callback moves to the thread
+                           pool (None never offloads)
+            max_workers: Thread pool size for offloaded callbacks
+            history: Number of recent stalls kept in ``stalls``
+            logger: Logger for stall reports
+        """
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.offload_after = offload_after
+        self.max_workers = max_workers
+        self.logger = logger or logging.getLogger("AxiomTradeWatchdog")
+
+        self.lag = LatencyHistogram()
+        self.stalls: Deque[Stall] = deque(maxlen=history)
+        self.stall_counts: Dict[str, int] = {}
+        self.offloaded: Set[Callable] = set()
+
+        self._current: Optional[tuple] = None  # (room, callback)
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Future] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop: Optional[threading.Event] = None
+        self._stall: Optional[Stall] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._users = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        """Start monitoring the running event loop (nested calls are counted)"""
+        self._users += 1
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop = threading.Event()
+        self._task = asyncio.ensure_future(self._beat())
+        self._thread = threading.Thread(
+            target=self._monitor,
+            args=(self._stop,),
+            name="axiom-loop-watchdog",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop monitoring once every ``start`` has been matched"""
+        self._users = max(0, self._users - 1)
+        if self._users or self._task is None:
+            return
+        self._task.cancel()
+        self._task = None
+        self._stop.set()
+        self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def enter(self, room: str, callback: Callable) -> None:
+        """Mark ``callback`` as running (called by the client)"""
+        self._current = (room, callback)
+
+    def exit(self) -> None:
+        self._current = None
+
+    async def run_offloaded(self, callback: Callable, payload: Any) -> None:
+        """Run a callback on the watchdog's thread pool and wait for it"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="axiom-callback"
+            )
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(self._executor, _call_blocking, callback, payload)
+
+    def stats(self) -> Dict[str, Any]:
+        """Lag summary (ms), stall count and offloaded callbacks"""
+        return {
+            "lag": self.lag.to_dict(),
+            "stalls": len(self.stalls),
+            "stall_counts": dict(self.stall_counts),
+            "offloaded": sorted(callback_name(callback) for callback in self.offloaded),
+        }
+
+    async def _beat(self) -> None:
+        loop = asyncio.get_event_loop()
+        interval = self.interval
+        while True:
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            self.lag.record(loop.time() - expected)
+            self._heartbeat = time.monotonic()
+
+    def _monitor(self, stop: threading.Event) -> None:
+        check = min(self.interval, self.stall_threshold / 2)
+        while not stop.wait(check):
+            silent = time.monotonic() - self._heartbeat
+            stall = self._stall
+            if silent <= self.stall_threshold + self.interval:
+                if stall is not None:
+                    self._finish_stall(stall)
+                continue
+            if stall is None:
+                self._begin_stall(silent)
+            else:
+                stall.duration = silent
+
+    def _begin_stall(self, silent: float) -> None:
+        current = self._current
+        room, callback = current if current else (None, None)
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+        name = callback_name(callback) if callback is not None else None
+        self._stall = Stall(time.time() - silent, silent, name, room, stack)
+        self.logger.warning(
+            f"Event loop stalled for {silent * 1e3:.0f}ms"
+            + (f" in callback {name} (room {room})" if name else "")
+            + f"\n{stack}"
+        )
+        if callback is None:
+            return
+        count = self.stall_counts.get(name, 0) + 1
+        self.stall_counts[name] = count
+        if (
+            self.offload_after is not None
+            and count >= self.offload_after
+            and callback not in self.offloaded
+        ):
+            self.offloaded.add(callback)
+            self.logger.warning(
+                f"Callback {name} stalled the loop {count} times; "
+                f"running it on a thread pool from now on"
+            )
+
+    def _finish_stall(self, stall: Stall) -> None:
+        self._stall = None
+        self.stalls.append(stall)
+        self.logger.warning(
+            f"Event loop recovered after {stall.duration * 1e3:.0f}ms stall"
+        )
@@ -0,0 +1,60 @@
+"""
+Reproducible frame mixes for offline benchmarks
+"""
+
+import os
+import sys
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from axiomtradeapi.websocket.synthetic import SyntheticFeed  # noqa: E402
+
+_EPOCH = 1_750_000_000.0
+
+
+def _event_time(feed: SyntheticFeed) -> float:
+    return _EPOCH + feed.rng.randint(0, 10_000_000)
+
+
+def mixed_frames(count: int, seed: int = 7) -> List[str]:
+    """Build a reproducible mix of new_pairs, wallet and sol_price frames"""
+    feed = SyntheticFeed(seed)
+    wallets = [feed.address() for _ in range(8)]
+    frames = []
+    for _ in range(count):
+        roll = feed.rng.random()
+        if roll < 0.3:
+            frames.append(feed.new_pair(_event_time(feed)))
+        elif roll < 0.9:
+            wallet = feed.rng.choice(wallets)
+            frames.append(feed.wallet_transaction(wallet, _event_time(feed)))
+        else:
+            frames.append(feed.sol_price())
+    return frames
+
+
+def mixed_room_capture(count: int, tokens: int = 200, seed: int = 11):
+    """
+    Build a reproducible capture spanning many rooms
+
+    Returns:
+        tuple: (frames, wallets, tokens) so callers can pick which rooms to
+        subscribe to
+    """
+    feed = SyntheticFeed(seed)
+    wallets = [feed.address() for _ in range(20)]
+    token_rooms = [feed.address() for _ in range(tokens)]
+    frames = []
+    for _ in range(count):
+        roll = feed.rng.random()
+        if roll < 0.15:
+            frames.append(feed.new_pair(_event_time(feed)))
+        elif roll < 0.45:
+            wallet = feed.rng.choice(wallets)
+            frames.append(feed.wallet_transaction(wallet, _event_time(feed)))
+        elif roll < 0.55:
+            frames.append(feed.sol_price())
+        else:
+            frames.append(feed.token_price(feed.rng.choice(token_rooms)))
+    return frames, wallets, token_rooms
@@ -0,0 +1,60 @@
+"""
+Benchmark: WebSocket frame decoding throughput per JSON backend
+
+Usage:
+    python benchmarks/bench_json_codec.py [--frames 20000] [--rounds 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from axiomtradeapi.codec import BACKEND, available_codecs  # noqa: E402
+
+from _frames import mixed_frames  # noqa: E402
+
+
+def bench(codec, frames, rounds: int) -> float:
+    """Return the best frames-per-second figure over ``rounds`` passes"""
+    loads = codec.loads
+    best = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for frame in frames:
+            loads(frame)
+        elapsed = time.perf_counter() - start
+        best = max(best, len(frames) / elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    frames = mixed_frames(args.frames)
+    # Frames arrive as text from websockets; REST bodies arrive as bytes
+    frames_bytes = [frame.encode("utf-8") for frame in frames]
+    avg_size = sum(len(f) for f in frames_bytes) / len(frames_bytes)
+
+    print(f"{len(frames)} frames, average {avg_size:.0f} bytes, import-time backend: {BACKEND}")
+    print(f"{'backend':<10} {'str frames/s':>14} {'bytes frames/s':>16}")
+
+    results = {}
+    for name, codec in available_codecs().items():
+        results[name] = bench(codec, frames, args.rounds)
+        fps_bytes = bench(codec, frames_bytes, args.rounds)
+        print(f"{name:<10} {results[name]:>14,.0f} {fps_bytes:>16,.0f}")
+
+    baseline = results.get("json")
+    for name, fps in results.items():
+        if name != "json" and baseline:
+            print(f"{name} speedup over stdlib json: {fps / baseline:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
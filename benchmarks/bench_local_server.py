@@ -0,0 +1,178 @@
+"""
+Benchmark: throughput and soak test against the local stand-in Axiom server
+
+Runs LocalAxiomServer in a separate process and drives the real
+AxiomTradeWebSocketClient against it with a reconnect loop, reporting
+delivered messages/s, dispatch latency (event time -> callback), RSS and
+reconnect counts at every interval.
+
+Usage:
+    python benchmarks/bench_local_server.py [--duration 30] [--rate new_pairs=2000]
+    python benchmarks/bench_local_server.py --duration 3600 --disconnect-every 60 --shape burst
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+import time
+from typing import Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from axiomtradeapi.websocket import AxiomTradeWebSocketClient  # noqa: E402
+from axiomtradeapi.websocket.local_server import LocalAuthManager  # noqa: E402
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def rss_mb() -> float:
+    """Resident set size of this process in MB (Linux only, 0 elsewhere)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE / 1e6
+    except (OSError, IndexError, ValueError):
+        return 0.0
+
+
+def percentile(sorted_values, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def start_server(args) -> Tuple[subprocess.Popen, str]:
+    """Launch the stand-in server and wait for it to print its URL"""
+    command = [
+        sys.executable,
+        "-m",
+        "axiomtradeapi.websocket.local_server",
+        "--port",
+        str(args.port),
+        "--shape",
+        args.shape,
+        "--burst-size",
+        str(args.burst_size),
+    ]
+    for rate in args.rate or ():
+        command += ["--rate", rate]
+    if args.disconnect_every:
+        command += ["--disconnect-every", str(args.disconnect_every)]
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    process = subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env, text=True
+    )
+    url = process.stdout.readline().strip()
+    if not url:
+        process.kill()
+        raise RuntimeError("Local server failed to start")
+    return process, url
+
+
+class Soak:
+    """Client side of the soak test: reconnect loop plus measurements"""
+
+    def __init__(self, url: str, wallets: int, track_latency: bool = False):
+        self.url = url
+        self.track_latency = track_latency
+        self.client = None
+        self.wallets = ["wallet%03d" % i for i in range(wallets)]
+        self.delivered = 0
+        self.latencies = []
+        self.reconnects = 0
+
+    def record(self, created_at) -> None:
+        self.delivered += 1
+        if created_at is not None:
+            self.latencies.append(time.time() - created_at.timestamp())
+
+    async def on_new_pair(self, data):
+        content = data.get("content")
+        self.record(getattr(content, "created_at", None))
+
+    async def on_wallet(self, transaction):
+        self.record(transaction.created_at)
+
+    async def run_client(self) -> None:
+        while True:
+            client = AxiomTradeWebSocketClient(
+                auth_manager=LocalAuthManager(),
+                log_level=logging.WARNING,
+                track_latency=self.track_latency,
+            )
+            self.client = client
+            client.ws_url = self.url
+            try:
+                if await client.subscribe_new_tokens(self.on_new_pair):
+                    for wallet in self.wallets:
+                        await client.subscribe_wallet_transactions(wallet, self.on_wallet)
+                    await client.start()
+            except Exception:
+                pass
+            self.reconnects += 1
+            await asyncio.sleep(0.05)
+
+    async def run(self, duration: float, interval: float) -> None:
+        client_task = asyncio.ensure_future(self.run_client())
+        started = last = time.perf_counter()
+        last_delivered = 0
+        print(f"{'t(s)':>6} {'msg/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} "
+              f"{'RSS MB':>7} {'reconn':>6}")
+        try:
+            while time.perf_counter() - started < duration:
+                await asyncio.sleep(interval)
+                now = time.perf_counter()
+                latencies = sorted(self.latencies)
+                self.latencies = []
+                rate = (self.delivered - last_delivered) / (now - last)
+                print(
+                    f"{now - started:6.0f} {rate:9,.0f} "
+                    f"{percentile(latencies, 0.5) * 1e3:8.2f} "
+                    f"{percentile(latencies, 0.99) * 1e3:8.2f} "
+                    f"{(latencies[-1] if latencies else 0) * 1e3:8.2f} "
+                    f"{rss_mb():7.1f} {self.reconnects:6d}"
+                )
+                last, last_delivered = now, self.delivered
+        finally:
+            client_task.cancel()
+        elapsed = time.perf_counter() - started
+        print(
+            f"total: {self.delivered:,} messages in {elapsed:.0f}s "
+            f"({self.delivered / elapsed:,.0f} msg/s), {self.reconnects} reconnects"
+        )
+        if self.client is not None and self.client.latency is not None:
+            print("per-stage latency of the last connection:")
+            print(self.client.latency.report())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument("--interval", type=float, default=5.0, help="report every N s")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--rate", action="append", metavar="KIND=HZ",
+                        help="per-room rate, e.g. new_pairs=2000 (repeatable)")
+    parser.add_argument("--shape", choices=("steady", "poisson", "burst"), default="steady")
+    parser.add_argument("--burst-size", type=int, default=50)
+    parser.add_argument("--wallets", type=int, default=10, help="wallet rooms to join")
+    parser.add_argument("--disconnect-every", type=float, default=None)
+    parser.add_argument("--stages", action="store_true",
+                        help="print per-room stage latency histograms at the end")
+    args = parser.parse_args()
+    if not args.rate:
+        args.rate = ["new_pairs=2000", "update_pulse_v2=0", "wallet=100"]
+
+    process, url = start_server(args)
+    print(f"server: {url} shape={args.shape} rates={','.join(args.rate)}")
+    try:
+        asyncio.run(Soak(url, args.wallets, args.stages).run(args.duration, args.interval))
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark: deterministic replay of a WebSocket capture through user callbacks
+
+Replays a capture recorded with AxiomTradeWebSocketClient.start_recording
+(or a synthetic one) as fast as possible and reports dispatch throughput.
+
+Usage:
+    python benchmarks/bench_replay.py [--capture feed.axcap] [--frames 50000]
+    python benchmarks/bench_replay.py --capture feed.axcap --speed 1.0
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from axiomtradeapi import codec  # noqa: E402
+from axiomtradeapi.websocket import (  # noqa: E402
+    AxiomTradeWebSocketClient,
+    CaptureWriter,
+    read_capture,
+)
+
+from _frames import mixed_room_capture  # noqa: E402
+
+
+def write_synthetic_capture(path: str, frames: int, compress: bool) -> None:
+    """Write synthetic frames in bursts of ~50 frames every 20 ms"""
+    messages, _, _ = mixed_room_capture(frames)
+    received_at = time.time()
+    with CaptureWriter(path, compress=compress) as writer:
+        for i, message in enumerate(messages):
+            received_at += 0.02 if i % 50 == 0 else 0.00001
+            writer.write(message, received_at)
+
+
+def subscribe_all(client: AxiomTradeWebSocketClient, path: str) -> dict:
+    """Register a counting callback for every room seen in the capture"""
+    counts = {}
+
+    def make_callback(room):
+        async def callback(_data):
+            counts[room] = counts.get(room, 0) + 1
+
+        return callback
+
+    for _, message in read_capture(path):
+        room = codec.peek_room(message)
+        if room is not None:
+            key = client._callback_key(room)
+            if key not in client._callbacks:
+                client._callbacks[key] = make_callback(room)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--capture", help="capture file (synthetic if omitted)")
+    parser.add_argument("--frames", type=int, default=50000)
+    parser.add_argument("--speed", type=float, default=None, help="1.0 = real time")
+    parser.add_argument("--compress", action="store_true", help="zstd synthetic capture")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    path = args.capture
+    if not path:
+        path = os.path.join(tempfile.mkdtemp(), "synthetic.axcap")
+        write_synthetic_capture(path, args.frames, args.compress)
+    print(f"capture: {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+
+    for round_no in range(1, args.rounds + 1):
+        client = AxiomTradeWebSocketClient(auth_manager=object())
+        counts = subscribe_all(client, path)
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        replayed = asyncio.run(client.replay(path, speed=args.speed))
+        elapsed = time.perf_counter() - start
+        cpu = time.process_time() - cpu_start
+        delivered = sum(counts.values())
+        print(
+            f"round {round_no}: {replayed} frames in {elapsed:.2f}s "
+            f"({replayed / elapsed:,.0f} frames/s, {cpu / replayed * 1e6:.1f} us CPU/frame), "
+            f"{delivered} callbacks across {len(counts)} rooms"
+        )
+
+
+if __name__ == "__main__":
+    main()
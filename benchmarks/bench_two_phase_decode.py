@@ -0,0 +1,112 @@
+"""
+Benchmark: CPU saved by two-phase (room-first) frame decoding
+
+Replays a mixed-room capture through AxiomTradeWebSocketClient twice:
+once decoding every frame (the previous behaviour) and once with room
+pre-parsing, dropping unsubscribed rooms and conflating price rooms.
+
+Usage:
+    python benchmarks/bench_two_phase_decode.py [--frames 50000] [--burst 50]
+    python benchmarks/bench_two_phase_decode.py --capture feed.axcap
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from axiomtradeapi import codec  # noqa: E402
+from axiomtradeapi.websocket import AxiomTradeWebSocketClient, read_capture  # noqa: E402
+
+from _frames import mixed_room_capture  # noqa: E402
+
+
+async def _noop(_data):
+    pass
+
+
+def load_capture(path: str):
+    """Read a recorded capture and split its rooms into wallets and tokens"""
+    frames = [message for _, message in read_capture(path)]
+    wallets, tokens = {}, {}
+    for message in frames:
+        room = codec.peek_room(message) or ""
+        if room.startswith("v:"):
+            wallets[room[2:]] = None
+        elif room and room not in ("new_pairs", "update_pulse_v2", "sol_price"):
+            tokens[room] = None
+    return frames, list(wallets), list(tokens)
+
+
+def build_client(wallets, tokens, conflate: bool) -> AxiomTradeWebSocketClient:
+    conflated = ["sol_price"] + list(tokens) if conflate else None
+    client = AxiomTradeWebSocketClient(
+        auth_manager=object(), conflate_rooms=conflated
+    )
+    # Subscribe to a realistic subset: new pairs, SOL price, a few wallets and tokens
+    client._callbacks["new_pairs"] = _noop
+    client._callbacks["sol_price"] = _noop
+    for wallet in wallets[:3]:
+        client._callbacks[f"wallet_transactions_{wallet}"] = _noop
+    for token in tokens[:10]:
+        client._callbacks[f"token_price_{token}"] = _noop
+    return client
+
+
+async def run_full_decode(client, frames, burst: int) -> float:
+    start = time.process_time()
+    for i, frame in enumerate(frames):
+        await client._process_frame(frame)
+        if i % burst == 0:
+            await asyncio.sleep(0)
+    return time.process_time() - start
+
+
+async def run_two_phase(client, frames, burst: int) -> float:
+    client._pending_event = asyncio.Event()
+    drain = asyncio.ensure_future(client._drain_conflated())
+    start = time.process_time()
+    for i, frame in enumerate(frames):
+        await client._handle_frame(frame)
+        if i % burst == 0:
+            # Frames arrive in bursts; the loop goes idle between them
+            await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    elapsed = time.process_time() - start
+    drain.cancel()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=50000)
+    parser.add_argument("--burst", type=int, default=50, help="frames per receive burst")
+    parser.add_argument("--capture", help="recorded capture (synthetic if omitted)")
+    args = parser.parse_args()
+
+    if args.capture:
+        frames, wallets, tokens = load_capture(args.capture)
+    else:
+        frames, wallets, tokens = mixed_room_capture(args.frames)
+
+    baseline_client = build_client(wallets, tokens, conflate=False)
+    baseline = asyncio.run(run_full_decode(baseline_client, frames, args.burst))
+
+    client = build_client(wallets, tokens, conflate=True)
+    two_phase = asyncio.run(run_two_phase(client, frames, args.burst))
+
+    stats = client.frame_stats
+    print(f"{len(frames)} frames, {len(client._callbacks)} subscribed callbacks")
+    print(f"full decode : {baseline * 1000:8.1f} ms CPU  ({len(frames)} decoded)")
+    print(
+        f"two-phase   : {two_phase * 1000:8.1f} ms CPU  ({stats['decoded']} decoded, "
+        f"{stats['dropped']} dropped, {stats['conflated']} conflated)"
+    )
+    print(f"CPU saved   : {(1 - two_phase / baseline) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark: WebSocket connection profiles against the local stand-in server
+
+Streams from LocalAxiomServer (separate process) with each connection
+profile and event loop, and reports delivered msg/s, client CPU per
+message and event -> callback latency.
+
+Usage:
+    python benchmarks/bench_ws_profiles.py [--duration 5] [--rate new_pairs=3000]
+    python benchmarks/bench_ws_profiles.py --profiles default low_latency --shape burst
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from axiomtradeapi.websocket import AxiomTradeWebSocketClient  # noqa: E402
+from axiomtradeapi.websocket.local_server import LocalAuthManager  # noqa: E402
+from axiomtradeapi.websocket.profiles import (  # noqa: E402
+    PROFILES,
+    UVLOOP_AVAILABLE,
+    running_uvloop,
+)
+
+from bench_local_server import percentile, start_server  # noqa: E402
+
+
+async def measure(url: str, profile: str, duration: float, wallets: int) -> dict:
+    client = AxiomTradeWebSocketClient(
+        auth_manager=LocalAuthManager(),
+        log_level=logging.WARNING,
+        profile=PROFILES[profile].with_options(uvloop=False),
+    )
+    client.ws_url = url
+    latencies = []
+
+    async def on_event(content):
+        created_at = getattr(content, "created_at", None)
+        if created_at is not None:
+            latencies.append(time.time() - created_at.timestamp())
+
+    async def on_new_pair(data):
+        await on_event(data.get("content"))
+
+    await client.subscribe_new_tokens(on_new_pair)
+    for i in range(wallets):
+        await client.subscribe_wallet_transactions("wallet%03d" % i, on_event)
+
+    handler = asyncio.ensure_future(client.start())
+    await asyncio.sleep(0.5)  # warm-up
+    latencies.clear()
+    decoded = client.frame_stats["decoded"]
+    cpu, started = time.process_time(), time.perf_counter()
+    await asyncio.sleep(duration)
+    cpu, elapsed = time.process_time() - cpu, time.perf_counter() - started
+    messages = client.frame_stats["decoded"] - decoded
+    compressed = "permessage-deflate" in (
+        client.ws.response_headers.get("Sec-WebSocket-Extensions") or ""
+    )
+    handler.cancel()
+    await client.close()
+
+    latencies.sort()
+    return {
+        "messages": messages,
+        "rate": messages / elapsed,
+        "cpu_us": cpu / messages * 1e6 if messages else 0.0,
+        "p50_ms": percentile(latencies, 0.5) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+        "compressed": compressed,
+        "uvloop": running_uvloop(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per run")
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES))
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--rate", action="append", metavar="KIND=HZ")
+    parser.add_argument("--shape", choices=("steady", "poisson", "burst"), default="steady")
+    parser.add_argument("--burst-size", type=int, default=50)
+    parser.add_argument("--wallets", type=int, default=10)
+    args = parser.parse_args()
+    if not args.rate:
+        args.rate = ["new_pairs=2000", "update_pulse_v2=0", "wallet=100"]
+    args.disconnect_every = None
+
+    process, url = start_server(args)
+    print(f"server: {url} shape={args.shape} rates={','.join(args.rate)}")
+    loops = ["asyncio"] + (["uvloop"] if UVLOOP_AVAILABLE else [])
+    if not UVLOOP_AVAILABLE:
+        print("uvloop not installed: pip install axiomtradeapi[uvloop] to compare loops")
+    print(f"{'profile':<12} {'loop':<8} {'deflate':<7} {'msg/s':>9} {'CPU us/msg':>10} "
+          f"{'p50 ms':>8} {'p99 ms':>8}")
+    try:
+        for loop_name in loops:
+            for profile in args.profiles:
+                if loop_name == "uvloop":
+                    import uvloop
+
+                    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+                else:
+                    asyncio.set_event_loop_policy(None)
+                result = asyncio.run(measure(url, profile, args.duration, args.wallets))
+                print(
+                    f"{profile:<12} {loop_name:<8} {str(result['compressed']):<7} "
+                    f"{result['rate']:9,.0f} {result['cpu_us']:10.1f} "
+                    f"{result['p50_ms']:8.2f} {result['p99_ms']:8.2f}"
+                )
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main()
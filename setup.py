@@ -21,6 +21,10 @@ setup(
     ],
     extras_require={
         "telegram": ["python-telegram-bot>=20.0"],
+        "fast": ["orjson>=3.6"],
+        "capture": ["zstandard>=0.15"],
+        "uvloop": ["uvloop>=0.14; sys_platform != 'win32'"],
+        "numpy": ["numpy>=1.17"],
         "dev": ["pytest", "black", "flake8"],
     },
     include_package_data=True,
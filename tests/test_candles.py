@@ -0,0 +1,67 @@
+from axiomtradeapi.charts import CandleBuilder
+from axiomtradeapi.models import WalletTransaction
+
+MINUTE = 60 * 1000
+T0 = 1_700_000_100_000 - 1_700_000_100_000 % (5 * MINUTE)
+
+
+def test_trades_build_candles_and_emit_on_close():
+    closed = []
+    builder = CandleBuilder(intervals=("1s", "1m"), on_close=closed.append)
+    builder.update("pair", 1.0, 10.0, True, T0 + 100)
+    builder.update("pair", 3.0, 5.0, False, T0 + 200)
+    builder.update("pair", 0.5, 1.0, True, T0 + 900)
+    assert closed == []
+
+    builder.update("pair", 2.0, 2.0, True, T0 + 1500)  # next second
+    assert [(c.interval, c.time) for c in closed] == [("1s", T0)]
+    second = closed[0]
+    assert (second.open, second.high, second.low, second.close) == (1.0, 3.0, 0.5, 0.5)
+    assert (second.volume, second.buy_volume, second.sell_volume, second.trades) == (16.0, 11.0, 5.0, 3)
+
+    minute = builder.current("pair", "1m")
+    assert (minute.open, minute.high, minute.close, minute.trades) == (1.0, 3.0, 2.0, 4)
+
+    builder.update("pair", 9.0, 1.0, True, T0 + 200)  # older than the open 1s candle
+    assert builder.stats["late"] == 1
+    # Ignored for the still-open minute too: its volume stays the sum of its seconds
+    minute = builder.current("pair", "1m")
+    assert (minute.high, minute.trades, minute.volume) == (3.0, 4, 18.0)
+    assert minute.volume == second.volume + builder.current("pair", "1s").volume
+
+    closed.clear()
+    assert {c.interval for c in builder.close_due(T0 + 2 * MINUTE)} == {"1s", "1m"}
+    assert len(closed) == 2
+    assert [c.time for c in builder.candles("pair", "1s")] == [T0, T0 + 1000]
+
+
+def test_history_and_pairs_are_bounded():
+    builder = CandleBuilder(intervals=("1s",), history=3, max_pairs=2)
+    for i in range(10):
+        builder.update("a", 1.0 + i, 1.0, True, T0 + i * 1000)
+    assert len(builder.candles("a", "1s")) == 3
+    assert len(builder.candles("a", "1s", include_open=True)) == 4
+
+    builder.update("b", 1.0, 1.0, True, T0)
+    builder.update("c", 1.0, 1.0, True, T0)
+    assert builder.pairs() == ["b", "c"]
+    assert builder.stats["evicted"] == 1
+
+
+def test_on_transaction_reads_wallet_events():
+    builder = CandleBuilder(intervals=("1m",), currency="SOL")
+    event = {
+        "pair_address": "pair",
+        "created_at": "2023-11-14T22:15:00.500Z",
+        "price_sol": 0.002,
+        "total_sol": 1.5,
+        "type": "sell",
+    }
+    builder.on_transaction(event)
+    builder.on_transaction(WalletTransaction.from_dict(dict(event, type="buy", price_sol=0.003)))
+    builder.on_transaction({"pair_address": "pair"})
+
+    candle = builder.current("pair", "1m")
+    assert candle.time == 1_700_000_100_000
+    assert (candle.open, candle.close, candle.buy_volume, candle.sell_volume) == (0.002, 0.003, 1.5, 1.5)
+    assert builder.stats["skipped"] == 1
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for WebSocket capture recording and replay
+"""
+
+import asyncio
+
+import pytest
+
+from axiomtradeapi.websocket import AxiomTradeWebSocketClient, CaptureWriter, read_capture
+
+
+FRAMES = [
+    (1000.000, '{"room":"sol_price","content":150.1}'),
+    (1000.010, '{"room":"new_pairs","content":{"pair_address":"P1"}}'),
+    (1000.011, '{"room":"sol_price","content":150.2}'),
+    (1000.012, '{"room":"sol_price","content":150.3}'),
+    (1000.500, b'\x00binary'),
+]
+
+
+def _write(path, compress=False):
+    with CaptureWriter(str(path), compress=compress) as writer:
+        for received_at, frame in FRAMES:
+            writer.write(frame, received_at)
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "feed.axcap"
+    _write(path)
+    assert list(read_capture(str(path))) == FRAMES
+
+
+def test_append_and_truncated_tail(tmp_path):
+    path = tmp_path / "feed.axcap"
+    _write(path)
+    _write(path)
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03")  # partial record from an interrupted write
+    assert list(read_capture(str(path))) == FRAMES + FRAMES
+
+
+def test_compressed_round_trip(tmp_path):
+    pytest.importorskip("zstandard")
+    path = tmp_path / "feed.axcap.zst"
+    _write(path, compress=True)
+    _write(path, compress=True)
+    assert list(read_capture(str(path))) == FRAMES + FRAMES
+
+
+def test_compressed_capture_is_flushed_periodically(tmp_path):
+    pytest.importorskip("zstandard")
+    path = tmp_path / "feed.axcap.zst"
+    writer = CaptureWriter(str(path), compress=True, flush_every=2, flush_interval=3600)
+    for received_at, frame in FRAMES[:3]:
+        writer.write(frame, received_at)
+    # Not closed (as after a crash): everything up to the last flush is readable
+    assert list(read_capture(str(path))) == FRAMES[:2]
+    writer.close()
+    assert list(read_capture(str(path))) == FRAMES[:3]
+
+
+def test_replay_is_not_recorded(tmp_path):
+    source = tmp_path / "feed.axcap"
+    _write(source)
+    recording = tmp_path / "live.axcap"
+    client = AxiomTradeWebSocketClient(auth_manager=object())
+    client.start_recording(str(recording))
+    asyncio.run(client.replay(str(source)))
+    assert client._recorder is not None
+    client.stop_recording()
+    assert list(read_capture(str(recording))) == []
+
+
+def test_replay_uses_dispatch_path(tmp_path):
+    path = tmp_path / "feed.axcap"
+    _write(path)
+
+    client = AxiomTradeWebSocketClient(auth_manager=object(), conflate_rooms=["sol_price"])
+    prices, pairs = [], []
+
+    async def on_price(data):
+        prices.append(data["content"])
+
+    async def on_pair(data):
+        pairs.append(data["content"]["pair_address"])
+
+    client._callbacks["sol_price"] = on_price
+    client._callbacks["new_pairs"] = on_pair
+
+    replayed = asyncio.run(client.replay(str(path)))
+
+    assert replayed == len(FRAMES)
+    assert pairs == ["P1"]
+    # The two back-to-back price frames are conflated into the latest one
+    assert prices == [150.1, 150.3]
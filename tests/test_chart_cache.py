@@ -0,0 +1,95 @@
+import os
+
+from axiomtradeapi.charts import BarCache, fetch_chart_range
+
+from test_chart_fetcher import MINUTE, START, FakeChartClient
+
+
+def minute_bars(first, count, close=1.5):
+    return [[START + (first + i) * MINUTE, 1.0, 2.0, 0.5, close, 1.0] for i in range(count)]
+
+
+def test_missing_ranges_follow_merged_coverage(tmp_path):
+    with BarCache(str(tmp_path / "bars.db")) as cache:
+        assert cache.missing("pair", "1m", "USD", START, START + 100) == [(START, START + 100)]
+
+        cache.put("pair", "1m", "USD", minute_bars(0, 11), covered=(START, START + 10 * MINUTE))
+        cache.put("pair", "1m", "USD", minute_bars(20, 11), covered=(START + 20 * MINUTE, START + 30 * MINUTE))
+        cache.put("pair", "1m", "USD", [], covered=(START + 30 * MINUTE, START + 40 * MINUTE))  # no trades
+        assert cache.coverage("pair", "1m") == [
+            (START, START + 10 * MINUTE),
+            (START + 20 * MINUTE, START + 40 * MINUTE),
+        ]
+        assert cache.missing("pair", "1m", "USD", START, START + 50 * MINUTE) == [
+            (START + 10 * MINUTE, START + 20 * MINUTE),
+            (START + 40 * MINUTE, START + 50 * MINUTE),
+        ]
+        assert cache.missing("pair", "1m", "USD", START + MINUTE, START + 5 * MINUTE) == []
+        assert cache.missing("pair", "1m", "SOL", START, START) == [(START, START)]
+
+
+def test_coverage_merges_ranges_one_bar_apart(tmp_path):
+    with BarCache(str(tmp_path / "bars.db")) as cache:
+        # Windows of closed bars end just before the next bar opens
+        cache.put("pair", "1m", "USD", minute_bars(0, 1), covered=(START, START + MINUTE - 1000))
+        cache.put("pair", "1m", "USD", minute_bars(1, 1), covered=(START + MINUTE, START + 2 * MINUTE - 1000))
+        # Bars opening at START + 2 and 3 minutes are uncovered: stays a separate range
+        cache.put("pair", "1m", "USD", minute_bars(4, 1), covered=(START + 4 * MINUTE, START + 5 * MINUTE - 1000))
+        assert cache.coverage("pair", "1m") == [
+            (START, START + 2 * MINUTE - 1000),
+            (START + 4 * MINUTE, START + 5 * MINUTE - 1000),
+        ]
+        assert cache.missing("pair", "1m", "USD", START, START + 2 * MINUTE - 1000) == []
+        assert cache.missing("pair", "1m", "USD", START, START + 5 * MINUTE - 1000) == [
+            (START + 2 * MINUTE - 1000, START + 4 * MINUTE)
+        ]
+
+
+def test_fetch_chart_range_only_requests_uncached_ranges(tmp_path):
+    path = str(tmp_path / "bars.db")
+    client = FakeChartClient()
+    with BarCache(path) as cache:
+        fetch_chart_range(client, "pair", START, START + 400 * MINUTE, "1m", cache=cache)
+        assert len(client.calls) == 2
+
+    # A restart reads from disk and only fetches the extension
+    client.calls.clear()
+    with BarCache(path) as cache:
+        chart = fetch_chart_range(client, "pair", START + 100 * MINUTE, START + 500 * MINUTE, "1m", cache=cache)
+        assert client.calls == [(START + 400 * MINUTE, START + 500 * MINUTE)]
+        assert [bar.time for bar in chart.bars] == list(range(START + 100 * MINUTE, START + 501 * MINUTE, MINUTE))
+
+        raw = FakeChartClient(raw_responses=True)
+        assert fetch_chart_range(raw, "pair", START, START + 2 * MINUTE, "1m", cache=cache)["bars"][0][0] == START
+        assert raw.calls == []
+
+
+def test_eviction_drops_least_recently_used_series_and_compaction_shrinks(tmp_path):
+    path = str(tmp_path / "bars.db")
+    with BarCache(path, batch_size=100) as cache:
+        for pair in ("old", "mid", "new"):
+            cache.put(pair, "1m", "USD", minute_bars(0, 2000), covered=(START, START + 1999 * MINUTE))
+            cache.flush()
+        cache.read("old", "1m")  # touch: "mid" is now least recently used
+        size = cache.size()
+
+        assert cache.evict(max_bytes=size * 3 // 4) >= 1
+        assert ("mid", "1m", "USD") not in cache.keys()
+        assert ("old", "1m", "USD") in cache.keys()
+        assert cache.missing("mid", "1m", "USD", START, START) == [(START, START)]
+
+        cache.compact()
+        assert os.path.getsize(path) < size
+        assert len(cache.read("old", "1m", start=START, end=START + 9 * MINUTE)) == 10
+
+
+def test_read_series_returns_columns(tmp_path):
+    import pytest
+
+    np = pytest.importorskip("numpy")
+    with BarCache(str(tmp_path / "bars.db")) as cache:
+        cache.put("pair", "1m", "USD", minute_bars(0, 5, close=3.0))
+        series = cache.read_series("pair", "1m")
+        assert series.time.dtype == np.int64
+        assert series.close.tolist() == [3.0] * 5
+        assert len(cache.read_series("other", "1m")) == 0
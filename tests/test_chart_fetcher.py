@@ -0,0 +1,79 @@
+import threading
+import time
+
+import pytest
+
+from axiomtradeapi.charts import fetch_chart_range, interval_ms
+from axiomtradeapi.charts.fetcher import chart_windows
+from axiomtradeapi.client import AxiomTradeClient
+from axiomtradeapi.models import PairChart
+from axiomtradeapi.ratelimit import RateLimiter
+
+MINUTE = 60 * 1000
+START = 1_700_000_000_000 - 1_700_000_000_000 % MINUTE
+
+
+class FakeChartClient:
+    """Serves one bar per minute, including both window edges like the API"""
+
+    def __init__(self, raw_responses=False, rate_limiter=None):
+        self.raw_responses = raw_responses
+        self.rate_limiter = rate_limiter
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def get_pair_chart(self, pair_address, from_ts, to_ts, interval, currency, count_bars, **kwargs):
+        with self.lock:
+            self.calls.append((from_ts, to_ts))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        first = from_ts + (-from_ts) % MINUTE
+        bars = [[t, 1.0, 2.0, 0.5, 1.5, t // MINUTE] for t in range(first, to_ts + 1, MINUTE)]
+        if self.raw_responses:
+            return {"bars": bars}
+        return PairChart.from_wire({"bars": bars})
+
+
+def test_chart_windows_cover_range_in_count_bar_steps():
+    windows = chart_windows(START, START + 1000 * MINUTE, "1m", 329)
+    assert windows[0] == (START, START + 329 * MINUTE)
+    assert windows[-1][1] == START + 1000 * MINUTE
+    assert all(a[1] == b[0] for a, b in zip(windows, windows[1:]))
+    with pytest.raises(ValueError):
+        interval_ms("7m")
+
+
+def test_fetch_chart_range_is_contiguous_and_deduplicated():
+    client = FakeChartClient()
+    chart = fetch_chart_range(client, "pair", START, START + 1000 * MINUTE, "1m", max_workers=4)
+
+    times = [bar.time for bar in chart.bars]
+    assert times == list(range(START, START + 1001 * MINUTE, MINUTE))
+    assert len(client.calls) == 4
+    assert client.peak > 1
+
+
+def test_fetch_chart_range_raw_and_rate_limited():
+    client = FakeChartClient(raw_responses=True, rate_limiter=RateLimiter(rate=50, burst=1))
+    started = time.monotonic()
+    chart = fetch_chart_range(client, "pair", START, START + 100 * MINUTE, "1m", count_bars=10)
+    elapsed = time.monotonic() - started
+
+    assert [bar[0] for bar in chart["bars"]] == list(range(START, START + 101 * MINUTE, MINUTE))
+    assert len(client.calls) == 10
+    assert elapsed >= 9 / 50 * 0.9  # one token up front, then 50/s
+
+
+def test_client_fetch_chart_range_uses_get_pair_chart(monkeypatch, tmp_path):
+    client = AxiomTradeClient(storage_dir=str(tmp_path), use_saved_tokens=False)
+    fake = FakeChartClient()
+    monkeypatch.setattr(client, "get_pair_chart", fake.get_pair_chart)
+
+    chart = client.fetch_chart_range("pair", START, START + 5 * MINUTE)
+    assert len(chart["bars"]) == 6
+    assert isinstance(client.rate_limiter, RateLimiter)
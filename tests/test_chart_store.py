@@ -0,0 +1,116 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from axiomtradeapi.charts import BarSeries, BarStore, fetch_chart_range  # noqa: E402
+from axiomtradeapi.charts.store import bars_to_columns  # noqa: E402
+from axiomtradeapi.client import AxiomTradeClient  # noqa: E402
+from axiomtradeapi.models import ChartBar  # noqa: E402
+
+from test_chart_fetcher import MINUTE, START, FakeChartClient  # noqa: E402
+
+
+def minute_bars(first, count):
+    return [[START + (first + i) * MINUTE, 1.0 + i, 2.0 + i, 0.5 + i, 1.5 + i, 10.0] for i in range(count)]
+
+
+def test_bars_to_columns_accepts_arrays_objects_and_seconds():
+    time, open_, _, _, close, volume = bars_to_columns([[1_700_000_000, 1, 2, 0.5, 1.5, 3]])
+    assert time.dtype == np.int64 and time[0] == 1_700_000_000_000
+    assert (open_[0], close[0], volume[0]) == (1.0, 1.5, 3.0)
+
+    time, *_ = bars_to_columns([{"t": START, "o": 1, "h": 1, "l": 1, "c": 1}, ChartBar(START + MINUTE, 1, 1, 1, 1)])
+    assert time.tolist() == [START, START + MINUTE]
+
+
+def test_series_appends_replaces_open_bar_and_merges_old_bars():
+    series = BarSeries("pair", "1m", capacity=2)
+    assert series.extend(minute_bars(0, 5)) == 5
+    # Overlapping page: stored bars are replaced, newer ones appended
+    updated = minute_bars(3, 4)
+    updated[0][4] = 42.0
+    updated[1][4] = 99.0
+    assert series.extend(updated) == 4
+    assert len(series) == 7
+    assert series.close[3] == 42.0 and series.close[4] == 99.0
+    assert series.append(START, 1, 1, 1, -1.0)
+    assert series.close[0] == -1.0 and len(series) == 7
+    assert series.append(START + 7 * MINUTE, 1, 2, 0.5, 1.5, 4)
+    assert series.time.tolist() == [START + i * MINUTE for i in range(8)]
+
+
+def test_earlier_range_is_merged_before_stored_bars():
+    store = BarStore()
+    fetch_chart_range(FakeChartClient(), "pair", START + 100 * MINUTE, START + 200 * MINUTE, "1m", store=store)
+    series = fetch_chart_range(FakeChartClient(), "pair", START, START + 99 * MINUTE, "1m", store=store)
+    assert len(series) == 201
+    assert series.time[0] == START and series.last_time == START + 200 * MINUTE
+    assert np.all(np.diff(series.time) == MINUTE)
+
+
+def test_slice_is_a_view_and_copies_on_write():
+    series = BarSeries("pair", "1m")
+    series.extend(minute_bars(0, 10))
+    window = series.slice(START + 2 * MINUTE, START + 4 * MINUTE)
+    assert window.time.tolist() == [START + i * MINUTE for i in (2, 3, 4)]
+    assert np.shares_memory(window.close, series.close)
+
+    window.append(START + 4 * MINUTE, 0, 0, 0, -1.0)
+    assert window.close[-1] == -1.0
+    assert series.close[4] == 5.5
+    assert series.index(START + 30 * MINUTE) == (10, 10)
+
+
+def test_resample_aggregates_ohlcv():
+    series = BarSeries("pair", "1m")
+    series.extend(minute_bars(2, 10))  # START + 2 minutes is on a 5 minute boundary
+    five = series.resample("5m")
+    assert five.time.tolist() == [START + 2 * MINUTE, START + 7 * MINUTE]
+    assert five.open.tolist() == [1.0, 6.0]
+    assert five.high.tolist() == [6.0, 11.0]
+    assert five.low.tolist() == [0.5, 5.5]
+    assert five.close.tolist() == [5.5, 10.5]
+    assert five.volume.tolist() == [50.0, 50.0]
+
+
+def test_store_receives_fetched_ranges(monkeypatch, tmp_path):
+    store = BarStore()
+    series = fetch_chart_range(FakeChartClient(), "pair", START, START + 700 * MINUTE, "1m", store=store)
+    assert series is store.get("pair", "1m")
+    assert len(series) == 701
+    assert np.all(np.diff(series.time) == MINUTE)
+
+    client = AxiomTradeClient(storage_dir=str(tmp_path), use_saved_tokens=False)
+
+    class Response:
+        headers = {}
+        content = b'{"bars": [[%d, 1, 2, 0.5, 1.5, 7]]}' % (START + 701 * MINUTE)
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            import json
+
+            return json.loads(self.content)
+
+    monkeypatch.setattr(client, "ensure_authenticated", lambda: True)
+    monkeypatch.setattr(client.auth_manager, "make_authenticated_request", lambda *a, **k: Response())
+    assert client.get_pair_chart("pair", START, START, interval="1m", store=store) is series
+    assert len(series) == 702
+    assert store.keys() == [("pair", "1m", "USD")]
+    assert store.drop("pair") == 1
+
+
+def test_store_keeps_currencies_apart():
+    store = BarStore()
+    usd = fetch_chart_range(FakeChartClient(), "pair", START, START + 10 * MINUTE, "1m", store=store)
+    sol = fetch_chart_range(
+        FakeChartClient(), "pair", START, START + 10 * MINUTE, "1m", currency="SOL", store=store
+    )
+    assert usd is not sol
+    assert (usd.currency, sol.currency) == ("USD", "SOL")
+    assert store.get("pair", "1m", "SOL") is sol and len(usd) == len(sol) == 11
+    assert sol.slice(START, START + MINUTE).currency == sol.resample("5m").currency == "SOL"
+    assert store.drop("pair", currency="SOL") == 1
+    assert store.keys() == [("pair", "1m", "USD")]
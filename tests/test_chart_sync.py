@@ -0,0 +1,110 @@
+import threading
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from axiomtradeapi.charts import ChartSynchronizer  # noqa: E402
+
+MINUTE = 60 * 1000
+NOW = 1_700_000_000_000 - 1_700_000_000_000 % MINUTE
+
+
+class FakeMarket:
+    """Chart endpoint over a mutable set of bars"""
+
+    def __init__(self):
+        self.bars = {}
+        self.calls = []
+        self.rate_limiter = None
+        self.fail = set()
+
+    def trade(self, time, price):
+        bar_time = time - time % MINUTE
+        bar = self.bars.get(bar_time)
+        if bar is None:
+            self.bars[bar_time] = [bar_time, price, price, price, price, 1.0]
+        else:
+            bar[2], bar[3], bar[4], bar[5] = max(bar[2], price), min(bar[3], price), price, bar[5] + 1
+
+    def get_pair_chart(self, pair_address, from_ts, to_ts, interval, currency, count_bars, **kwargs):
+        if pair_address in self.fail:
+            raise Exception("boom")
+        self.calls.append((pair_address, from_ts, to_ts, count_bars, kwargs))
+        bars = [list(bar) for t, bar in sorted(self.bars.items()) if from_ts <= t <= to_ts]
+        return {"bars": bars[-count_bars:], "lastTransactionTime": to_ts - 1}
+
+
+def test_sync_fetches_only_new_bars_and_replaces_open_bar():
+    market = FakeMarket()
+    for i in range(10):
+        market.trade(NOW - (10 - i) * MINUTE, 1.0 + i)
+    market.trade(NOW + 1000, 5.0)  # open bar
+
+    sync = ChartSynchronizer(market)
+    assert sync.sync("pair", now_ms=NOW + 2000) == 11
+    series = sync.series("pair")
+    assert series.close[-1] == 5.0
+
+    market.trade(NOW + 3000, 7.0)  # open bar moves
+    market.trade(NOW + MINUTE + 500, 8.0)  # next bar opens
+    assert sync.sync("pair", now_ms=NOW + MINUTE + 1000) == 2
+    _, from_ts, _, count_bars, kwargs = market.calls[-1]
+    assert from_ts == NOW and count_bars == 2
+    assert kwargs["last_transaction_time"] == NOW + 2000 - 1
+    assert len(series) == 12
+    assert series.close[-2:].tolist() == [7.0, 8.0]
+    assert series.high[-2] == 7.0
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.acquired = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            self.acquired += 1
+
+
+def test_sync_pages_through_gaps_longer_than_max_bars():
+    market = FakeMarket()
+    market.trade(NOW - MINUTE, 1.0)
+    sync = ChartSynchronizer(market, history_bars=2, max_bars=5)
+    sync.sync("pair", now_ms=NOW)
+    for i in range(12):  # downtime: 12 bars nobody polled
+        market.trade(NOW + i * MINUTE, 2.0 + i)
+    market.calls.clear()
+    market.rate_limiter = CountingLimiter()
+
+    assert sync.sync("pair", now_ms=NOW + 11 * MINUTE + 1) >= 12
+    assert len(market.calls) > 1 and all(call[3] == 5 for call in market.calls)
+    assert all(call[4]["last_transaction_time"] == NOW - 1 for call in market.calls)
+    assert market.rate_limiter.acquired == len(market.calls)
+    series = sync.series("pair")
+    assert series.time.tolist() == [NOW + i * MINUTE for i in range(-1, 12)]
+    sync.record_transaction("pair", NOW + 12 * MINUTE)
+    assert sync.states[("pair", "1m")].active
+
+
+def test_refresh_all_skips_inactive_pairs_and_survives_errors():
+    market = FakeMarket()
+    market.trade(NOW - MINUTE, 1.0)
+    sync = ChartSynchronizer(market, max_workers=4)
+    sync.track_many(["a", "b", "c"])
+    market.fail.add("c")
+
+    assert sorted(sync.refresh_all()) == [("a", "1m"), ("b", "1m")]
+    assert sync.states[("c", "1m")].errors == 1
+
+    market.fail.clear()
+    market.calls.clear()
+    market.rate_limiter = CountingLimiter()
+    sync.record_event({"pair_address": "b", "created_at": "2023-11-14T22:13:20Z"})
+    assert sorted(sync.refresh_all(only_active=True)) == [("b", "1m"), ("c", "1m")]
+    assert sorted(call[0] for call in market.calls) == ["b", "c"]
+    assert market.rate_limiter.acquired == 2  # one per request
+    assert sync.refresh_all(only_active=True) == {}
+
+    assert sync.untrack("a", drop_bars=True) == 1
+    assert sync.series("a") is None
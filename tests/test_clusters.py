@@ -0,0 +1,84 @@
+import asyncio
+import logging
+
+from axiomtradeapi.websocket import (
+    AxiomTradeWebSocketClient,
+    ClusterProbe,
+    ClusterSelector,
+    rank_clusters,
+)
+from axiomtradeapi.websocket.local_server import LocalAuthManager, LocalAxiomServer
+
+
+def selector_with(probes, **kwargs):
+    selector = ClusterSelector([probe.url for probe in probes], **kwargs)
+    selector.probes = {probe.url: probe for probe in probes}
+    return selector
+
+
+def test_should_migrate_applies_hysteresis():
+    probes = [ClusterProbe("a", ping_rtt=0.100), ClusterProbe("b", ping_rtt=0.090)]
+    selector = selector_with(probes, hysteresis=0.2, min_improvement=0.005)
+    assert selector.best() == "b"
+    assert selector.should_migrate("a") is None  # only 10% faster
+
+    probes[1].ping_rtt = 0.050
+    assert selector.should_migrate("a") == "b"
+    assert selector.should_migrate("b") is None
+
+    probes[0].error = "timeout"
+    probes[1].ping_rtt = 0.099
+    assert selector.should_migrate("a") == "b"  # current cluster unreachable
+
+
+def test_rank_clusters_puts_unreachable_last():
+    async def run():
+        async with LocalAxiomServer() as server:
+            return await rank_clusters(["ws://127.0.0.1:1/", server.url], timeout=1.0)
+
+    ranking = asyncio.run(run())
+    assert ranking[0].ok and ranking[0].ping_rtt is not None
+    assert not ranking[1].ok
+
+
+def test_client_migrates_subscriptions_to_faster_cluster():
+    async def run():
+        rates = {"new_pairs": 300, "update_pulse_v2": 0}
+        slow = LocalAxiomServer(rates=rates, seed=11)
+        fast = LocalAxiomServer(rates=rates, seed=12)
+        async with slow, fast:
+            selector = ClusterSelector([slow.url, fast.url], interval=0.2)
+
+            async def fake_rank(headers=None):
+                selector.probes = {
+                    slow.url: ClusterProbe(slow.url, ping_rtt=0.080),
+                    fast.url: ClusterProbe(fast.url, ping_rtt=0.010),
+                }
+                return list(selector.probes.values())
+
+            client = AxiomTradeWebSocketClient(
+                LocalAuthManager(), log_level=logging.WARNING
+            )
+            client.ws_url = slow.url
+            delivered = []
+
+            async def on_pair(data):
+                delivered.append((client.current_url, data["content"]["pair_address"]))
+
+            await client.subscribe_new_tokens(on_pair)
+            client.cluster_selector = selector
+            selector.rank = fake_rank
+            handler = asyncio.ensure_future(client.start())
+            await asyncio.sleep(0.6)
+            slow_rooms = set(slow._subscribers)
+            fast_rooms = set(fast._subscribers)
+            handler.cancel()
+            await client.close()
+            return delivered, client.current_url, slow_rooms, fast_rooms
+
+    delivered, current_url, slow_rooms, fast_rooms = asyncio.run(run())
+    slow_url, fast_url = delivered[0][0], current_url
+    assert slow_url != fast_url
+    assert any(url == fast_url for url, _ in delivered)
+    assert not slow_rooms
+    assert fast_rooms == {"new_pairs", "update_pulse_v2"}
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for the pluggable JSON codec
+"""
+
+import pytest
+
+from axiomtradeapi import codec
+
+
+FRAME = '{"room":"new_pairs","content":{"token_name":"Ünicode","supply":1000000000,"f":0.5,"x":null}}'
+
+
+def test_every_backend_round_trips():
+    """All installed backends decode str and bytes and emit text"""
+    for name, backend in codec.available_codecs().items():
+        data = backend.loads(FRAME)
+        assert data["content"]["token_name"] == "Ünicode", name
+        assert backend.loads(FRAME.encode("utf-8")) == data, name
+        encoded = backend.dumps({"action": "join", "room": "new_pairs"})
+        assert isinstance(encoded, str), name
+        assert backend.loads(encoded) == {"action": "join", "room": "new_pairs"}
+
+
+def test_decode_errors_are_catchable():
+    """Malformed input raises one of the backend's declared decode errors"""
+    for name, backend in codec.available_codecs().items():
+        with pytest.raises(backend.decode_errors):
+            backend.loads("{not json")
+
+
+def test_stdlib_fallback_always_available():
+    assert "json" in codec.available_codecs()
+    assert codec.get_codec("json").name == "json"
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        codec.get_codec("yaml")
+
+
+def test_response_json_uses_body_bytes():
+    class FakeResponse:
+        content = b'{"balance": 1.5}'
+
+    assert codec.response_json(FakeResponse()) == {"balance": 1.5}
+
+
+def test_peek_room_reads_prefix_without_decoding():
+    assert codec.peek_room('{"room":"new_pairs","content":{"room":"x"}}') == "new_pairs"
+    assert codec.peek_room('{"room": "sol_price", "content": 1}') == "sol_price"
+    assert codec.peek_room(b'{"room":"v:Wallet","content":{}}') == "v:Wallet"
+
+
+def test_peek_room_falls_back_or_gives_up():
+    assert codec.peek_room('{"content":{},"room":"late"}') == "late"
+    # Ambiguous or escaped rooms must be left to the full decoder
+    assert codec.peek_room('{"content":{"room":"a"},"room":"b"}') is None
+    assert codec.peek_room('{"room":"a\\"b"}') is None
+    assert codec.peek_room('{"content":{}}') is None
@@ -0,0 +1,115 @@
+import asyncio
+import logging
+
+from axiomtradeapi import codec
+from axiomtradeapi.websocket import (
+    AxiomTradeWebSocketClient,
+    ContinuityTracker,
+    last_transaction_backfill,
+)
+
+
+def transaction(signature, second, pair="PAIR", maker="WALLET"):
+    return {
+        "signature": signature,
+        "created_at": f"2025-01-01T00:00:{second:02d}.000Z",
+        "pair_address": pair,
+        "maker_address": maker,
+        "type": "buy",
+    }
+
+
+def test_accept_filters_duplicates_and_tracks_pairs():
+    tracker = ContinuityTracker()
+    assert tracker.accept("v:WALLET", transaction("a", 1))
+    assert not tracker.accept("v:WALLET", transaction("a", 1))
+    assert tracker.accept("v:WALLET", transaction("b", 0, pair="OTHER"))
+    state = tracker.rooms["v:WALLET"]
+    assert list(state.pairs) == ["PAIR", "OTHER"]
+    assert tracker.stats["duplicates"] == 1
+    assert tracker.stats["out_of_order"] == 1
+
+
+def test_recovery_merges_backfill_in_order_before_held_events():
+    delivered = []
+
+    async def backfill(room, since, until, pairs):
+        await asyncio.sleep(0.01)
+        # Unordered, with one event already delivered and one before the gap
+        return [transaction("d", 4), transaction("a", 1), transaction("c", 3), transaction("z", 0)]
+
+    async def deliver(content):
+        delivered.append(content["signature"])
+
+    async def run():
+        tracker = ContinuityTracker(backfill=backfill)
+        tracker.accept("v:WALLET", transaction("a", 1))
+        gap = tracker.mark_gap("v:WALLET")
+        recovery = asyncio.ensure_future(tracker.recover(gap, deliver))
+        await asyncio.sleep(0)
+        # Live events arriving during recovery are held back
+        assert not tracker.accept("v:WALLET", transaction("e", 5))
+        assert not tracker.accept("v:WALLET", transaction("d", 4))
+        await recovery
+        return tracker, gap
+
+    tracker, gap = asyncio.run(run())
+    assert delivered == ["c", "d", "e"]
+    assert gap.recovered == 2
+    assert tracker.stats["gaps"] == 1
+    assert not tracker.rooms["v:WALLET"].recovering
+
+
+def test_client_backfills_wallet_rooms_on_reconnect():
+    delivered = []
+
+    def backfill(room, since, until, pairs):
+        return [transaction("missed", 2)]
+
+    async def on_transaction(tx):
+        delivered.append((tx.signature, type(tx).__name__))
+
+    async def run():
+        client = AxiomTradeWebSocketClient(
+            object(), log_level=logging.WARNING, raw_events=False,
+            continuity=ContinuityTracker(backfill),
+        )
+        client._add_consumer("v:WALLET", on_transaction)
+        frame = codec.dumps({"room": "v:WALLET", "content": transaction("live", 1)})
+        await client._handle_frame(frame)
+        client._on_connected()  # first connection: no gap
+        client._on_connected()  # reconnect
+        await asyncio.sleep(0.05)
+        await client._handle_frame(frame)  # replayed by the server: duplicate
+        return client.continuity.stats
+
+    stats = asyncio.run(run())
+    assert delivered == [("live", "WalletTransaction"), ("missed", "WalletTransaction")]
+    assert stats["gaps"] == 1 and stats["recovered"] == 1 and stats["duplicates"] == 1
+
+
+def test_last_transaction_backfill_keeps_wallet_transactions():
+    class FakeApi:
+        def get_last_transaction(self, pair_address):
+            if pair_address == "BROKEN":
+                raise Exception("HTTP 500")
+            if pair_address == "CAMEL":
+                # /last-transaction answers in camelCase
+                return {
+                    "signature": "sig-CAMEL",
+                    "makerAddress": "WALLET",
+                    "createdAt": "2025-01-01T00:00:05.000Z",
+                    "priceUsd": 1.5,
+                }
+            maker = {"MINE": "WALLET", "ANONYMOUS": None}.get(pair_address, "SOMEONE")
+            second = {"EARLY": 0, "LATE": 30}.get(pair_address, 3)
+            return transaction("sig-" + pair_address, second, pair_address, maker)
+
+    pairs = ["MINE", "THEIRS", "ANONYMOUS", "EARLY", "LATE", "CAMEL", "BROKEN"]
+    since, until = 1735689601.0, 1735689610.0  # 00:00:01 .. 00:00:10
+    backfill = last_transaction_backfill(FakeApi())
+    result = backfill("v:WALLET", since, until, pairs)
+    assert [tx["signature"] for tx in result] == ["sig-MINE", "sig-CAMEL"]
+    assert result[0]["pair_address"] == "MINE"
+    assert result[1]["maker_address"] == "WALLET" and result[1]["price_usd"] == 1.5
+    assert result[1]["pair_address"] == "CAMEL"
@@ -0,0 +1,112 @@
+import time
+
+import pytest
+
+from axiomtradeapi.analytics import DevIndex, TokenEnricher
+
+DEV_TOKENS = {
+    "tokens": [
+        {
+            "tokenAddress": "t1",
+            "createdAt": "2024-01-01T00:00:00Z",
+            "lastTradeTime": "2024-01-01T01:00:00Z",
+            "marketCapSol": 500.0,
+            "liquiditySol": 0.1,
+            "migrated": False,
+        },
+        {
+            "tokenAddress": "t2",
+            "createdAt": "2024-01-02T00:00:00Z",
+            "lastTradeTime": "2024-01-02T03:00:00Z",
+            "marketCapSol": 2500.0,
+            "liquiditySol": 0.2,
+            "migrated": True,
+        },
+        {"tokenAddress": "t3", "createdAt": "2024-01-03T00:00:00Z", "rugged": True},
+    ],
+    "counts": {"totalCount": 5, "migratedCount": 1},
+}
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = []
+
+    def get_dev_tokens(self, dev_address):
+        self.calls.append(dev_address)
+        return DEV_TOKENS
+
+
+def test_ingest_computes_features():
+    index = DevIndex()
+    reputation = index.ingest("dev1", DEV_TOKENS)
+
+    assert index.lookup("dev1") is reputation
+    assert (reputation.token_count, reputation.known_tokens) == (5, 3)
+    assert (reputation.rugged, reputation.rated, reputation.migrated) == (2, 3, 1)
+    assert reputation.rug_ratio == pytest.approx(2 / 3)
+    assert reputation.avg_lifetime == pytest.approx(2 * 3600)
+    assert reputation.best_market_cap == 2500.0
+    assert reputation.last_launch == 1704240000000
+    assert index.lookup("unknown") is None
+    assert [token["token_address"] for token in index.tokens("dev1")] == ["t1", "t2", "t3"]
+
+
+def test_new_launches_update_incrementally_and_persist(tmp_path):
+    path = str(tmp_path / "devs.sqlite")
+    with DevIndex(path) as index:
+        index.ingest("dev1", DEV_TOKENS)
+        before = index.on_new_pair({
+            "room": "new_pairs",
+            "content": {"deployer_address": "dev1", "token_address": "t4", "created_at": "2024-01-04T00:00:00Z"},
+        })
+        assert before.known_tokens == 3
+        assert index.lookup("dev1").known_tokens == 4
+        assert index.lookup("dev1").token_count == 6
+        assert index.lookup("dev1").rug_ratio == pytest.approx(2 / 3)  # unknown status is not counted
+        assert index.on_new_pair({"room": "update_pulse_v2", "content": []}) is None
+
+        assert index.on_new_pair({"deployer_address": "dev2", "token_address": "x"}) is None
+        assert index.lookup("dev2").token_count == 1
+        assert index.lookup("dev2").fetched_at is None
+
+    with DevIndex(path) as index:
+        assert len(index) == 2
+        reputation = index.lookup("dev1")
+        assert (reputation.known_tokens, reputation.best_market_cap) == (4, 2500.0)
+        assert reputation.last_launch == 1704326400000
+
+        started = time.perf_counter()
+        for _ in range(1000):
+            index.lookup("dev1")
+        assert (time.perf_counter() - started) / 1000 < 0.001
+
+
+def test_get_fetches_only_unknown_or_stale_devs():
+    client = FakeClient()
+    index = DevIndex(client=client, max_age=60)
+    index.record_launch("dev1", "t9")
+    assert index.stale("dev1")
+
+    index.get("dev1")
+    index.get("dev1")
+    assert client.calls == ["dev1"]
+    assert not index.stale("dev1")
+    assert index.stale("dev1", now=time.time() + 61)
+    index.get("dev1", refresh=True)
+    assert client.calls == ["dev1", "dev1"]
+    assert index.lookup("dev1").known_tokens == 4
+
+    with pytest.raises(ValueError):
+        DevIndex().refresh("dev1")
+
+
+def test_index_answers_enricher_dev_tokens_source():
+    client = FakeClient()
+    index = DevIndex(client=client)
+    index.ingest("dev1", DEV_TOKENS)
+    sources = {"dev_tokens": index.enrichment_source()}
+    with TokenEnricher(client, deadline=1, sources=sources) as enricher:
+        token = enricher.enrich({"pair_address": "p", "deployer_address": "dev1"})
+    assert token.dev_tokens is index.lookup("dev1")
+    assert client.calls == []
@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import threading
+import time
+
+from axiomtradeapi.websocket import AxiomTradeWebSocketClient
+from axiomtradeapi.websocket.dispatch import SyncCallbackRunner, is_async_callback
+
+
+class RecordingSocket:
+    async def send(self, message):
+        pass
+
+
+def make_client(**kwargs):
+    client = AxiomTradeWebSocketClient(object(), log_level=logging.WARNING, **kwargs)
+    client.ws = RecordingSocket()
+    return client
+
+
+def price_frame(room, price):
+    return '{"room":"%s","content":{"price":%d}}' % (room, price)
+
+
+def square_price(content):
+    return content["price"] ** 2
+
+
+def test_is_async_callback():
+    async def coroutine_function(_):
+        pass
+
+    class AsyncCallable:
+        async def __call__(self, _):
+            pass
+
+    assert is_async_callback(coroutine_function)
+    assert is_async_callback(AsyncCallable())
+    assert not is_async_callback(lambda data: data.get("price"))
+    assert not is_async_callback(print)
+
+
+def test_sync_callbacks_run_off_loop_in_room_order():
+    seen = {"A": [], "B": []}
+    loop_thread = threading.get_ident()
+    threads = set()
+
+    def slow_handler(room):
+        def handler(content):
+            threads.add(threading.get_ident())
+            time.sleep(0.01)  # blocking work
+            seen[room].append(content["price"])
+
+        return handler
+
+    async def run():
+        client = make_client(callback_workers=2)
+        await client.subscribe_token_price("A", slow_handler("A"))
+        await client.subscribe_token_price("B", slow_handler("B"))
+        started = time.perf_counter()
+        for price in range(10):
+            await client._handle_frame(price_frame("A", price))
+            await client._handle_frame(price_frame("B", price))
+        receive_time = time.perf_counter() - started
+        assert sum(client.sync_runner.backlog().values()) > 0
+        await client.sync_runner.drain()
+        assert client.sync_runner.backlog() == {}
+        client.sync_runner.shutdown()
+        return receive_time
+
+    receive_time = asyncio.run(run())
+    assert receive_time < 0.05  # 20 x 10ms of handler work did not block receiving
+    assert seen == {"A": list(range(10)), "B": list(range(10))}
+    assert loop_thread not in threads
+
+
+def test_lambda_callback_no_longer_fails():
+    async def run():
+        client = make_client()
+        assert await client.subscribe_token_price("TOKEN", lambda data: data.get("price"))
+        await client._handle_frame(price_frame("TOKEN", 3))
+        await client.sync_runner.drain()
+        return client.sync_runner.stats
+
+    stats = asyncio.run(run())
+    assert stats == {"scheduled": 1, "completed": 1, "failed": 0, "dropped": 0}
+
+
+def test_plain_function_returning_coroutine_is_awaited():
+    seen = []
+
+    async def handler(content):
+        seen.append((content["price"], threading.get_ident()))
+
+    async def run():
+        client = make_client()
+        await client.subscribe_token_price("TOKEN", lambda data: handler(data))
+        for price in range(3):
+            await client._handle_frame(price_frame("TOKEN", price))
+        await client.sync_runner.drain()
+        client.sync_runner.shutdown()
+        return client.sync_runner.stats
+
+    stats = asyncio.run(run())
+    assert [price for price, _ in seen] == [0, 1, 2]
+    assert {thread for _, thread in seen} == {threading.get_ident()}  # ran on the loop
+    assert stats["completed"] == 3 and stats["failed"] == 0
+
+
+def test_room_backlog_is_bounded():
+    release = threading.Event()
+
+    def blocked(content):
+        release.wait(1)
+        seen.append(content)
+
+    async def run(overflow):
+        runner = SyncCallbackRunner(max_workers=1, max_pending=2, overflow=overflow)
+        for price in range(5):
+            runner.submit("A", blocked, price)
+        assert runner.backlog() == {"A": 3}  # the running call plus two waiting
+        release.set()
+        await runner.drain()
+        runner.shutdown()
+        return runner.stats["dropped"]
+
+    seen = []
+    assert asyncio.run(run("drop_oldest")) == 2
+    assert seen == [0, 3, 4]
+    release.clear()
+    seen = []
+    assert asyncio.run(run("drop_newest")) == 2
+    assert seen == [0, 1, 2]
+
+
+def test_process_pool_runner():
+    async def run():
+        runner = SyncCallbackRunner("process", max_workers=1)
+        runner.submit("A", square_price, {"price": 4})
+        await runner.drain()
+        runner.shutdown(wait=True)
+        return runner.stats
+
+    assert asyncio.run(run())["completed"] == 1
@@ -0,0 +1,163 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from axiomtradeapi.analytics import TokenEnricher, TokenRegistry
+from axiomtradeapi.analytics.enrichment import _FairQueue, twitter_handle
+from axiomtradeapi.models import NewPair
+from axiomtradeapi.ratelimit import RateLimiter
+
+NEW_PAIR = {
+    "pair_address": "pair1",
+    "token_address": "token1",
+    "deployer_address": "dev1",
+    "token_ticker": "GREEN",
+    "twitter": "https://x.com/greentoken",
+}
+
+
+class FakeClient:
+    def __init__(self, delays=None, fail=()):
+        self.delays = delays or {}
+        self.fail = fail
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        self.rate_limiter = RateLimiter(10000)
+
+    def _call(self, name, *args):
+        with self.lock:
+            self.calls.append((name,) + args)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delays.get(name, 0.01))
+            if name in self.fail:
+                raise Exception(f"{name} unavailable")
+            return {"source": name, "args": args}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def get_pair_info(self, pair_address):
+        return {"pairAddress": pair_address, "tokenTicker": "GREEN", "lpBurned": 100}
+
+    def get_pair_stats(self, pair_address):
+        self._call("pair_stats", pair_address)
+        return {"pairAddress": pair_address, "buyCount": 7}
+
+    def get_holder_data(self, pair_address):
+        return self._call("holders", pair_address)
+
+    def get_dev_tokens(self, dev_address):
+        return self._call("dev_tokens", dev_address)
+
+    def get_token_analysis(self, dev_address, token_ticker):
+        return self._call("token_analysis", dev_address, token_ticker)
+
+    def get_twitter_user_info(self, handle):
+        return self._call("twitter_user", handle)
+
+
+def test_all_sources_run_concurrently_into_typed_record():
+    registry = TokenRegistry()
+    with TokenEnricher(FakeClient(delays={"holders": 0.2, "dev_tokens": 0.2}), deadline=2, registry=registry) as enricher:
+        started = time.monotonic()
+        token = enricher.enrich(NewPair.from_dict(NEW_PAIR))
+        assert time.monotonic() - started < 0.35  # not the 0.4+ s of sequential calls
+
+    assert token.complete
+    assert token.pair_info["lpBurned"] == 100
+    assert token.holders["args"] == ("pair1",)
+    assert token.token_analysis["args"] == ("dev1", "GREEN")
+    assert token.twitter_user["args"] == ("greentoken",)
+    assert set(token.latency) == {"pair_info", "pair_stats", "holders", "dev_tokens", "token_analysis", "twitter_user"}
+    assert token.latency["holders"] >= 0.2
+    assert enricher.stats["holders"].calls == 1
+
+    record = registry.get("token1")
+    assert (record.lp_burned, record.buy_count) == (100, 7)
+
+
+def test_deadline_returns_partial_result_and_counts_errors():
+    client = FakeClient(delays={"dev_tokens": 1.0}, fail=("holders",))
+    results = []
+    with TokenEnricher(client, deadline=0.3, on_result=results.append) as enricher:
+        enricher.on_new_pair({"room": "new_pairs", "content": dict(NEW_PAIR, twitter="https://x.com/i/communities/1")})
+        enricher.on_new_pair({"room": "update_pulse_v2", "content": []})
+        deadline = time.monotonic() + 2
+        while not results and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    token = results[0]
+    assert token.missing == ["dev_tokens"]
+    assert token.skipped == ["twitter_user"]
+    assert token.errors == {"holders": "holders unavailable"}
+    assert token.pair_stats == {"pairAddress": "pair1", "buyCount": 7}
+    assert token.dev_tokens is None
+    assert 0.3 <= token.elapsed < 0.6
+    assert not token.complete
+    assert enricher.stats["dev_tokens"].timeouts == 1
+    assert enricher.stats["holders"].errors == 1
+
+
+def test_bounded_concurrency_serves_tokens_round_robin():
+    client = FakeClient(delays={name: 0.05 for name in ("pair_stats", "holders", "dev_tokens", "token_analysis")})
+    sources = {
+        name: (("pair_address",), lambda c, t, name=name: c._call(name, t.pair_address))
+        for name in ("pair_stats", "holders", "dev_tokens", "token_analysis")
+    }
+    with TokenEnricher(client, deadline=5, max_workers=2, sources=sources) as enricher:
+        futures = [enricher.submit(dict(NEW_PAIR, pair_address=f"pair{i}")) for i in range(3)]
+        tokens = [future.result() for future in futures]
+
+    assert all(token.complete for token in tokens)
+    assert client.peak <= 2
+    assert tokens[2].holders["args"] == ("pair2",)
+    assert len(client.calls) == 12
+
+    queue = _FairQueue()
+    queue.put(0, ["a1", "a2", "a3"])
+    queue.put(1, ["b1"])
+    queue.put(2, ["c1", "c2"])
+    assert [queue.get() for _ in range(6)] == ["a1", "b1", "c1", "a2", "c2", "a3"]
+
+
+def test_close_returns_pending_tokens_and_rejects_new_ones():
+    release = threading.Event()
+    sources = {
+        "slow": (("pair_address",), lambda c, t: release.wait(5)),
+        "queued": (("pair_address",), lambda c, t: release.wait(5)),
+    }
+    enricher = TokenEnricher(FakeClient(), deadline=10, max_workers=1, sources=sources)
+    future = enricher.submit(NEW_PAIR)
+    time.sleep(0.05)  # the single worker is busy with "slow"
+    started = time.monotonic()
+    enricher.close()
+    token = future.result(timeout=1)
+    release.set()
+
+    assert time.monotonic() - started < 0.5
+    assert token.missing == ["slow", "queued"]
+    assert enricher.stats["queued"].timeouts == 1
+    with pytest.raises(RuntimeError):
+        enricher.submit(NEW_PAIR)
+    enricher.on_new_pair({"room": "new_pairs", "content": NEW_PAIR})  # ignored
+
+
+def test_async_enrich_and_twitter_handles():
+    async def run():
+        with TokenEnricher(FakeClient(), deadline=1, sources={}) as enricher:
+            return await enricher.enrich_async(NEW_PAIR)
+
+    token = asyncio.run(run())
+    assert token.complete and token.latency == {}
+
+    assert twitter_handle("https://twitter.com/abc") == "abc"
+    assert twitter_handle("x.com/abc/") == "abc"
+    assert twitter_handle("@abc") == "abc"
+    assert twitter_handle("https://x.com/abc/status/1") is None
+    assert twitter_handle(None) is None
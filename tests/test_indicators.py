@@ -0,0 +1,101 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from axiomtradeapi.analytics import IndicatorEngine
+from axiomtradeapi.charts import BarSeries
+
+MINUTE = 60 * 1000
+T0 = 1_700_000_040_000
+
+
+def scalar_ema(prices, span):
+    alpha = 2.0 / (span + 1)
+    value = prices[0]
+    for price in prices[1:]:
+        value += alpha * (price - value)
+    return value
+
+
+def test_step_matches_scalar_indicators():
+    engine = IndicatorEngine(ema_spans=(3,), vwap_span=5, volatility_span=5, momentum_lookback=2)
+    prices = [1.0, 1.1, 1.05, 1.2, 1.3]
+    volumes = [10.0, 20.0, 5.0, 40.0, 10.0]
+    for price, volume in zip(prices, volumes):
+        engine.step({"a": price}, {"a": volume})
+
+    values = engine.snapshot("a")
+    assert values["price"] == 1.3
+    assert values["ema_3"] == pytest.approx(scalar_ema(prices, 3))
+    assert values["momentum"] == pytest.approx(math.log(1.3 / 1.05))
+
+    decay = 1 - 2 / 6
+    pv = vv = var = 0.0
+    for i, (price, volume) in enumerate(zip(prices, volumes)):
+        pv = decay * pv + price * volume
+        vv = decay * vv + volume
+        ret = math.log(price / prices[i - 1]) if i else 0.0
+        var = decay * var + (1 - decay) * ret ** 2
+    assert values["vwap"] == pytest.approx(pv / vv)
+    assert values["volatility"] == pytest.approx(math.sqrt(var))
+
+
+def test_pairs_without_update_carry_price_and_warm_up_separately():
+    engine = IndicatorEngine(ema_spans=(2,), momentum_lookback=2)
+    engine.step({"a": 1.0})
+    engine.step({"a": 2.0, "b": 5.0})
+    engine.step({"b": 10.0})
+
+    assert engine.snapshot("a")["price"] == 2.0
+    assert engine.snapshot("a")["momentum"] == pytest.approx(math.log(2.0))
+    assert engine.snapshot("b")["momentum"] is None  # only two ticks so far
+    assert engine.snapshot("b")["volatility"] == pytest.approx(math.sqrt(2 / 21 * math.log(2) ** 2))
+    assert engine.snapshot("missing") == {}
+    with pytest.raises(ValueError):
+        engine.column("rsi")
+
+
+def test_top_k_ranking_and_untrack():
+    engine = IndicatorEngine(momentum_lookback=1)
+    growth = {f"pair{i}": 1.0 + i / 10 for i in range(20)}
+    engine.step({pair: 1.0 for pair in growth})
+    engine.step(growth)
+
+    top = engine.top("momentum", k=3)
+    assert [pair for pair, _ in top] == ["pair19", "pair18", "pair17"]
+    assert top[0][1] == pytest.approx(math.log(2.9))
+    assert [pair for pair, _ in engine.top("momentum", k=2, ascending=True)] == ["pair0", "pair1"]
+
+    assert engine.untrack("pair0")
+    assert len(engine) == 19
+    assert engine.pairs()[0] == "pair19"  # last row moved into the freed slot
+    assert engine.snapshot("pair19")["momentum"] == pytest.approx(math.log(2.9))
+    assert len(engine.top("momentum", k=50)) == 19
+
+
+def test_replay_bars_and_streaming_trades():
+    engine = IndicatorEngine(ema_spans=(2,), momentum_lookback=2, capacity=1)
+    charts = {
+        "a": {"bars": [[T0 + i * MINUTE, 1, 1, 1, 1.0 + i, 100] for i in range(4)]},
+        "b": BarSeries.from_columns("b", "1m", {
+            "time": np.array([T0 + 2 * MINUTE, T0 + 3 * MINUTE]),
+            "open": np.ones(2), "high": np.ones(2), "low": np.ones(2),
+            "close": np.array([2.0, 3.0]), "volume": np.array([5.0, 5.0]),
+        }),
+    }
+    assert engine.replay(charts) == 4
+    assert engine.ticks == 4
+    assert engine.snapshot("a")["momentum"] == pytest.approx(math.log(4.0 / 2.0))
+    assert engine.snapshot("b")["price"] == 3.0
+
+    engine.on_transaction({"pair_address": "a", "price_usd": 5.0, "total_usd": 10.0})
+    engine.on_transaction({"pair_address": "c", "price_usd": 1.0, "total_usd": 1.0})
+    assert engine.step() == 2
+    assert engine.snapshot("a")["price"] == 5.0
+    assert engine.snapshot("c")["vwap"] == 1.0
+    assert engine.step() == 0  # pending trades were consumed
+
+    engine.step_bars({"b": charts["b"], "a": {"bars": []}})
+    assert engine.snapshot("b")["price"] == 3.0
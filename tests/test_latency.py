@@ -0,0 +1,72 @@
+import asyncio
+
+from axiomtradeapi.websocket import AxiomTradeWebSocketClient
+from axiomtradeapi.websocket.latency import (
+    ClockOffsetEstimator,
+    LatencyHistogram,
+    LatencyTracker,
+)
+from axiomtradeapi.websocket.synthetic import SyntheticFeed
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+    assert histogram.count == 100
+    assert abs(histogram.mean - 0.0505) < 1e-9
+    # Bucket bounds are within ~19% of the true quantile
+    assert 0.050 <= histogram.percentile(0.5) <= 0.050 * 1.19
+    assert 0.099 <= histogram.percentile(0.99) <= 0.100
+    assert histogram.percentile(1.0) == 0.1
+
+
+def test_clock_offset_uses_window_minimum():
+    clock = ClockOffsetEstimator(window=3)
+    for delta in (5.0, 2.0, 4.0):
+        clock.update(100.0 + delta, 100.0)
+    assert clock.offset == 2.0
+    clock.update(103.0, 100.0)  # 5.0 evicted
+    assert clock.offset == 2.0
+    clock.update(106.0, 100.0)  # 2.0 evicted
+    assert clock.offset == 3.0
+    assert ClockOffsetEstimator(offset=0.25).update(10.0, 1.0) == 0.25
+
+
+def test_client_records_stages_per_room():
+    feed = SyntheticFeed(seed=7)
+    client = AxiomTradeWebSocketClient(
+        auth_manager=object(), track_latency=True, conflate_rooms=["sol_price"]
+    )
+
+    async def callback(_data):
+        await asyncio.sleep(0)
+
+    client._callbacks["new_pairs"] = callback
+    client._callbacks["sol_price"] = callback
+
+    async def run():
+        client._start_drain()
+        for _ in range(5):
+            await client._handle_frame(feed.new_pair())
+            await client._handle_frame(feed.sol_price())
+        await asyncio.sleep(0.01)
+        client._stop_drain()
+
+    asyncio.run(run())
+    snapshot = client.latency.snapshot()
+    new_pairs = snapshot["new_pairs"]
+    assert set(new_pairs) == {
+        "network", "decode", "dispatch", "callback", "total", "end_to_end"
+    }
+    assert new_pairs["decode"]["count"] == 5
+    assert "queue" in snapshot["sol_price"]
+    assert "network" not in snapshot["sol_price"]
+    assert client.latency.clock_offset is not None
+    assert "new_pairs" in client.latency.report()
+
+
+def test_latency_disabled_by_default():
+    client = AxiomTradeWebSocketClient(auth_manager=object())
+    assert client.latency is None
+    assert isinstance(LatencyTracker().snapshot(), dict)
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+
+import websockets
+
+from axiomtradeapi import codec
+from axiomtradeapi.models import NewPair, WalletTransaction
+from axiomtradeapi.websocket import AxiomTradeWebSocketClient
+from axiomtradeapi.websocket.local_server import LocalAuthManager, LocalAxiomServer
+from axiomtradeapi.websocket.synthetic import SyntheticFeed, room_kind
+
+
+def test_synthetic_frames_have_room_prefix():
+    feed = SyntheticFeed(seed=1)
+    for room in ("new_pairs", "update_pulse_v2", "sol_price", "v:abc", "TokenMint"):
+        frame = feed.frame_for(room, now=1700000000.0)
+        assert codec.peek_room(frame) == room
+    assert room_kind("v:abc") == "wallet"
+    assert room_kind("TokenMint") == "token_price"
+    assert SyntheticFeed(seed=1).new_pair(1.0) == SyntheticFeed(seed=1).new_pair(1.0)
+
+
+def test_client_receives_from_local_server():
+    async def run():
+        events = []
+        server = LocalAxiomServer(rates={"new_pairs": 500, "wallet": 500}, seed=3)
+        async with server:
+            client = AxiomTradeWebSocketClient(
+                auth_manager=LocalAuthManager(), log_level=logging.WARNING, raw_events=False
+            )
+            client.ws_url = server.url
+
+            async def on_pair(data):
+                events.append(data["content"])
+
+            async def on_wallet(transaction):
+                events.append(transaction)
+
+            assert await client.subscribe_new_tokens(on_pair)
+            assert await client.subscribe_wallet_transactions("abc", on_wallet)
+            handler = asyncio.ensure_future(client.start())
+            for _ in range(200):
+                await asyncio.sleep(0.01)
+                kinds = {type(event) for event in events}
+                if {NewPair, WalletTransaction} <= kinds:
+                    break
+            handler.cancel()
+            await client.close()
+        return events, server.stats
+
+    events, stats = asyncio.run(run())
+    assert {type(event) for event in events} >= {NewPair, WalletTransaction}
+    assert stats["joins"] == 3
+    assert stats["frames_sent"] >= len(events)
+
+
+def test_leave_and_injected_disconnect():
+    async def run():
+        async with LocalAxiomServer(rates={"sol_price": 1000}) as server:
+            ws = await websockets.connect(server.url)
+            await ws.send(codec.dumps({"action": "join", "room": "sol_price"}))
+            assert codec.peek_room(await ws.recv()) == "sol_price"
+            await ws.send(codec.dumps({"action": "leave", "room": "sol_price"}))
+            await asyncio.sleep(0.05)
+            assert "sol_price" not in server._streams
+
+            await ws.send(codec.dumps({"action": "join", "room": "sol_price"}))
+            await ws.recv()
+            assert server.drop_connections() == 1
+            try:
+                while True:
+                    await asyncio.wait_for(ws.recv(), 1)
+            except websockets.exceptions.ConnectionClosed:
+                return True
+
+    assert asyncio.run(run())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the typed response models
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from axiomtradeapi import models
+
+
+WALLET_TX = {
+    "created_at": "2025-07-01T12:00:00.123Z",
+    "maker_address": "Maker111",
+    "price_sol": 2.5e-07,
+    "signature": "Sig111",
+    "total_sol": 1.25,
+    "type": "buy",
+    "pair_address": "Pair111",
+    "pair": {
+        "tokenAddress": "Token111",
+        "tokenTicker": "TKN",
+        "protocolDetails": {"pairSolAccount": "SolAcc", "isTokenSideX": True},
+        "pairCreatedAt": "2025-07-01T11:59:00Z",
+    },
+    "unmapped": [1, 2],
+}
+
+
+def test_wallet_transaction_attributes_and_lazy_nesting():
+    tx = models.WalletTransaction.from_dict(WALLET_TX)
+    assert tx.signature == "Sig111"
+    assert tx.is_buy
+    assert tx.created_at == datetime(2025, 7, 1, 12, 0, 0, 123000, tzinfo=timezone.utc)
+    # Nested objects stay raw until read, then are cached
+    assert type(tx._pair) is dict
+    assert tx.pair.protocol_details.pair_sol_account == "SolAcc"
+    assert tx.pair is tx.pair
+    assert tx.pair.pair_created_at.minute == 59
+
+
+def test_models_keep_dict_compatibility():
+    tx = models.WalletTransaction.from_dict(WALLET_TX)
+    assert tx["type"] == "buy"
+    assert tx.get("created_at") == "2025-07-01T12:00:00.123Z"
+    assert tx.get("pair").get("tokenTicker") == "TKN"
+    assert tx["unmapped"] == [1, 2]
+    assert "liquidity_sol" not in tx
+    assert tx.get("liquidity_sol", "n/a") == "n/a"
+    with pytest.raises(KeyError):
+        tx["liquidity_sol"]
+    assert tx.to_dict() == WALLET_TX
+    assert dict(tx) == WALLET_TX
+
+
+def test_decode_lists_and_raw_opt_out():
+    holders = models.decode(models.Holder, [{"walletAddress": "A"}, {"walletAddress": "B"}])
+    assert [h.wallet_address for h in holders] == ["A", "B"]
+    raw = {"pairAddress": "P"}
+    assert models.decode(models.PairInfo, raw, raw=True) is raw
+
+
+def test_client_returns_plain_json_unless_models_requested(tmp_path):
+    from axiomtradeapi.client import AxiomTradeClient
+
+    class Response:
+        content = b'[[1000, 1, 2, 0.5, 1.5, 10]]'
+        text = content.decode()
+
+        def json(self):
+            return [[1000, 1, 2, 0.5, 1.5, 10]]
+
+    client = AxiomTradeClient(storage_dir=str(tmp_path), use_saved_tokens=False)
+    assert client._decode_response(Response(), models.PairChart) == [[1000, 1, 2, 0.5, 1.5, 10]]
+
+    client.raw_responses = False
+    bars = client._decode_response(Response(), models.PairChart)
+    assert isinstance(bars, list) and bars[0].close == 1.5
+
+
+def test_chart_bars_from_arrays_and_objects():
+    chart = models.PairChart.from_wire({"bars": [[1000, 1, 2, 0.5, 1.5, 10]]})
+    bar = chart.bars[0]
+    assert (bar.open, bar.close, bar[5]) == (1, 1.5, 10)
+    assert models.ChartBar.from_wire({"t": 1000, "o": 1, "h": 2, "l": 0.5, "c": 1.5, "v": 10}) == bar
+    # List-shaped chart responses stay lists
+    assert models.PairChart.from_wire([[1000, 1, 2, 0.5, 1.5, 10]]) == [bar]
+
+
+def test_parse_timestamp_variants():
+    assert models.parse_timestamp(None) is None
+    assert models.parse_timestamp("garbage") is None
+    assert models.parse_timestamp(1_700_000_000_000) == models.parse_timestamp(1_700_000_000)
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+
+import pytest
+
+from axiomtradeapi.websocket import AxiomTradeWebSocketClient, PROFILES, install_uvloop
+from axiomtradeapi.websocket import _client, profiles
+from axiomtradeapi.websocket.local_server import LocalAuthManager, LocalAxiomServer
+from axiomtradeapi.websocket.profiles import ConnectionProfile, get_profile
+
+
+def test_get_profile_resolves_names_and_instances():
+    custom = ConnectionProfile(compression=None)
+    assert get_profile(None) is PROFILES["default"]
+    assert get_profile("low_latency") is PROFILES["low_latency"]
+    assert get_profile(custom) is custom
+    with pytest.raises(ValueError):
+        get_profile("fastest")
+
+
+def test_connect_kwargs_excludes_loop_choice():
+    kwargs = PROFILES["low_latency"].connect_kwargs()
+    assert "uvloop" not in kwargs
+    assert kwargs["compression"] is None
+    assert kwargs["read_limit"] == 2 ** 20
+    assert PROFILES["default"].with_options(max_queue=None).connect_kwargs()["max_queue"] is None
+
+
+def test_install_uvloop_without_uvloop(monkeypatch):
+    monkeypatch.setattr(profiles, "UVLOOP_AVAILABLE", False)
+    assert install_uvloop() is False
+
+
+def test_client_leaves_loop_policy_alone_and_warns_once(monkeypatch, caplog):
+    monkeypatch.setattr(_client, "UVLOOP_AVAILABLE", True)
+    monkeypatch.setattr(_client, "running_uvloop", lambda: False)
+    policy = asyncio.get_event_loop_policy()
+    client = AxiomTradeWebSocketClient(
+        LocalAuthManager(), log_level=logging.WARNING, profile="low_latency"
+    )
+    assert asyncio.get_event_loop_policy() is policy
+    with caplog.at_level(logging.WARNING, logger=client.logger.name):
+        client._check_event_loop()
+        client._check_event_loop()
+    assert sum("uvloop" in record.getMessage() for record in caplog.records) == 1
+
+
+def test_client_streams_with_uncompressed_profile():
+    async def run():
+        async with LocalAxiomServer(rates={"new_pairs": 200}) as server:
+            client = AxiomTradeWebSocketClient(
+                LocalAuthManager(),
+                log_level=logging.WARNING,
+                profile=PROFILES["low_latency"].with_options(uvloop=False),
+            )
+            client.ws_url = server.url
+            events = []
+
+            async def on_pair(data):
+                events.append(data)
+
+            await client.subscribe_new_tokens(on_pair)
+            runner = asyncio.ensure_future(client.start())
+            await asyncio.sleep(0.2)
+            extensions = client.ws.response_headers.get("Sec-WebSocket-Extensions")
+            await client.close()
+            runner.cancel()
+            return events, extensions
+
+    events, extensions = asyncio.run(run())
+    assert events
+    assert not extensions
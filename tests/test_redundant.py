@@ -0,0 +1,79 @@
+import asyncio
+import logging
+
+from axiomtradeapi.websocket import AxiomTradeWebSocketClient, DedupWindow, RedundantWebSocketClient
+from axiomtradeapi.websocket.local_server import LocalAuthManager, LocalAxiomServer
+
+
+def test_dedup_window_is_bounded():
+    window = DedupWindow(size=2)
+    assert window.first("a")
+    assert not window.first("a")
+    assert window.first("b")
+    assert window.first("c")  # evicts "a"
+    assert len(window) == 2
+    assert window.first("a")
+
+
+def test_shared_dedup_keys_on_signature_not_frame():
+    async def run():
+        client = AxiomTradeWebSocketClient(LocalAuthManager(), log_level=logging.WARNING)
+        client.dedup = DedupWindow()
+        prices, trades = [], []
+
+        async def on_price(data):
+            prices.append(data)
+
+        async def on_trade(data):
+            trades.append(data["signature"])
+
+        client._callbacks["sol_price"] = on_price
+        client._callbacks["wallet_transactions_W"] = on_trade
+        for _ in range(3):
+            await client._handle_frame('{"room":"sol_price","content":150.5}')
+        trade = '{"room":"v:W","content":{"signature":"S1","type":"buy"}}'
+        await client._handle_frame(trade)
+        await client._handle_frame(trade.replace('"buy"', '"buy" '))
+        return prices, trades, client.frame_stats["duplicates"]
+
+    prices, trades, duplicates = asyncio.run(run())
+    assert len(prices) == 3
+    assert trades == ["S1"]
+    assert duplicates == 1
+
+
+def test_redundant_legs_deliver_each_event_once_and_survive_failover():
+    async def run():
+        primary = LocalAxiomServer(rates={"new_pairs": 200}, seed=5)
+        standby = LocalAxiomServer(rates={"new_pairs": 200}, seed=5)
+        async with primary, standby:
+            client = RedundantWebSocketClient(
+                LocalAuthManager(),
+                urls=[primary.url, standby.url],
+                log_level=logging.WARNING,
+                reconnect_delay=0.05,
+            )
+            delivered = []
+
+            async def on_pair(data):
+                delivered.append(data["content"]["pair_address"])
+
+            await client.subscribe_new_tokens(on_pair)
+            runner = asyncio.ensure_future(client.start())
+            await asyncio.sleep(0.3)
+
+            primary.drop_connections()
+            before = len(delivered)
+            await asyncio.sleep(0.2)
+            after_failover = len(delivered) - before
+            await asyncio.sleep(0.3)
+
+            await client.close()
+            runner.cancel()
+            return delivered, after_failover, client.stats
+
+    delivered, after_failover, stats = asyncio.run(run())
+    assert len(delivered) == len(set(delivered)) > 0
+    assert after_failover > 0
+    assert sum(leg["duplicates"] for leg in stats.values()) > 0
+    assert sum(leg["reconnects"] for leg in stats.values()) >= 1
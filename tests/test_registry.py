@@ -0,0 +1,90 @@
+from axiomtradeapi.analytics import TokenRegistry
+from axiomtradeapi.models import NewPair, PairInfo, PairStats, WalletTransaction
+
+NEW_PAIR = {
+    "pair_address": "pair1",
+    "token_address": "token1",
+    "deployer_address": "dev1",
+    "token_name": "Green",
+    "token_ticker": "GREEN",
+    "top_10_holders": 35.5,
+    "created_at": "2024-01-01T00:00:00Z",
+}
+
+
+def test_partial_updates_merge_into_one_record():
+    registry = TokenRegistry()
+    record = registry.on_new_pair(NewPair.from_dict(NEW_PAIR))
+    registry.update(PairStats.from_dict({"pairAddress": "pair1", "buyCount": 10, "sellCount": 4}))
+    registry.update({"numHolders": 120, "devHoldsPercent": 2.5, "dexPaid": True}, pair_address="pair1")
+    registry.update(PairInfo.from_dict({"pairAddress": "pair1", "tokenTicker": None, "twitter": "x.com/green"}))
+
+    assert registry.get("token1") is record
+    assert registry.by_pair("pair1") is record
+    assert (record.buy_count, record.sell_count, record.holders) == (10, 4, 120)
+    assert (record.dev_holds_percent, record.dex_paid, record.top10_holders) == (2.5, True, 35.5)
+    assert record.token_ticker == "GREEN"  # None never overwrites
+    assert record.twitter == "x.com/green"
+    assert registry.by_deployer("dev1") == [record]
+    assert registry.by_ticker("green") == [record]
+    assert registry.update({"buyCount": 1}) is None  # no address
+    assert registry.on_new_pair({"room": "update_pulse_v2", "content": [1, 2]}) is None
+    assert registry.on_new_pair({"room": "new_pairs", "content": NewPair.from_dict(NEW_PAIR)}) is record
+    assert len(registry) == 1
+
+
+def test_wallet_events_and_records_known_by_pair_then_token():
+    registry = TokenRegistry()
+    stats = registry.update({"pairAddress": "pair2", "buyCount": 3})
+    registry.update({"tokenAddress": "token2", "tokenTicker": "CAT", "deployerAddress": "dev2"})
+    assert len(registry) == 2
+
+    event = WalletTransaction.from_dict({
+        "pair_address": "pair2",
+        "price_usd": 0.5,
+        "liquidity_sol": 80.0,
+        "created_at": "2024-01-01T00:01:00Z",
+        "pair": {"tokenAddress": "token2", "tokenTicker": "CAT", "protocol": "Pump V1"},
+    })
+    record = registry.on_transaction(event)
+    registry.on_transaction({"pair_address": "pair2", "price_usd": 0.6})
+
+    assert len(registry) == 1
+    assert registry.stats["merged"] == 1
+    assert record is stats
+    assert registry.get("token2") is record
+    assert (record.buy_count, record.deployer_address, record.protocol) == (3, "dev2", "Pump V1")
+    assert (record.price_usd, record.last_trade_at, record.trades) == (0.6, "2024-01-01T00:01:00Z", 2)
+    assert registry.by_ticker("cat") == [record]
+
+
+def test_reindex_and_remove():
+    registry = TokenRegistry()
+    record = registry.update(NEW_PAIR)
+    registry.update({"token_ticker": "GRN"}, token_address="token1")
+    assert registry.by_ticker("GREEN") == []
+    assert registry.by_ticker("grn") == [record]
+
+    assert registry.remove("pair1")
+    assert "token1" not in registry
+    assert registry.by_deployer("dev1") == []
+    assert not registry.remove("pair1")
+
+
+def test_lru_and_ttl_eviction():
+    now = [0.0]
+    registry = TokenRegistry(max_tokens=2, ttl=10, clock=lambda: now[0])
+    registry.update({"token_address": "a"})
+    registry.update({"token_address": "b"})
+    registry.get("a")  # b is now the least recently touched
+    registry.update({"token_address": "c"})
+    assert "b" not in registry
+    assert [r.token_address for r in registry.records()] == ["a", "c"]
+    assert registry.stats["evicted"] == 1
+
+    now[0] = 5.0
+    registry.get("c")
+    now[0] = 12.0
+    assert registry.expire() == 1
+    assert [r.token_address for r in registry.records()] == ["c"]
+    assert registry.update_many([{"token_address": "d"}, {"price_usd": 1.0}]) == 1
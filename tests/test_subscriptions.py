@@ -0,0 +1,131 @@
+import asyncio
+import logging
+
+from axiomtradeapi import codec
+from axiomtradeapi.websocket import AxiomTradeWebSocketClient
+from axiomtradeapi.websocket.local_server import LocalAuthManager, LocalAxiomServer
+
+
+class RecordingSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(codec.loads(message))
+
+
+def make_client(**kwargs):
+    client = AxiomTradeWebSocketClient(
+        LocalAuthManager(), log_level=logging.WARNING, **kwargs
+    )
+    client.ws = RecordingSocket()
+    return client
+
+
+def test_refcounted_rooms_leave_on_last_consumer():
+    async def first(_):
+        pass
+
+    async def second(_):
+        pass
+
+    async def run():
+        client = make_client()
+        assert await client.subscribe_token_price("TOKEN", first)
+        assert await client.subscribe_token_price("TOKEN", second)
+        assert await client.subscribe_token_price("TOKEN", second)  # idempotent
+        assert client.subscriptions == {"TOKEN": 2}
+
+        assert await client.unsubscribe_token_price("TOKEN", first)
+        assert client._callbacks["token_price_TOKEN"] is second
+        assert client.joined_rooms == ["TOKEN"]
+
+        assert await client.unsubscribe_token_price("TOKEN", second)
+        assert not await client.unsubscribe_token_price("TOKEN", second)
+        return client
+
+    client = asyncio.run(run())
+    assert client.subscriptions == {}
+    assert client._callbacks == {}
+    assert client.joined_rooms == []
+    assert client.ws.sent == [
+        {"action": "join", "room": "TOKEN"},
+        {"action": "leave", "room": "TOKEN"},
+    ]
+
+
+def test_fan_out_and_room_cap():
+    calls = []
+
+    async def first(data):
+        calls.append(("first", data))
+
+    async def second(data):
+        calls.append(("second", data))
+
+    async def run():
+        client = make_client(max_rooms=2)
+        await client.subscribe_token_price("A", first)
+        await client.subscribe_token_price("A", second)
+        await client._handle_frame('{"room":"A","content":{"price":1}}')
+        assert await client.subscribe_sol_price(first)
+        assert not await client.subscribe_token_price("B", first)
+        return client
+
+    client = asyncio.run(run())
+    assert calls == [("first", {"price": 1}), ("second", {"price": 1})]
+    assert set(client.subscriptions) == {"A", "sol_price"}
+
+
+def test_new_tokens_rolls_back_new_pairs_when_pulse_join_fails():
+    class FailingPulseSocket(RecordingSocket):
+        async def send(self, message):
+            if "update_pulse_v2" in message:
+                raise ConnectionError("closed")
+            await super().send(message)
+
+    async def on_token(_):
+        pass
+
+    async def run():
+        client = make_client()
+        client.ws = FailingPulseSocket()
+        assert not await client.subscribe_new_tokens(on_token)
+        return client
+
+    client = asyncio.run(run())
+    assert client.subscriptions == {}
+    assert client.joined_rooms == []
+    assert client._callbacks == {}
+    assert client.ws.sent[-1] == {"action": "leave", "room": "new_pairs"}
+
+
+def test_room_cap_is_bounded_by_default():
+    assert make_client().max_rooms == 1000
+
+def test_unsubscribed_room_stops_traffic_on_server():
+    async def run():
+        async with LocalAxiomServer(rates={"token_price": 200}) as server:
+            client = AxiomTradeWebSocketClient(
+                LocalAuthManager(), log_level=logging.WARNING
+            )
+            client.ws_url = server.url
+            received = []
+
+            async def on_price(data):
+                received.append(data)
+
+            await client.connect()
+            await client.subscribe_token_price("TOKEN", on_price)
+            handler = asyncio.ensure_future(client.start())
+            await asyncio.sleep(0.1)
+            await client.unsubscribe_token_price("TOKEN")
+            await asyncio.sleep(0.05)
+            streams = set(server._streams)
+            handler.cancel()
+            await client.close()
+            return received, streams
+
+    received, streams = asyncio.run(run())
+    assert received
+    assert "TOKEN" not in streams
@@ -0,0 +1,84 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+
+from axiomtradeapi.websocket import ThreadedWebSocketClient
+from axiomtradeapi.websocket.local_server import LocalAuthManager, LocalAxiomServer
+
+
+class ServerThread:
+    """LocalAxiomServer on its own loop, for tests that stay synchronous"""
+
+    def __init__(self, **kwargs):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.server = LocalAxiomServer(**kwargs)
+
+    def __enter__(self):
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self.loop).result(5)
+        return self.server
+
+    def __exit__(self, *exc):
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+        self.loop.close()
+
+
+def make_client(url, **kwargs):
+    feed = ThreadedWebSocketClient(LocalAuthManager(), log_level=logging.WARNING, **kwargs)
+    feed.client.ws_url = url
+    return feed
+
+
+def test_events_are_read_while_main_thread_is_busy():
+    with ServerThread(rates={"new_pairs": 200, "update_pulse_v2": 0, "wallet": 200}) as server:
+        with make_client(server.url) as feed:
+            assert feed.subscribe_new_tokens()
+            assert feed.subscribe_wallet_transactions("walletA")
+            assert feed.start()
+
+            # CPU-bound work on the caller's thread does not stop the reader
+            deadline = time.monotonic() + 0.3
+            while time.monotonic() < deadline:
+                sum(range(1000))
+            assert feed.events_queue.qsize() > 10
+
+            rooms = {feed.get(timeout=1)[0] for _ in range(feed.events_queue.qsize())}
+            assert rooms == {"new_pairs", "v:walletA"}
+            assert feed.running
+
+        assert not feed.running
+        assert all(room in ("new_pairs", "v:walletA") for room, _ in feed.events())
+
+
+def test_sync_callbacks_run_off_the_reader_thread():
+    with ServerThread(rates={"wallet": 200}) as server:
+        threads = set()
+        received = queue.Queue()
+
+        def on_transaction(transaction):
+            threads.add(threading.current_thread().name)
+            received.put(transaction)
+
+        with make_client(server.url) as feed:
+            assert feed.subscribe_wallet_transactions("walletB", on_transaction)
+            feed.start()
+            received.get(timeout=2)
+
+    assert threads and not threads & {"axiom-websocket", threading.main_thread().name}
+
+
+def test_full_queue_drops_oldest_events():
+    with ServerThread(rates={"wallet": 500}) as server:
+        with make_client(server.url, max_events=5) as feed:
+            feed.subscribe_wallet_transactions("walletC")
+            feed.start()
+            time.sleep(0.2)
+            assert feed.events_queue.qsize() == 5
+            assert feed.stats["dropped"] > 0
+            assert feed.unsubscribe_wallet_transactions("walletC")
+            assert feed.client.subscriptions == {}
@@ -0,0 +1,88 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from axiomtradeapi.analytics import TradeBook, TradeRing
+from axiomtradeapi.models import WalletTransaction
+
+T0 = 1_700_000_000_000
+
+
+def test_ring_overwrites_oldest_and_keeps_time_order():
+    ring = TradeRing(capacity=4)
+    for i in range(6):
+        ring.append(T0 + i * 1000, 1.0 + i, 10.0, i % 2 == 0)
+    assert len(ring) == 4
+    assert ring.trades()["time"].tolist() == [T0 + i * 1000 for i in range(2, 6)]
+    assert ring.trades(since=T0 + 3500)["price"].tolist() == [5.0, 6.0]
+
+    ring.append(T0, 9.0, 1.0, True)  # late trade is stored at the newest time
+    assert ring.last_time == T0 + 5000
+    assert ring.totals.count == 7
+    assert ring.totals.volume == 61.0
+
+
+def test_window_aggregates():
+    book = TradeBook(capacity=8)
+    book.add("pair", 1.0, 10.0, True, T0, "alice")
+    book.add("pair", 2.0, 30.0, True, T0 + 20_000, "bob")
+    book.add("pair", 4.0, 20.0, False, T0 + 40_000, "alice")
+    book.add("pair", 3.0, 10.0, True, T0 + 50_000)
+
+    stats = book.window("pair", seconds=30, now=T0 + 50_000)
+    assert (stats.count, stats.buys, stats.sells) == (3, 2, 1)
+    assert stats.volume == 60.0
+    assert stats.buy_sell_ratio == 2.0
+    assert stats.vwap == pytest.approx((2 * 30 + 4 * 20 + 3 * 10) / 60)
+    assert stats.unique_makers == 2
+    assert (stats.first_price, stats.last_price) == (2.0, 3.0)
+
+    everything = book.window("pair")
+    assert everything.count == 4
+    assert everything.unique_makers == 2
+    assert book.window("pair", seconds=1, now=T0 + 100_000).count == 0
+    assert book.window("unknown", seconds=30).count == 0
+
+
+def test_window_spans_wrapped_ring():
+    book = TradeBook(capacity=5)
+    for i in range(12):
+        book.add("pair", float(i), 1.0, i % 3 != 0, T0 + i * 1000, f"maker{i % 4}")
+    ring = book.ring("pair")
+    assert ring.head not in (0, ring.size)  # buffer is split in two segments
+
+    stats = book.window("pair", seconds=3, now=T0 + 11_000)
+    assert stats.count == 4  # trades 8..11
+    assert stats.buys == 3
+    assert stats.unique_makers == 4
+    assert book.totals("pair").count == 12
+    assert book.totals("pair").first_time == T0
+
+
+def test_wallet_events_dedup_and_pair_eviction():
+    book = TradeBook(capacity=16, max_pairs=2, currency="SOL")
+    event = {
+        "pair_address": "a",
+        "created_at": "2023-11-14T22:13:20.000Z",
+        "price_sol": 0.002,
+        "total_sol": 1.5,
+        "token_amount": 750.0,
+        "type": "buy",
+        "maker_address": "maker",
+        "signature": "sig1",
+    }
+    assert book.on_transaction(event)
+    assert not book.on_transaction(WalletTransaction.from_dict(event))  # same trade from another room
+    assert book.on_transaction(dict(event, pair_address=None, signature="sig2", type="sell"), pair_address="a")
+    assert not book.on_transaction({"pair_address": "a"})
+    assert book.stats == {"trades": 2, "duplicates": 1, "skipped": 1, "evicted": 0}
+
+    trades = book.ring("a").trades()
+    assert trades["time"].tolist() == [T0, T0]
+    assert trades["amount"].tolist() == [750.0, 750.0]
+    assert book.window("a").buy_sell_ratio == 1.0
+
+    book.add("b", 1.0, 1.0, True, T0)
+    book.add("c", 1.0, 1.0, True, T0)
+    assert book.pairs() == ["b", "c"]
+    assert book.nbytes == 2 * book.ring("b").data.nbytes
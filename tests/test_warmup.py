@@ -0,0 +1,67 @@
+import asyncio
+import logging
+
+from axiomtradeapi.websocket import AxiomTradeWebSocketClient, warm_up_feeds
+from axiomtradeapi.websocket.local_server import LocalAuthManager, LocalAxiomServer
+
+
+def make_client(url):
+    client = AxiomTradeWebSocketClient(LocalAuthManager(), log_level=logging.WARNING)
+    client.ws_url = url
+    return client
+
+
+def test_warm_up_feeds_reports_first_event_per_room():
+    async def run():
+        rates = {"new_pairs": 200, "wallet": 200, "sol_price": 0}
+        async with LocalAxiomServer(rates=rates) as main, LocalAxiomServer(rates=rates) as other:
+            events = []
+
+            async def on_event(data):
+                events.append(data)
+
+            first = make_client(main.url)
+            second = make_client(other.url)
+            report = await warm_up_feeds(
+                [
+                    (first, {"new_pairs": on_event, "v:wallet": on_event}, "main"),
+                    (second, {"new_pairs": on_event, "sol_price": on_event}, "main"),
+                ],
+                timeout=0.3,
+            )
+            joined = first.joined_rooms
+            await first.close()
+            await second.close()
+            return report, events, joined
+
+    report, events, joined = asyncio.run(run())
+    # The same room on two sockets is reported for each of them
+    assert report.first_event[(0, "new_pairs")] is not None
+    assert report.first_event[(1, "new_pairs")] is not None
+    assert report.first_event[(0, "v:wallet")] is not None
+    assert report.pending == [(1, "sol_price")]  # rate 0: never streams
+    assert not report.ok
+    assert events
+    assert joined == ["new_pairs", "v:wallet"]
+
+
+def test_start_after_warm_up_reuses_background_handler():
+    async def run():
+        async with LocalAxiomServer(rates={"new_pairs": 200}) as server:
+            client = make_client(server.url)
+            events = []
+
+            async def on_pair(data):
+                events.append(data)
+
+            await client.warm_up({"new_pairs": on_pair}, timeout=1.0)
+            runner = asyncio.ensure_future(client.start())
+            await asyncio.sleep(0.1)
+            count = len(events)
+            await client.close()
+            await asyncio.sleep(0)
+            return count, runner
+
+    count, runner = asyncio.run(run())
+    assert count > 1
+    assert runner.done()
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import threading
+import time
+
+from axiomtradeapi.websocket import AxiomTradeWebSocketClient, LoopWatchdog
+
+
+class RecordingSocket:
+    async def send(self, message):
+        pass
+
+
+def make_client(watchdog):
+    client = AxiomTradeWebSocketClient(
+        object(), log_level=logging.WARNING, watchdog=watchdog
+    )
+    client.ws = RecordingSocket()
+    return client
+
+
+def test_stall_is_attributed_to_blocking_callback_and_offloaded():
+    watchdog = LoopWatchdog(
+        interval=0.01,
+        stall_threshold=0.05,
+        offload_after=2,
+        logger=logging.getLogger("test-watchdog"),
+    )
+    client = make_client(watchdog)
+    threads = []
+
+    async def blocking_callback(data):
+        threads.append(threading.current_thread())
+        time.sleep(0.2)  # synchronous work inside the callback
+
+    async def run():
+        await client.subscribe_token_price("TOKEN", blocking_callback)
+        watchdog.start()
+        try:
+            for _ in range(3):
+                await client._handle_frame('{"room":"TOKEN","content":{"price":1}}')
+                await asyncio.sleep(0.05)
+        finally:
+            watchdog.stop()
+
+    asyncio.run(run())
+
+    assert len(watchdog.stalls) == 2
+    stall = watchdog.stalls[0]
+    assert stall.callback.endswith("blocking_callback")
+    assert stall.room == "TOKEN"
+    assert "blocking_callback" in stall.stack
+    assert blocking_callback in watchdog.offloaded
+    # The third call ran on the thread pool, not on the loop thread
+    assert threads[0] is threads[1] is not threads[2]
+    assert watchdog.stats()["lag"]["max_ms"] >= 150
+
+
+def test_offloading_blames_the_consumer_not_the_room_fan_out():
+    watchdog = LoopWatchdog(interval=0.01, stall_threshold=0.05, offload_after=1)
+    client = make_client(watchdog)
+    seen = []
+
+    async def blocking_consumer(data):
+        time.sleep(0.15)
+
+    def sync_consumer(data):
+        seen.append(data["price"])
+
+    async def run():
+        await client.subscribe_token_price("r", blocking_consumer)
+        await client.subscribe_token_price("r", sync_consumer)
+        watchdog.start()
+        try:
+            for price in range(3):
+                await client._handle_frame('{"room":"r","content":{"price":%d}}' % price)
+                await asyncio.sleep(0.05)
+            await client.sync_runner.drain()
+        finally:
+            watchdog.stop()
+            client.sync_runner.shutdown()
+
+    asyncio.run(run())
+    assert watchdog.offloaded == {blocking_consumer}
+    assert seen == [0, 1, 2]
+    assert client.sync_runner.stats["completed"] == 3
+    assert not client.sync_runner._queues
+
+
+def test_lag_is_measured_without_stalls():
+    watchdog = LoopWatchdog(interval=0.005)
+
+    async def run():
+        watchdog.start()
+        await asyncio.sleep(0.1)
+        watchdog.stop()
+
+    asyncio.run(run())
+    assert watchdog.lag.count > 5
+    assert not watchdog.stalls
+    assert not watchdog.running